@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# Atlas tekstur: wszystkie kafelki (np. 256x256 z tekstury/) sklejone w jedną
+# lub kilka dużych tekstur, z opisem prostokątów UV każdego kafelka.
+# Zmiana tekstury to wtedy tylko przestawienie macierzy tekstury (a w
+# shaderze - uniformu z prostokątem), bez glBindTexture.
+#
+# Użycie offline: python3 atlas.py KATALOG [plik.tga ...]
+# zapisuje strony atlasu (atlas_0.tga, ...) i opis atlas.json do KATALOG.
+import os
+import sys
+import glob
+import json
+import math
+import numpy as np
+from PIL import Image
+
+from OpenGL.GL import *
+
+from tekstury_gl import wczytaj_piksele, utworz_teksture
+
+# Maksymalny bok strony atlasu i margines wokół kafelka. Margines jest
+# wypełniony powtórzeniem brzegu kafelka, żeby filtrowanie (i mipmapy)
+# na krawędzi nie łapało pikseli sąsiada.
+MAKS_ROZMIAR = 4096
+MARGINES = 4
+
+
+def _potega_dwojki(n):
+    return 1 << max(0, math.ceil(math.log2(max(1, n))))
+
+
+def zbuduj_atlas(pliki, maks_rozmiar=MAKS_ROZMIAR, margines=MARGINES):
+    # Zwraca (strony, opis): strony to tablice pikseli w kolejności wierszy GL
+    # (jak wczytaj_piksele), opis to lista słowników z plikiem, numerem strony
+    # i prostokątem UV (u0, v0, u1, v1) - w kolejności z listy pliki. Plików,
+    # których nie da się wczytać, nie ma w opisie (indeksy idą po kolei).
+    kafelki, wczytane = [], []
+    for plik in pliki:
+        try:
+            kafelki.append(wczytaj_piksele(plik))
+            wczytane.append(plik)
+        except IOError:
+            print(f"Błąd: Nie można otworzyć pliku {plik}. Pomijam.")
+    if not kafelki:
+        return [], []
+    pliki = wczytane
+
+    rozmiary = [(k.shape[1] + 2 * margines, k.shape[0] + 2 * margines) for k in kafelki]
+
+    pole = sum(w * h for w, h in rozmiary)
+    szerokosc = min(maks_rozmiar, max(_potega_dwojki(math.isqrt(pole)),
+                                      _potega_dwojki(max(w for w, _ in rozmiary))))
+
+    # Pakowanie na półki: od najwyższych kafelków, wiersz po wierszu
+    umieszczenia = [None] * len(kafelki)
+    wysokosci_stron = [0]
+    strona, x, y, wysokosc_polki = 0, 0, 0, 0
+    for i in sorted(range(len(kafelki)), key=lambda i: -rozmiary[i][1]):
+        w, h = rozmiary[i]
+        if x + w > szerokosc:
+            x, y, wysokosc_polki = 0, y + wysokosc_polki, 0
+        if y + h > maks_rozmiar:
+            strona, x, y, wysokosc_polki = strona + 1, 0, 0, 0
+            wysokosci_stron.append(0)
+        umieszczenia[i] = (strona, x, y)
+        x += w
+        wysokosc_polki = max(wysokosc_polki, h)
+        wysokosci_stron[strona] = max(wysokosci_stron[strona], y + h)
+
+    strony = [np.zeros((_potega_dwojki(h), szerokosc, 3), dtype=np.uint8) for h in wysokosci_stron]
+    opis = []
+    for plik, kafel, (strona, x, y) in zip(pliki, kafelki, umieszczenia):
+        h, w = kafel.shape[:2]
+        obraz = strony[strona]
+        obraz[y:y + h + 2 * margines, x:x + w + 2 * margines] = np.pad(
+            kafel, ((margines, margines), (margines, margines), (0, 0)), mode="edge")
+
+        wysokosc_strony, szerokosc_strony = obraz.shape[:2]
+        opis.append({
+            "plik": plik,
+            "strona": strona,
+            "u0": (x + margines) / szerokosc_strony,
+            "v0": (y + margines) / wysokosc_strony,
+            "u1": (x + margines + w) / szerokosc_strony,
+            "v1": (y + margines + h) / wysokosc_strony,
+        })
+
+    return strony, opis
+
+
+def zapisz_atlas(katalog, strony, opis):
+    os.makedirs(katalog, exist_ok=True)
+    for numer, obraz in enumerate(strony):
+        # Na dysku obrazek ma normalną orientację (wczytaj_piksele go odwróci)
+        Image.fromarray(obraz[::-1]).save(os.path.join(katalog, f"atlas_{numer}.tga"))
+    with open(os.path.join(katalog, "atlas.json"), "w", encoding="utf-8") as f:
+        json.dump({"strony": len(strony), "kafelki": opis}, f, indent=2)
+
+
+def wczytaj_atlas(katalog):
+    with open(os.path.join(katalog, "atlas.json"), encoding="utf-8") as f:
+        dane = json.load(f)
+    strony = [wczytaj_piksele(os.path.join(katalog, f"atlas_{numer}.tga"))
+              for numer in range(dane["strony"])]
+    return strony, dane["kafelki"]
+
+
+class AtlasTekstur:
+    # Atlas w GL. Ma ten sam interfejs co tekstury_gl.MenedzerTekstur
+    # (podepnij, po_klatce, usun, len), więc skrypty mogą użyć jednego
+    # albo drugiego. podepnij() przestawia macierz tekstury GL_TEXTURE tak,
+    # żeby współrzędne 0-1 trafiały w prostokąt kafelka; glBindTexture
+    # jest potrzebne tylko przy przejściu na inną stronę atlasu.
+
+    def __init__(self, strony, opis, mipmapy=None):
+        self.opis = opis
+        self.pliki = [kafel["plik"] for kafel in opis]
+        self.texture_ids = []
+        for obraz in strony:
+            texture_id = utworz_teksture(obraz, mipmapy=mipmapy)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+            self.texture_ids.append(texture_id)
+        self.aktywna_strona = None
+
+    def __len__(self):
+        return len(self.opis)
+
+    def prostokat(self, indeks):
+        # (u0, v0, szerokość, wysokość) kafelka - np. do uniformu w shaderze
+        kafel = self.opis[indeks]
+        return kafel["u0"], kafel["v0"], kafel["u1"] - kafel["u0"], kafel["v1"] - kafel["v0"]
+
+    def podepnij(self, indeks):
+        strona = self.opis[indeks]["strona"]
+        if strona != self.aktywna_strona:
+            glBindTexture(GL_TEXTURE_2D, self.texture_ids[strona])
+            self.aktywna_strona = strona
+
+        u0, v0, du, dv = self.prostokat(indeks)
+        glMatrixMode(GL_TEXTURE)
+        glLoadIdentity()
+        glTranslatef(u0, v0, 0.0)
+        glScalef(du, dv, 1.0)
+        glMatrixMode(GL_MODELVIEW)
+
+    def po_klatce(self):
+        pass
+
+    def usun(self):
+        glDeleteTextures(self.texture_ids)
+        self.texture_ids = []
+        self.aktywna_strona = None
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Użycie: python3 atlas.py KATALOG [plik.tga ...]")
+        sys.exit(-1)
+
+    katalog = sys.argv[1]
+    pliki = sys.argv[2:] or sorted(glob.glob("tekstury/*.tga"))
+    strony, opis = zbuduj_atlas(pliki)
+    zapisz_atlas(katalog, strony, opis)
+    print(f"Atlas: {len(opis)} kafelków na {len(strony)} stronach "
+          f"({', '.join(f'{s.shape[1]}x{s.shape[0]}' for s in strony)}) -> {katalog}")
+
+
+if __name__ == '__main__':
+    main()
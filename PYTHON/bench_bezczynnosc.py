@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# Zużycie procesora przez bezczynne okno: każdy skrypt uruchamiany jest
+# jako osobny proces - raz z ciągłym rysowaniem (render + swap co
+# odświeżenie ekranu), raz z --na-zadanie (odswiezanie.py) - i przez
+# zadany czas nikt go nie dotyka. Mierzymy czas procesora procesu
+# (utime + stime z /proc) po rozgrzewce. Potrzebny jest serwer X / Wayland,
+# bo liczy się prawdziwa pętla zdarzeń GLFW.
+#
+# Użycie: python3 bench_bezczynnosc.py [--czas 10] [--rozgrzewka 3] [skrypt.py ...]
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+KATALOG = os.path.dirname(os.path.abspath(__file__))
+TAKTY = os.sysconf("SC_CLK_TCK")
+
+
+def czas_procesora(pid):
+    # utime i stime to pola 14 i 15 /proc/PID/stat (nazwa procesu może mieć spacje)
+    with open(f"/proc/{pid}/stat") as f:
+        pola = f.read().rsplit(")", 1)[1].split()
+    return (int(pola[11]) + int(pola[12])) / TAKTY
+
+
+def zmierz(skrypt, opcje, czas, rozgrzewka):
+    proces = subprocess.Popen([sys.executable, skrypt] + opcje, cwd=KATALOG,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    try:
+        # Rozgrzewka: wczytanie tekstur, budowa siatek, pierwsze klatki
+        time.sleep(rozgrzewka)
+        if proces.poll() is not None:
+            raise RuntimeError(proces.stderr.read().decode(errors="replace"))
+        poczatek = czas_procesora(proces.pid)
+        time.sleep(czas)
+        return (czas_procesora(proces.pid) - poczatek) / czas
+    finally:
+        proces.terminate()
+        proces.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Procesor zużywany przez bezczynne okno")
+    parser.add_argument("--czas", type=float, default=10.0, help="sekundy pomiaru")
+    parser.add_argument("--rozgrzewka", type=float, default=3.0)
+    parser.add_argument("skrypty", nargs="*",
+                        default=["lab6.py", "zad3.0.py", "zad3.5.py", "zad4.0.py", "zad4.5.py", "zad5.0.py"])
+    args = parser.parse_args()
+
+    if not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        sys.exit("Brak serwera wyświetlania (DISPLAY / WAYLAND_DISPLAY) - pomiar wymaga okna GLFW")
+
+    print(f"{'skrypt':<10} {'ciągle [% CPU]':>15} {'na żądanie [% CPU]':>19}")
+    for skrypt in args.skrypty:
+        try:
+            ciagle = zmierz(skrypt, [], args.czas, args.rozgrzewka)
+            na_zadanie = zmierz(skrypt, ["--na-zadanie"], args.czas, args.rozgrzewka)
+        except RuntimeError as blad:
+            print(f"{skrypt:<10} - błąd uruchomienia:\n{blad}")
+            continue
+        print(f"{skrypt:<10} {ciagle * 100:>15.1f} {na_zadanie * 100:>19.1f}", flush=True)
+
+
+if __name__ == '__main__':
+    main()
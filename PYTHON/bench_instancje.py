@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Skalowanie rysowania instancjami (tlum.py, instancje.py) od 1 do 100 tys.
+# kopii jajka i ostrosłupa: czas klatki przy stałych danych instancji, przy
+# macierzach liczonych i wysyłanych co klatkę (--ruch) oraz - dla porównania -
+# pętla w Pythonie rysująca obiekty po kolei. Bez okna (bez_okna.py).
+#
+# Użycie: python3 bench_instancje.py [liczba ...]
+import os
+import sys
+
+from bez_okna import ustaw_platforme, utworz_kontekst
+from bench_wspolne import zmierz_klatke
+
+ROZMIAR = 600
+
+# Pętla po obiektach to kilkanaście wywołań GL na kopię - mierzymy ją tylko do tej liczby
+MAKS_PETLA = 1000
+
+# Każdy pomiar trwa co najmniej CZAS_POMIARU sekund, ale nie dłużej niż MAKS_KLATEK klatek
+CZAS_POMIARU = 1.0
+MAKS_KLATEK = 100
+
+
+def zmierz(scena):
+    # Co najmniej CZAS_POMIARU sekund, najwyżej MAKS_KLATEK klatek
+    return zmierz_klatke(scena, MAKS_KLATEK, rozgrzewka=1, czas=CZAS_POMIARU)
+
+
+def main():
+    liczby = [int(a) for a in sys.argv[1:]] or [1, 10, 100, 1000, 10000, 100000]
+
+    ustaw_platforme("egl")
+    from OpenGL.GL import glGetString, GL_RENDERER
+    from bench_wspolne import wczytaj_scene
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.argv = ["tlum.py"]
+    kontekst = utworz_kontekst("egl", ROZMIAR, ROZMIAR)
+    print(f"GL_RENDERER: {glGetString(GL_RENDERER).decode()}")
+
+    scena = wczytaj_scene("tlum.py")
+    scena.startup()
+    scena.update_viewport(None, ROZMIAR, ROZMIAR)
+
+    print(f"{'kopie':>7} {'instancje [ms]':>15} {'+ ruch [ms]':>12} {'pętla [ms]':>11} "
+          f"{'przysp.':>8} {'mln kopii/s':>12}")
+    for liczba in liczby:
+        scena.liczba = liczba
+        scena.rozmiesc()
+
+        scena.UZYJ_INSTANCJI, scena.RUCH = True, False
+        t_instancje = zmierz(scena)
+        scena.RUCH = True
+        t_ruch = zmierz(scena)
+        scena.RUCH = False
+
+        wiersz = f"{liczba:>7} {t_instancje * 1000:>15.3f} {t_ruch * 1000:>12.3f}"
+        if liczba <= MAKS_PETLA:
+            scena.UZYJ_INSTANCJI = False
+            t_petla = zmierz(scena)
+            wiersz += f" {t_petla * 1000:>11.3f} {t_petla / t_instancje:>7.1f}x"
+        else:
+            wiersz += f" {'-':>11} {'-':>8}"
+        print(wiersz + f" {liczba / t_instancje / 1e6:>12.2f}", flush=True)
+
+    scena.shutdown()
+    kontekst.usun()
+
+
+if __name__ == '__main__':
+    main()
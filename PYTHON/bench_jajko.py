@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# Porównanie czasu generowania siatki jajka: stara podwójna pętla
+# z zad5.0 kontra wersja z broadcastingiem NumPy (jajko.oblicz_siatke_jajka).
+#
+# Użycie: python3 bench_jajko.py [N ...]
+import sys
+import math
+import time
+import numpy as np
+
+from jajko import oblicz_siatke_jajka
+
+
+def oblicz_punkty_jajka_petla(n):
+    # Kopia pierwotnej implementacji z zad5.0 (punkt odniesienia)
+    vertices = np.zeros((n, n, 3))
+    uv_coords = np.zeros((n, n, 2))
+    u_vals = np.linspace(0.0, 1.0, n)
+    v_vals = np.linspace(0.0, 1.0, n)
+    pi = math.pi
+
+    for i in range(n):
+        for j in range(n):
+            u = u_vals[i]
+            v = v_vals[j]
+
+            u2 = u * u
+            u3 = u2 * u
+            u4 = u3 * u
+            u5 = u4 * u
+
+            poly_u = (-90 * u5 + 225 * u4 - 270 * u3 + 180 * u2 - 45 * u)
+
+            x = poly_u * math.cos(pi * v)
+            z = poly_u * math.sin(pi * v)
+            y = 160 * u4 - 320 * u3 + 160 * u2 - 5.0
+
+            vertices[i][j] = [x, y, z]
+            uv_coords[i][j] = [u, v]
+
+    return vertices, uv_coords
+
+
+def zmierz(funkcja, n, powtorzenia):
+    najlepszy = float("inf")
+    for _ in range(powtorzenia):
+        start = time.perf_counter()
+        wynik = funkcja(n)
+        najlepszy = min(najlepszy, time.perf_counter() - start)
+    return najlepszy, wynik
+
+
+def main():
+    rozmiary = [int(a) for a in sys.argv[1:]] or [50, 100, 250, 500, 1000, 2000]
+
+    print(f"{'N':>6} {'pętla [ms]':>12} {'numpy [ms]':>12} {'przysp.':>9}")
+    for n in rozmiary:
+        # Pętla przy dużym N trwa sekundami, więc mierzymy ją tylko raz
+        t_petla, (ref_poz, ref_uv) = zmierz(oblicz_punkty_jajka_petla, n, 1)
+        t_numpy, (poz, uv) = zmierz(oblicz_siatke_jajka, n, 5)
+
+        # float32 kontra float64 - porównujemy z tolerancją
+        assert np.allclose(poz, ref_poz, atol=1e-4)
+        assert np.allclose(uv, ref_uv, atol=1e-6)
+
+        print(f"{n:>6} {t_petla * 1000:>12.2f} {t_numpy * 1000:>12.2f} {t_petla / t_numpy:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
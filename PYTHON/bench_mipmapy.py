@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# Koszt wypełniania (fill-rate) jajka z teksturą przy różnych odległościach
+# kamery: GL_LINEAR bez mipmap kontra filtrowanie trójliniowe
+# (GL_LINEAR_MIPMAP_LINEAR) z mipmapami z glGenerateMipmap i z NumPy.
+# Bez okna (bez_okna.py).
+#
+# Użycie: python3 bench_mipmapy.py [odległość ...]
+import sys
+import time
+
+# Platformę PyOpenGL trzeba wybrać przed pierwszym importem OpenGL,
+# a JajkoZTekstura korzysta z GL na poziomie modułu
+from bez_okna import ustaw_platforme, utworz_kontekst
+ustaw_platforme("egl")
+
+from OpenGL.GL import *
+from OpenGL.GLU import *
+
+from bench_wspolne import zmierz_klatke
+from bufory import SiatkaVBO
+from jajko import zbuduj_jajko
+from tekstury_gl import wczytaj_piksele, utworz_teksture
+
+KLATKI = 50
+TRYBY = ["0", "gl", "cpu"]
+
+
+class JajkoZTekstura:
+    # Jajko z podpiętą teksturą widziane z odległości `odleglosc` - render()
+    # jak w scenach, do bench_wspolne.zmierz_klatke
+
+    def __init__(self, siatka_vbo):
+        self.siatka_vbo = siatka_vbo
+        self.odleglosc = 10.0
+
+    def render(self, time):
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+        gluLookAt(0.0, 0.0, self.odleglosc, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        self.siatka_vbo.rysuj()
+
+
+def main():
+    odleglosci = [float(a) for a in sys.argv[1:]] or [10.0, 15.0, 30.0, 60.0, 120.0]
+
+    kontekst = utworz_kontekst("egl", 600, 600)
+    print(f"GL_RENDERER: {glGetString(GL_RENDERER).decode()}")
+
+    glViewport(0, 0, 600, 600)
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    gluPerspective(70, 1.0, 0.1, 300.0)
+    glEnable(GL_DEPTH_TEST)
+    glEnable(GL_TEXTURE_2D)
+
+    siatka_vbo = SiatkaVBO(zbuduj_jajko(100))
+    jajko = JajkoZTekstura(siatka_vbo)
+    piksele = wczytaj_piksele("tekstury/P1_t.tga")
+
+    tekstury = {}
+    for tryb in TRYBY:
+        start = time.perf_counter()
+        tekstury[tryb] = utworz_teksture(piksele, powtarzanie=True, mipmapy=tryb)
+        glFinish()
+        print(f"Tworzenie tekstury ({tryb}): {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    print(f"{'odległość':>10}" + "".join(f"{tryb + ' [ms]':>12}" for tryb in TRYBY))
+    for odleglosc in odleglosci:
+        jajko.odleglosc = odleglosc
+        wiersz = f"{odleglosc:>10.1f}"
+        for tryb in TRYBY:
+            glBindTexture(GL_TEXTURE_2D, tekstury[tryb])
+            wiersz += f"{zmierz_klatke(jajko, KLATKI) * 1000:>12.3f}"
+        print(wiersz)
+
+    glDeleteTextures(list(tekstury.values()))
+    siatka_vbo.usun()
+    kontekst.usun()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# Odrzucanie poza bryłą widzenia w tłumie (tlum.py, widocznosc.py): kamera
+# blisko sceny widzi tylko jej część - czas klatki bez odrzucania i z BVH,
+# liczba wysłanych kopii oraz sam czas zapytania do drzewa. Bez okna (bez_okna.py).
+#
+# Użycie: python3 bench_odrzucanie.py [liczba ...]
+import os
+import sys
+import time
+
+from bez_okna import ustaw_platforme, utworz_kontekst
+
+ROZMIAR = 600
+
+# Jak w bench_instancje: co najmniej CZAS_POMIARU sekund, najwyżej MAKS_KLATEK klatek
+CZAS_POMIARU = 1.0
+MAKS_KLATEK = 100
+
+# Kamera nad środkiem sceny (tlum.ROZMIAR_SCENY = 80) - w bryle mieści się ok. 1/10 kopii
+ODLEGLOSC = 20.0
+
+POWTORZENIA_ZAPYTANIA = 50
+
+
+def main():
+    liczby = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000]
+
+    ustaw_platforme("egl")
+    from OpenGL.GL import glGetString, GL_RENDERER
+    from bench_wspolne import wczytaj_scene, zmierz_klatke
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.argv = ["tlum.py"]
+    kontekst = utworz_kontekst("egl", ROZMIAR, ROZMIAR)
+    print(f"GL_RENDERER: {glGetString(GL_RENDERER).decode()}")
+
+    scena = wczytaj_scene("tlum.py")
+    scena.startup()
+    scena.update_viewport(None, ROZMIAR, ROZMIAR)
+    scena.viewer = [0.0, 0.0, ODLEGLOSC]
+
+    print(f"{'kopie':>7} {'wysłane':>8} {'bez odrz. [ms]':>15} {'BVH [ms]':>9} "
+          f"{'przysp.':>8} {'zapytanie [ms]':>15} {'węzły':>6}")
+    for liczba in liczby:
+        scena.liczba = liczba
+        start = time.perf_counter()
+        scena.rozmiesc()
+        t_budowa = time.perf_counter() - start
+
+        scena.UZYJ_ODRZUCANIA = False
+        t_wszystkie = zmierz_klatke(scena, MAKS_KLATEK, rozgrzewka=1, czas=CZAS_POMIARU)
+        scena.UZYJ_ODRZUCANIA = True
+        t_bvh = zmierz_klatke(scena, MAKS_KLATEK, rozgrzewka=1, czas=CZAS_POMIARU)
+
+        scena.ustaw_kamere()
+        plaszczyzny = scena.kamera.plaszczyzny
+        start = time.perf_counter()
+        for _ in range(POWTORZENIA_ZAPYTANIA):
+            widoczne = [drzewo.zapytanie(plaszczyzny) for drzewo in scena.drzewa]
+        t_zapytanie = (time.perf_counter() - start) / POWTORZENIA_ZAPYTANIA
+        wyslane = sum(len(numery) for numery in widoczne)
+        wezly = sum(drzewo.odwiedzone for drzewo in scena.drzewa)
+
+        print(f"{liczba:>7} {wyslane:>8} {t_wszystkie * 1000:>15.3f} {t_bvh * 1000:>9.3f} "
+              f"{t_wszystkie / t_bvh:>7.1f}x {t_zapytanie * 1000:>15.3f} {wezly:>6}"
+              f"   (budowa drzewa {t_budowa * 1000:.0f} ms)", flush=True)
+
+    scena.shutdown()
+    kontekst.usun()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# Porównanie czasu klatki ostrosłupa z zad3.5 / zad4.0 / zad4.5: tryb
+# natychmiastowy (~20 wywołań GL na klatkę) kontra nagrana lista wyświetlania
+# (jedno glCallList). Połowa klatek ze ścianą przednią, połowa bez - lista
+# dla każdego stanu nagrywa się tylko raz. Bez okna (bez_okna.py).
+#
+# Użycie: python3 bench_ostroslup.py [liczba_klatek]
+import os
+import sys
+
+from bez_okna import ustaw_platforme, utworz_kontekst
+
+ROZMIAR = 400
+SKRYPTY = ["zad3.5.py", "zad4.0.py", "zad4.5.py"]
+
+
+def sciana_w_polowie(klatki):
+    # Do zmierz_klatke: ściana przednia tylko w pierwszej połowie klatek
+    def przed_klatka(zad, klatka):
+        zad.show_front_wall = klatka < klatki // 2
+    return przed_klatka
+
+
+def main():
+    klatki = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    ustaw_platforme("egl")
+    from OpenGL.GL import glGetString, GL_RENDERER
+    from bench_wspolne import wczytaj_scene, zmierz_klatke
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    kontekst = utworz_kontekst("egl", ROZMIAR, ROZMIAR)
+    print(f"GL_RENDERER: {glGetString(GL_RENDERER).decode()}")
+
+    print(f"{'skrypt':<12} {'natychm. [ms]':>14} {'lista [ms]':>11} {'przysp.':>9}")
+    for plik in SKRYPTY:
+        sys.argv = [plik]
+        zad = wczytaj_scene(plik)
+        zad.startup()
+        zad.update_viewport(None, ROZMIAR, ROZMIAR)
+
+        zad.UZYJ_LIST = False
+        t_stary = zmierz_klatke(zad, klatki, sciana_w_polowie(klatki))
+        zad.UZYJ_LIST = True
+        t_lista = zmierz_klatke(zad, klatki, sciana_w_polowie(klatki))
+
+        print(f"{plik:<12} {t_stary * 1000:>14.3f} {t_lista * 1000:>11.3f} {t_stary / t_lista:>8.1f}x")
+        zad.shutdown()
+
+    kontekst.usun()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# Przełączanie dużych tekstur klawiszem T w zad5.0 (MenedzerTekstur): czasy
+# klatek, gdy następna tekstura idzie do GL jednym glTexImage2D po klatce,
+# i gdy idzie porcjami przez bufory PBO (PrzesylaniePBO, TEKSTURY_PBO).
+# Drugi pomiar to start z --od-razu: cały zestaw wczytywany przez
+# LadowarkaTekstur - czasy klatek do chwili, gdy wszystkie tekstury są w GL.
+# Tekstury to losowe TGA w katalogu tymczasowym. Bez okna (bez_okna.py).
+#
+# Użycie: python3 bench_pbo.py [rozmiar ...]
+import io
+import os
+import sys
+import time
+import contextlib
+import tempfile
+import numpy as np
+from PIL import Image
+
+from bez_okna import ustaw_platforme, utworz_kontekst
+
+ROZMIAR = 600
+KLATKI = 240
+CO_ILE_KLATEK = 30  # naciśnięcie T
+TEKSTURY = 4
+TRYBY = ["0", "1", "4", "16"]  # TEKSTURY_PBO: MB na klatkę, "0" - bez PBO
+
+
+def zapisz_tekstury(katalog, rozmiar):
+    generator = np.random.default_rng(1)
+    pliki = []
+    for numer in range(TEKSTURY):
+        plik = os.path.join(katalog, f"tekstura_{rozmiar}_{numer}.tga")
+        Image.fromarray(generator.integers(0, 256, (rozmiar, rozmiar, 3), dtype=np.uint8)).save(plik)
+        pliki.append(plik)
+    return pliki
+
+
+def zmierz(scena, pliki, pbo):
+    from OpenGL.GL import glFinish
+    from tekstury_gl import MenedzerTekstur
+    from profiler import Profiler
+
+    scena.tekstury = MenedzerTekstur(pliki, limit=3, pbo=pbo)
+    scena.tekstury.podepnij(0)
+    profiler = scena.profiler = Profiler()
+    indeks = 0
+
+    for numer in range(KLATKI):
+        with profiler.faza("render"):
+            if numer % CO_ILE_KLATEK == CO_ILE_KLATEK - 1:
+                indeks = (indeks + 1) % len(pliki)
+                scena.tekstury.podepnij(indeks)
+            scena.render(time.perf_counter())
+            glFinish()
+        profiler.koniec_klatki()
+
+    scena.tekstury.usun()
+    return profiler.podsumowanie()
+
+
+def zmierz_start(scena, pliki, pbo):
+    # Klatki od startu do chwili, gdy ładowarka wyśle ostatnią teksturę.
+    # Zwraca (podsumowanie profilera, czas do kompletu tekstur w ms).
+    from OpenGL.GL import glFinish
+    from tekstury_gl import MenedzerTekstur
+    from profiler import Profiler
+
+    profiler = scena.profiler = Profiler()
+    start = time.perf_counter()
+    # Raport ładowarki wypisujemy sami, w tabeli
+    with contextlib.redirect_stdout(io.StringIO()):
+        scena.tekstury = MenedzerTekstur(pliki, limit=3, pbo=pbo)
+        scena.tekstury.wczytaj_wszystkie()
+        scena.tekstury.podepnij(0)
+        while scena.tekstury.ladowarka is not None:
+            with profiler.faza("render"):
+                scena.render(time.perf_counter())
+                glFinish()
+            profiler.koniec_klatki()
+    wszystkie = (time.perf_counter() - start) * 1000
+
+    scena.tekstury.usun()
+    return profiler.podsumowanie(), wszystkie
+
+
+def main():
+    rozmiary = [int(a) for a in sys.argv[1:]] or [1024, 2048, 4096]
+
+    ustaw_platforme("egl")
+    from OpenGL.GL import glGetString, GL_RENDERER
+    from bench_wspolne import wczytaj_scene
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.argv = ["zad5.0.py"]
+    kontekst = utworz_kontekst("egl", ROZMIAR, ROZMIAR)
+    print(f"GL_RENDERER: {glGetString(GL_RENDERER).decode()}")
+
+    scena = wczytaj_scene("zad5.0.py")
+    scena.startup()
+    scena.update_viewport(None, ROZMIAR, ROZMIAR)
+    scena.tekstury.usun()
+
+    print(f"{KLATKI} klatek, T co {CO_ILE_KLATEK} klatek, czasy klatki w ms")
+    print(f"{'rozmiar':>8} {'PBO [MB/klatkę]':>16} {'p50':>8} {'p99':>8} {'max':>8}")
+    with tempfile.TemporaryDirectory() as katalog:
+        for rozmiar in rozmiary:
+            pliki = zapisz_tekstury(katalog, rozmiar)
+            for pbo in TRYBY:
+                p = zmierz(scena, pliki, pbo)
+                opis = "bez PBO" if pbo == "0" else pbo
+                print(f"{rozmiar:>8} {opis:>16} {p['p50_ms']:>8.2f} {p['p99_ms']:>8.2f} "
+                      f"{p['max_ms']:>8.2f}", flush=True)
+
+        print(f"\nStart z --od-razu ({TEKSTURY} tekstury), klatki do kompletu tekstur w GL, czasy w ms")
+        print(f"{'rozmiar':>8} {'PBO [MB/klatkę]':>16} {'klatki':>7} {'p50':>8} {'max':>8} {'komplet':>9}")
+        for rozmiar in rozmiary:
+            pliki = zapisz_tekstury(katalog, rozmiar)
+            for pbo in TRYBY:
+                p, wszystkie = zmierz_start(scena, pliki, pbo)
+                opis = "bez PBO" if pbo == "0" else pbo
+                print(f"{rozmiar:>8} {opis:>16} {p['klatki']:>7} {p['p50_ms']:>8.2f} {p['max_ms']:>8.2f} "
+                      f"{wszystkie:>9.1f}", flush=True)
+
+    scena.tekstury = None
+    scena.shutdown()
+    kontekst.usun()
+
+
+if __name__ == '__main__':
+    main()
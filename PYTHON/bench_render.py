@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# Porównanie czasu klatki jajka z zad5.0: tryb natychmiastowy (glVertex3fv
+# dla każdego wierzchołka) kontra bufory na karcie (jedno glDrawElements).
+# Bez okna (bez_okna.py).
+#
+# Użycie: python3 bench_render.py [N ...]
+import os
+import sys
+
+from bez_okna import ustaw_platforme, utworz_kontekst
+
+KLATKI = 100
+ROZMIAR = 600
+
+
+def main():
+    rozmiary = [int(a) for a in sys.argv[1:]] or [25, 50, 100, 200, 400]
+
+    ustaw_platforme("egl")
+    from OpenGL.GL import glGetString, GL_RENDERER
+    from bench_wspolne import wczytaj_scene, zmierz_klatke
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.argv = ["zad5.0.py"]
+    kontekst = utworz_kontekst("egl", ROZMIAR, ROZMIAR)
+    print(f"GL_RENDERER: {glGetString(GL_RENDERER).decode()}")
+
+    zad = wczytaj_scene("zad5.0.py")
+    zad.startup()
+    zad.update_viewport(None, ROZMIAR, ROZMIAR)
+
+    print(f"{'N':>6} {'natychm. [ms]':>14} {'VBO [ms]':>10} {'przysp.':>9}")
+    for n in rozmiary:
+        zad.N = n
+        zad.oblicz_punkty_jajka()
+        zad.zbuduj_bufory()
+
+        # Tryb natychmiastowy przy dużym N jest bardzo wolny - mniej klatek
+        zad.UZYJ_VBO = False
+        t_stary = zmierz_klatke(zad, max(1, KLATKI * 50 // n))
+        zad.UZYJ_VBO = True
+        t_vbo = zmierz_klatke(zad, KLATKI)
+
+        print(f"{n:>6} {t_stary * 1000:>14.2f} {t_vbo * 1000:>10.2f} {t_stary / t_vbo:>8.1f}x")
+
+    zad.shutdown()
+    kontekst.usun()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# Oświetlone jajko z zad5.0: potok stały (glLightfv, gluLookAt, glRotatef,
+# oświetlenie na wierzchołek) kontra shader GLSL z shadery.py (oświetlenie
+# na fragment, MVP z NumPy raz na klatkę). Rysowane bez okna (bez_okna.py),
+# z buforów (VBO), przy różnym N.
+#
+# Użycie: python3 bench_shadery.py [N ...]
+import os
+import sys
+
+from bez_okna import ustaw_platforme, utworz_kontekst
+
+KLATKI = 100
+ROZMIAR = 600
+
+
+def obroc(zad, klatka):
+    # Do zmierz_klatke: kamera obraca się co klatkę - macierze zmieniają się jak przy ruchu myszą
+    zad.theta = klatka * 3.6
+
+
+def main():
+    rozmiary = [int(a) for a in sys.argv[1:]] or [50, 100, 200, 500, 1000]
+
+    ustaw_platforme("egl")
+    from OpenGL.GL import glGetString, GL_RENDERER
+    from bench_wspolne import wczytaj_scene, zmierz_klatke
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.argv = ["zad5.0.py", "--swiatlo"]
+    kontekst = utworz_kontekst("egl", ROZMIAR, ROZMIAR)
+    print(f"GL_RENDERER: {glGetString(GL_RENDERER).decode()}")
+
+    zad = wczytaj_scene("zad5.0.py")
+    zad.startup()
+    zad.update_viewport(None, ROZMIAR, ROZMIAR)
+
+    print(f"{'N':>6} {'potok stały [ms]':>17} {'shader [ms]':>12} {'przysp.':>9}")
+    for n in rozmiary:
+        zad.N = n
+        zad.oblicz_punkty_jajka()
+        zad.zbuduj_bufory()
+
+        zad.UZYJ_SHADERA = False
+        t_staly = zmierz_klatke(zad, KLATKI, obroc)
+        zad.UZYJ_SHADERA = True
+        t_shader = zmierz_klatke(zad, KLATKI, obroc)
+
+        print(f"{n:>6} {t_staly * 1000:>17.3f} {t_shader * 1000:>12.3f} {t_staly / t_shader:>8.2f}x")
+
+    zad.shutdown()
+    kontekst.usun()
+
+
+if __name__ == '__main__':
+    main()
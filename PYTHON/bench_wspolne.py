@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# Wspólne kawałki benchmarków: ładowanie skryptów zadań (a z nich scen -
+# patrz silnik.py) i pomiar średniego czasu klatki. Kontekst GL daje
+# bez_okna.py (EGL, bez serwera X).
+import time
+import importlib.util
+
+
+def wczytaj_skrypt(plik):
+    # Skrypty mają kropkę w nazwie (zad5.0.py), więc nie da się ich
+    # zaimportować zwykłym import - ładujemy je bezpośrednio z pliku.
+    nazwa = plik.replace(".py", "").replace(".", "_")
+    spec = importlib.util.spec_from_file_location(nazwa, plik)
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+def wczytaj_scene(plik):
+    # Obiekt sceny skryptu zadania (zmienna `scena` w module)
+    return wczytaj_skrypt(plik).scena
+
+
+def zmierz_klatke(scena, klatki, przed_klatka=None, rozgrzewka=3, czas=None):
+    # Średni czas klatki scena.render() w sekundach: `rozgrzewka` klatek bez
+    # pomiaru, potem `klatki` klatek z glFinish po każdej. przed_klatka(scena,
+    # numer) jest wołane przed każdą mierzoną klatką (np. obrót kamery).
+    # Z `czas` pomiar kończy się po tylu sekundach (co najmniej 2 klatki,
+    # najwyżej `klatki`). OpenGL.GL importujemy dopiero tutaj, żeby samo
+    # zaimportowanie modułu nie ładowało jeszcze GL.
+    from OpenGL.GL import glFinish
+
+    for _ in range(rozgrzewka):
+        scena.render(0.0)
+    glFinish()
+
+    numer = 0
+    start = time.perf_counter()
+    while numer < klatki and (czas is None or numer < 2 or time.perf_counter() - start < czas):
+        if przed_klatka is not None:
+            przed_klatka(scena, numer)
+        scena.render(numer / 60.0)
+        glFinish()
+        numer += 1
+    return (time.perf_counter() - start) / numer
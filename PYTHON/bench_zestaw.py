@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# Zestaw benchmarków scen bez okna (jak bez_okna.py): jajko z zad5.0 przy
+# różnym N, ostrosłupy z zad3.5 / zad4.0 / zad4.5, różna liczba tekstur
+# i rozmiar okna, każda ścieżka rysowania (bufory / listy / tryb natychmiastowy).
+# Każdy pomiar to osobny proces, więc szczytowe RSS dotyczy jednej sceny.
+#
+# Użycie: python3 bench_zestaw.py [--klatki 100] [--zapis wyniki.json]
+#                                 [--porownaj baza.json [--tolerancja 0.1]]
+# Z --porownaj kończy się kodem 1, jeśli któraś scena ma mniej klatek/s niż
+# w pliku bazowym (z --zapis) o więcej niż tolerancja - do pilnowania zmian.
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import resource
+import subprocess
+
+KATALOG = os.path.dirname(os.path.abspath(__file__))
+
+# Tryb natychmiastowy przy dużym N to dziesiątki milionów wywołań GL na
+# klatkę - mierzymy go tylko do tego rozmiaru siatki
+MAKS_N_NATYCHMIASTOWO = 200
+
+
+def scenariusze():
+    # Lista konfiguracji: skrypt, ścieżka rysowania, N, liczba tekstur, rozmiar okna
+    wynik = []
+    for n in [50, 100, 200, 500, 1000, 2000]:
+        for sciezka in ["vbo", "natychm."]:
+            if sciezka == "natychm." and n > MAKS_N_NATYCHMIASTOWO:
+                continue
+            wynik.append({"skrypt": "zad5.0.py", "sciezka": sciezka, "n": n, "tekstury": 1, "rozmiar": 600})
+
+    liczba_plikow = len(glob.glob(os.path.join(KATALOG, "tekstury", "*.tga")))
+    for tekstury in sorted({1, 5, liczba_plikow}):
+        wynik.append({"skrypt": "zad5.0.py", "sciezka": "vbo", "n": 200, "tekstury": tekstury, "rozmiar": 600})
+
+    for rozmiar in [300, 1200]:
+        wynik.append({"skrypt": "zad5.0.py", "sciezka": "vbo", "n": 200, "tekstury": 1, "rozmiar": rozmiar})
+
+    for skrypt in ["zad3.5.py", "zad4.0.py", "zad4.5.py"]:
+        for sciezka in ["lista", "natychm."]:
+            wynik.append({"skrypt": skrypt, "sciezka": sciezka, "n": None, "tekstury": 1, "rozmiar": 600})
+    wynik.append({"skrypt": "zad4.5.py", "sciezka": "lista", "n": None, "tekstury": 5, "rozmiar": 600})
+
+    # Bez powtórzeń (np. N=200 z jedną teksturą w oknie 600 jest w kilku seriach)
+    unikalne = {}
+    for scena in wynik:
+        unikalne.setdefault(klucz(scena), scena)
+    return list(unikalne.values())
+
+
+def klucz(scena):
+    return f"{scena['skrypt']}|{scena['sciezka']}|{scena['n']}|{scena['tekstury']}|{scena['rozmiar']}"
+
+
+def zmierz(scena, klatki, backend="egl"):
+    # Uruchamiane w procesie potomnym: rysuje scenę bez okna i zwraca wyniki
+    from bez_okna import ustaw_platforme, utworz_kontekst
+    ustaw_platforme(backend)
+    from OpenGL.GL import glFinish
+    from bench_wspolne import wczytaj_scene
+    from tekstury_gl import MenedzerTekstur
+
+    os.chdir(KATALOG)
+    sys.argv = [scena["skrypt"]]
+    rozmiar = scena["rozmiar"]
+    kontekst = utworz_kontekst(backend, rozmiar, rozmiar)
+    zad = wczytaj_scene(scena["skrypt"])
+    zad.startup()
+    zad.update_viewport(None, rozmiar, rozmiar)
+
+    if scena["n"] is not None:
+        zad.N = scena["n"]
+        zad.oblicz_punkty_jajka()
+        zad.zbuduj_bufory()
+    if hasattr(zad, "UZYJ_VBO"):
+        zad.UZYJ_VBO = scena["sciezka"] == "vbo"
+    if hasattr(zad, "UZYJ_LIST"):
+        zad.UZYJ_LIST = scena["sciezka"] == "lista"
+
+    # Kilka tekstur przełączanych co klatkę. Limit równy liczbie tekstur:
+    # po pierwszym cyklu (rozgrzewka) wszystkie są w GL i mierzymy samo
+    # przełączanie, a nie dekodowanie plików.
+    liczba_tekstur = scena["tekstury"]
+    if liczba_tekstur > 1:
+        zad.tekstury.usun()
+        pliki = sorted(glob.glob("tekstury/*.tga"))[:liczba_tekstur]
+        zad.tekstury = MenedzerTekstur(pliki, liczba_tekstur, zad.tekstury.powtarzanie)
+
+    def klatka(numer):
+        if liczba_tekstur > 1:
+            zad.podepnij_teksture(numer % liczba_tekstur)
+        zad.render(0.0)
+        glFinish()
+
+    for numer in range(max(3, liczba_tekstur)):
+        klatka(numer)
+
+    # Jajko w trybie natychmiastowym jest bardzo wolne - mniej klatek (jak w bench_render.py)
+    if scena["sciezka"] == "natychm." and scena["n"] is not None:
+        klatki = max(1, klatki * 50 // scena["n"])
+
+    start, start_cpu = time.perf_counter(), time.process_time()
+    for numer in range(klatki):
+        klatka(numer)
+    czas, czas_cpu = time.perf_counter() - start, time.process_time() - start_cpu
+
+    zad.shutdown()
+    kontekst.usun()
+    return {
+        "klatki_na_s": klatki / czas,
+        "ms_na_klatke": czas / klatki * 1000,
+        "cpu_ms_na_klatke": czas_cpu / klatki * 1000,
+        # ru_maxrss na Linuksie jest w kilobajtach
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def uruchom_w_procesie(scena, klatki, backend):
+    wynik = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--jeden", json.dumps(scena),
+         "--klatki", str(klatki), "--backend", backend],
+        capture_output=True, text=True)
+    if wynik.returncode != 0:
+        print(wynik.stderr, file=sys.stderr)
+        return None
+    # Skrypty wypisują swoje komunikaty - wynik jest w ostatniej linii
+    return json.loads(wynik.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarki scen bez okna")
+    parser.add_argument("--klatki", type=int, default=100)
+    parser.add_argument("--backend", choices=["egl", "osmesa"], default="egl")
+    parser.add_argument("--zapis", help="plik JSON na wyniki (baza do --porownaj)")
+    parser.add_argument("--porownaj", help="plik JSON z wcześniejszymi wynikami")
+    parser.add_argument("--tolerancja", type=float, default=0.1)
+    parser.add_argument("--jeden", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.jeden:
+        print(json.dumps(zmierz(json.loads(args.jeden), args.klatki, args.backend)))
+        return
+
+    baza = {}
+    if args.porownaj:
+        with open(args.porownaj, encoding="utf-8") as f:
+            baza = {klucz(w): w for w in json.load(f)}
+
+    print(f"{'skrypt':<10} {'ścieżka':<9} {'N':>5} {'tekst.':>6} {'okno':>5} "
+          f"{'klatki/s':>9} {'ms/klatkę':>10} {'CPU ms':>8} {'RSS MB':>7}"
+          + (f" {'vs baza':>8}" if baza else ""))
+
+    wyniki = []
+    regresje = 0
+    for scena in scenariusze():
+        pomiar = uruchom_w_procesie(scena, args.klatki, args.backend)
+        if pomiar is None:
+            print(f"{scena['skrypt']:<10} {scena['sciezka']:<9} - błąd pomiaru")
+            continue
+        wyniki.append(dict(scena, **pomiar))
+
+        wiersz = (f"{scena['skrypt']:<10} {scena['sciezka']:<9} {scena['n'] or '-':>5} "
+                  f"{scena['tekstury']:>6} {scena['rozmiar']:>5} {pomiar['klatki_na_s']:>9.1f} "
+                  f"{pomiar['ms_na_klatke']:>10.3f} {pomiar['cpu_ms_na_klatke']:>8.3f} "
+                  f"{pomiar['rss_mb']:>7.1f}")
+        poprzedni = baza.get(klucz(scena))
+        if poprzedni is not None:
+            zmiana = pomiar["klatki_na_s"] / poprzedni["klatki_na_s"] - 1
+            wiersz += f" {zmiana * 100:>+7.1f}%"
+            if zmiana < -args.tolerancja:
+                wiersz += "  REGRESJA"
+                regresje += 1
+        print(wiersz, flush=True)
+
+    if args.zapis:
+        with open(args.zapis, "w", encoding="utf-8") as f:
+            json.dump(wyniki, f, indent=1)
+        print(f"Wyniki zapisane do {args.zapis}")
+
+    if regresje:
+        print(f"{regresje} scen wolniejszych niż w {args.porownaj} o ponad {args.tolerancja:.0%}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# Uruchamia skrypt zadania bez okna i bez karty graficznej: startup() i render()
+# rysują do bufora poza ekranem (EGL pbuffer albo OSMesa, np. na llvmpipe),
+# przez zadaną liczbę klatek. Wypisuje czas i sumy kontrolne klatek, a na
+# życzenie zapisuje klatki do plików PNG - do pomiaru wydajności i wykrywania
+# zmian w obrazie na zwykłych maszynach CI.
+#
+# Użycie: python3 bez_okna.py zad5.0.py [--klatki 100] [--rozmiar 600x600]
+#                             [--backend egl|osmesa] [--zrzuty KATALOG] [--sumy PLIK]
+#                             [opcje skryptu, np. --atlas, --profil, --profil-zapis PLIK]
+import os
+import sys
+import time
+import hashlib
+import argparse
+import ctypes
+import numpy as np
+from PIL import Image
+
+
+def ustaw_platforme(backend):
+    # PyOpenGL wybiera platformę przy pierwszym imporcie OpenGL, więc trzeba
+    # to zrobić przed zaimportowaniem skryptów i OpenGL.GL. Bez serwera X
+    # Mesa potrzebuje platformy "surfaceless" dla EGL.
+    os.environ["PYOPENGL_PLATFORM"] = backend
+    if backend == "egl":
+        os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+
+
+class KontekstEGL:
+    # Kontekst OpenGL (profil zgodności) rysujący do pbuffera EGL
+
+    def __init__(self, szerokosc, wysokosc):
+        from OpenGL import EGL
+
+        self.egl = EGL
+        self.display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        major, minor = EGL.EGLint(), EGL.EGLint()
+        if not EGL.eglInitialize(self.display, ctypes.pointer(major), ctypes.pointer(minor)):
+            raise RuntimeError("Nie udało się zainicjować EGL")
+
+        atrybuty = [
+            EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+            EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8,
+            EGL.EGL_DEPTH_SIZE, 24,
+            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+            EGL.EGL_NONE,
+        ]
+        konfiguracja = EGL.EGLConfig()
+        liczba = EGL.EGLint()
+        EGL.eglChooseConfig(self.display, (EGL.EGLint * len(atrybuty))(*atrybuty),
+                            ctypes.pointer(konfiguracja), 1, ctypes.pointer(liczba))
+        if liczba.value == 0:
+            raise RuntimeError("Brak konfiguracji EGL z pbufferem i OpenGL")
+
+        rozmiar = [EGL.EGL_WIDTH, szerokosc, EGL.EGL_HEIGHT, wysokosc, EGL.EGL_NONE]
+        self.powierzchnia = EGL.eglCreatePbufferSurface(
+            self.display, konfiguracja, (EGL.EGLint * len(rozmiar))(*rozmiar))
+
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        self.kontekst = EGL.eglCreateContext(self.display, konfiguracja, EGL.EGL_NO_CONTEXT, None)
+        if not EGL.eglMakeCurrent(self.display, self.powierzchnia, self.powierzchnia, self.kontekst):
+            raise RuntimeError("Nie udało się ustawić kontekstu EGL")
+
+    def usun(self):
+        EGL = self.egl
+        EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+        EGL.eglDestroyContext(self.display, self.kontekst)
+        EGL.eglDestroySurface(self.display, self.powierzchnia)
+        EGL.eglTerminate(self.display)
+
+
+class KontekstOSMesa:
+    # Kontekst OSMesa rysujący do zwykłej tablicy w pamięci
+
+    def __init__(self, szerokosc, wysokosc):
+        from OpenGL import osmesa, arrays
+        from OpenGL.GL import GL_UNSIGNED_BYTE
+
+        self.osmesa = osmesa
+        self.kontekst = osmesa.OSMesaCreateContextExt(osmesa.OSMESA_RGBA, 24, 0, 0, None)
+        if not self.kontekst:
+            raise RuntimeError("Nie udało się utworzyć kontekstu OSMesa")
+        self.bufor = arrays.GLubyteArray.zeros((wysokosc, szerokosc, 4))
+        if not osmesa.OSMesaMakeCurrent(self.kontekst, self.bufor, GL_UNSIGNED_BYTE,
+                                        szerokosc, wysokosc):
+            raise RuntimeError("Nie udało się ustawić kontekstu OSMesa")
+
+    def usun(self):
+        self.osmesa.OSMesaDestroyContext(self.kontekst)
+
+
+def utworz_kontekst(backend, szerokosc, wysokosc):
+    if backend == "osmesa":
+        return KontekstOSMesa(szerokosc, wysokosc)
+    return KontekstEGL(szerokosc, wysokosc)
+
+
+def odczytaj_klatke(szerokosc, wysokosc):
+    # Zawartość bufora jako (wysokość, szerokość, 3) uint8, pierwszy wiersz = góra
+    from OpenGL.GL import glReadPixels, glPixelStorei, GL_PACK_ALIGNMENT, GL_RGB, GL_UNSIGNED_BYTE
+
+    glPixelStorei(GL_PACK_ALIGNMENT, 1)
+    dane = glReadPixels(0, 0, szerokosc, wysokosc, GL_RGB, GL_UNSIGNED_BYTE)
+    return np.frombuffer(dane, dtype=np.uint8).reshape(wysokosc, szerokosc, 3)[::-1]
+
+
+def uruchom(plik, klatki=100, szerokosc=600, wysokosc=600, backend="egl",
+            katalog_zrzutow=None, przy_klatce=None):
+    # Rysuje `klatki` klatek skryptu `plik` bez okna. Zwraca (sumy kontrolne
+    # kolejnych klatek, czas rysowania w sekundach). przy_klatce(zad, numer)
+    # jest wołane przed każdą klatką - np. do obracania sceny w benchmarkach.
+    ustaw_platforme(backend)
+    from OpenGL.GL import glFinish
+    from bench_wspolne import wczytaj_scene
+    from profiler import Profiler
+
+    # Skrypty wczytują tekstury ścieżkami względnymi do swojego katalogu
+    katalog = os.path.dirname(os.path.abspath(plik))
+    os.chdir(katalog)
+
+    kontekst = utworz_kontekst(backend, szerokosc, wysokosc)
+    zad = wczytaj_scene(os.path.basename(plik))
+    zad.startup()
+    zad.update_viewport(None, szerokosc, wysokosc)
+
+    # Ten sam pomiar faz co w pętli GLFW skryptu (bez swap i zdarzeń)
+    profiler = zad.profiler = Profiler.z_argumentow()
+
+    if katalog_zrzutow:
+        os.makedirs(katalog_zrzutow, exist_ok=True)
+
+    sumy = []
+    czas = 0.0
+    for numer in range(klatki):
+        if przy_klatce is not None:
+            przy_klatce(zad, numer)
+
+        start = time.perf_counter()
+        with profiler.faza("render"):
+            zad.render(start)
+            glFinish()
+        czas += time.perf_counter() - start
+        profiler.koniec_klatki()
+
+        obraz = odczytaj_klatke(szerokosc, wysokosc)
+        sumy.append(hashlib.sha1(obraz.tobytes()).hexdigest())
+        if katalog_zrzutow:
+            Image.fromarray(obraz).save(os.path.join(katalog_zrzutow, f"klatka_{numer:05d}.png"))
+
+    profiler.zakoncz()
+    zad.shutdown()
+    kontekst.usun()
+    return sumy, czas
+
+
+def dodatnia(tekst):
+    # Typ argumentu --klatki: średni czas klatki i suma ostatniej wymagają choć jednej
+    liczba = int(tekst)
+    if liczba < 1:
+        raise argparse.ArgumentTypeError(f"musi być dodatnia: {tekst}")
+    return liczba
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rysowanie skryptu zadania bez okna")
+    parser.add_argument("skrypt")
+    parser.add_argument("--klatki", type=dodatnia, default=100)
+    parser.add_argument("--rozmiar", default="600x600")
+    parser.add_argument("--backend", choices=["egl", "osmesa"], default="egl")
+    parser.add_argument("--zrzuty", help="katalog na klatki PNG")
+    parser.add_argument("--sumy", help="plik na sumy kontrolne (SHA1) kolejnych klatek")
+    args, opcje_skryptu = parser.parse_known_args()
+    # Pozostałe opcje (np. --atlas, --wszystkie) czyta sam skrypt z sys.argv
+    if "--profil-zapis" in opcje_skryptu:
+        # Skrypt rysuje z własnego katalogu - ścieżka względem miejsca wywołania
+        i = opcje_skryptu.index("--profil-zapis") + 1
+        opcje_skryptu[i] = os.path.abspath(opcje_skryptu[i])
+    sys.argv = [args.skrypt] + opcje_skryptu
+
+    szerokosc, wysokosc = (int(x) for x in args.rozmiar.split("x"))
+    zrzuty = os.path.abspath(args.zrzuty) if args.zrzuty else None
+    plik_sum = os.path.abspath(args.sumy) if args.sumy else None
+
+    sumy, czas = uruchom(args.skrypt, args.klatki, szerokosc, wysokosc, args.backend, zrzuty)
+
+    if plik_sum:
+        with open(plik_sum, "w") as f:
+            f.write("\n".join(sumy) + "\n")
+
+    print(f"{args.skrypt}: {args.klatki} klatek {szerokosc}x{wysokosc} w {czas:.3f} s "
+          f"({args.klatki / czas:.1f} klatek/s, {czas / args.klatki * 1000:.2f} ms/klatkę)")
+    print(f"Suma kontrolna ostatniej klatki: {sumy[-1]}")
+
+
+if __name__ == '__main__':
+    main()
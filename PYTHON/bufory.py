@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+import numpy as np
+
+from OpenGL.GL import *
+
+from widocznosc import sfera_otaczajaca, prostopadloscian
+
+
+# Typ indeksów w GL w zależności od typu tablicy NumPy
+TYPY_INDEKSOW = {
+    np.dtype(np.uint16): GL_UNSIGNED_SHORT,
+    np.dtype(np.uint32): GL_UNSIGNED_INT,
+}
+
+
+class SiatkaVBO:
+    # Siatka (jajko.Siatka) trzymana w buforach na karcie: pozycje,
+    # współrzędne tekstury, normalne (jeśli są) i wspólny bufor indeksów. Dane wysyłamy raz
+    # (przy tworzeniu), a każda klatka to jedno wywołanie glDrawElements
+    # zamiast tysięcy glVertex3fv.
+    #
+    # Korzysta tylko z buforów z OpenGL 1.5 i tablic wierzchołków z potoku
+    # stałego, więc działa także na programowym rasteryzerze Mesy
+    # (llvmpipe / OSMesa, np. z LIBGL_ALWAYS_SOFTWARE=1).
+
+    def __init__(self, siatka):
+        pozycje = siatka.pozycje
+        uv = siatka.uv
+        indeksy = siatka.indeksy
+
+        # Bryły otaczające (widocznosc.py) - do odrzucania poza bryłą widzenia
+        self.sfera = sfera_otaczajaca(pozycje)
+        self.prostopadloscian = prostopadloscian(pozycje)
+
+        self.liczba_indeksow = indeksy.size
+        self.typ_indeksow = TYPY_INDEKSOW[indeksy.dtype]
+
+        self.vbo_pozycje, self.vbo_uv, self.ibo = glGenBuffers(3)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_pozycje)
+        glBufferData(GL_ARRAY_BUFFER, pozycje.nbytes, pozycje, GL_STATIC_DRAW)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_uv)
+        glBufferData(GL_ARRAY_BUFFER, uv.nbytes, uv, GL_STATIC_DRAW)
+
+        self.vbo_normalne = None
+        if siatka.normalne is not None:
+            self.vbo_normalne = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_normalne)
+            glBufferData(GL_ARRAY_BUFFER, siatka.normalne.nbytes, siatka.normalne, GL_STATIC_DRAW)
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indeksy.nbytes, indeksy, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    def rysuj(self, liczba_instancji=None):
+        # Z liczba_instancji: tyle kopii jednym glDrawElementsInstanced -
+        # dane instancji (atrybuty z dzielnikiem) ustawia wołający (instancje.py)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+
+        # Przy podpiętym buforze wskaźnik jest przesunięciem w buforze (0)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_pozycje)
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_uv)
+        glTexCoordPointer(2, GL_FLOAT, 0, None)
+        if self.vbo_normalne is not None:
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_normalne)
+            glNormalPointer(GL_FLOAT, 0, None)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        if liczba_instancji is None:
+            glDrawElements(GL_TRIANGLES, self.liczba_indeksow, self.typ_indeksow, None)
+        else:
+            glDrawElementsInstanced(GL_TRIANGLES, self.liczba_indeksow, self.typ_indeksow, None,
+                                    liczba_instancji)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        if self.vbo_normalne is not None:
+            glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def usun(self):
+        glDeleteBuffers(3, [self.vbo_pozycje, self.vbo_uv, self.ibo])
+        if self.vbo_normalne is not None:
+            glDeleteBuffers(1, [self.vbo_normalne])
+
+
+class ListyWyswietlania:
+    # Nagrane listy wyświetlania (glNewList) dla statycznej geometrii,
+    # osobno dla każdego stanu sceny (np. widoczności ściany). rysuj(*stan)
+    # wołamy tylko przy pierwszym użyciu danego stanu - potem każda klatka
+    # to jedno glCallList.
+
+    def __init__(self, rysuj):
+        self.rysuj = rysuj
+        self.listy = {}  # stan -> numer listy
+
+    def wywolaj(self, *stan):
+        lista = self.listy.get(stan)
+        if lista is None:
+            lista = glGenLists(1)
+            glNewList(lista, GL_COMPILE)
+            self.rysuj(*stan)
+            glEndList()
+            self.listy[stan] = lista
+        glCallList(lista)
+
+    def uniewaznij(self):
+        # Po zmianie samej geometrii - listy nagrają się od nowa
+        for lista in self.listy.values():
+            glDeleteLists(lista, 1)
+        self.listy.clear()
+
+    def usun(self):
+        self.uniewaznij()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Zwarte formaty tekstur liczone w NumPy: 16-bitowe RGB565 / RGBA4444
+# i bloki S3TC DXT1 (BC1), plus prosty kontener .dxt1 na gotowe bloki.
+import struct
+import numpy as np
+
+
+# Nagłówek kontenera .dxt1: znacznik, szerokość, wysokość, liczba poziomów.
+# Po nim kolejne poziomy mipmap, każdy to ciąg 8-bajtowych bloków DXT1.
+# Wiersze są w kolejności GL (pierwszy = dół obrazka), jak w wczytaj_piksele.
+ZNACZNIK_DXT1 = b"TKS1DXT1"
+NAGLOWEK_DXT1 = struct.Struct("<8sIII")
+
+# Blok DXT1: dwa kolory RGB565 i 16 dwubitowych indeksów (po 4x4 teksele)
+TYP_BLOKU_DXT1 = np.dtype([("kolor0", "<u2"), ("kolor1", "<u2"), ("indeksy", "<u4")])
+
+
+def spakuj_rgb565(piksele):
+    # (wysokość, szerokość, 3) uint8 -> (wysokość, szerokość) uint16
+    # do wysłania jako GL_RGB / GL_UNSIGNED_SHORT_5_6_5
+    p = piksele.astype(np.uint16)
+    return ((p[..., 0] >> 3) << 11) | ((p[..., 1] >> 2) << 5) | (p[..., 2] >> 3)
+
+
+def spakuj_rgba4444(piksele):
+    # (wysokość, szerokość, 3) uint8 -> (wysokość, szerokość) uint16
+    # do wysłania jako GL_RGBA / GL_UNSIGNED_SHORT_4_4_4_4 (alfa = 1)
+    p = piksele.astype(np.uint16) >> 4
+    return (p[..., 0] << 12) | (p[..., 1] << 8) | (p[..., 2] << 4) | 0xF
+
+
+def _rozpakuj_rgb565(kolory):
+    # uint16 RGB565 -> float32 RGB w zakresie 0-255 (tak jak dekoduje karta)
+    r = (kolory >> 11) & 0x1F
+    g = (kolory >> 5) & 0x3F
+    b = kolory & 0x1F
+    return np.stack([r * (255 / 31), g * (255 / 63), b * (255 / 31)], axis=-1).astype(np.float32)
+
+
+def kompresuj_dxt1(piksele):
+    # Kompresja DXT1 wszystkich bloków 4x4 naraz. Końce palety to najjaśniejszy
+    # i najciemniejszy teksel bloku, pozostałe dwa kolory leżą między nimi,
+    # a każdy teksel dostaje najbliższy kolor palety.
+    wysokosc, szerokosc = piksele.shape[:2]
+    bloki_y = (wysokosc + 3) // 4
+    bloki_x = (szerokosc + 3) // 4
+
+    # Brzegi obrazka o wymiarach niepodzielnych przez 4 uzupełniamy powtórzeniem
+    p = np.pad(piksele, ((0, bloki_y * 4 - wysokosc), (0, bloki_x * 4 - szerokosc), (0, 0)), mode="edge")
+    bloki = (p.reshape(bloki_y, 4, bloki_x, 4, 3)
+             .transpose(0, 2, 1, 3, 4)
+             .reshape(-1, 16, 3)
+             .astype(np.float32))
+    numery = np.arange(len(bloki))
+
+    jasnosc = bloki @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    kolor0 = spakuj_rgb565(bloki[numery, jasnosc.argmax(axis=1)])
+    kolor1 = spakuj_rgb565(bloki[numery, jasnosc.argmin(axis=1)])
+
+    # Tryb 4 kolorów wymaga kolor0 > kolor1
+    zamiana = kolor0 < kolor1
+    kolor0[zamiana], kolor1[zamiana] = kolor1[zamiana], kolor0[zamiana]
+
+    k0 = _rozpakuj_rgb565(kolor0)
+    k1 = _rozpakuj_rgb565(kolor1)
+    paleta = np.stack([k0, k1, (2 * k0 + k1) / 3, (k0 + 2 * k1) / 3], axis=1)
+
+    odleglosci = ((bloki[:, :, np.newaxis, :] - paleta[:, np.newaxis, :, :]) ** 2).sum(axis=-1)
+    indeksy = odleglosci.argmin(axis=-1).astype(np.uint32)
+    indeksy[kolor0 == kolor1] = 0  # jednolity blok
+
+    wynik = np.empty(len(bloki), dtype=TYP_BLOKU_DXT1)
+    wynik["kolor0"] = kolor0
+    wynik["kolor1"] = kolor1
+    wynik["indeksy"] = (indeksy << (2 * np.arange(16, dtype=np.uint32))).sum(axis=1, dtype=np.uint32)
+    return wynik
+
+
+def rozmiar_dxt1(szerokosc, wysokosc):
+    return ((szerokosc + 3) // 4) * ((wysokosc + 3) // 4) * TYP_BLOKU_DXT1.itemsize
+
+
+def rozmiar_w_gl(szerokosc, wysokosc, format):
+    # Ile bajtów zajmuje jeden poziom tekstury w danym formacie
+    if format == "dxt1":
+        return rozmiar_dxt1(szerokosc, wysokosc)
+    if format in ("565", "4444"):
+        return szerokosc * wysokosc * 2
+    return szerokosc * wysokosc * 3
+
+
+def zapisz_dxt1(plik, szerokosc, wysokosc, poziomy):
+    # poziomy: lista tablic bloków z kompresuj_dxt1, od poziomu 0
+    with open(plik, "wb") as f:
+        f.write(NAGLOWEK_DXT1.pack(ZNACZNIK_DXT1, szerokosc, wysokosc, len(poziomy)))
+        for bloki in poziomy:
+            f.write(bloki.tobytes())
+
+
+def wczytaj_dxt1(plik):
+    # Zwraca (szerokość, wysokość, lista poziomów jako bajty bloków).
+    # Rzuca IOError przy braku pliku albo złym nagłówku.
+    with open(plik, "rb") as f:
+        dane = f.read()
+
+    if len(dane) < NAGLOWEK_DXT1.size or not dane.startswith(ZNACZNIK_DXT1):
+        raise IOError(f"{plik}: to nie jest plik .dxt1")
+    _, szerokosc, wysokosc, liczba_poziomow = NAGLOWEK_DXT1.unpack_from(dane)
+
+    poziomy = []
+    poczatek = NAGLOWEK_DXT1.size
+    w, h = szerokosc, wysokosc
+    for _ in range(liczba_poziomow):
+        koniec = poczatek + rozmiar_dxt1(w, h)
+        poziomy.append(dane[poczatek:koniec])
+        poczatek = koniec
+        w, h = max(1, w // 2), max(1, h // 2)
+
+    return szerokosc, wysokosc, poziomy
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# Rysowanie instancjami: wiele kopii jednej siatki (jajko, ostrosłup), każda
+# z własną macierzą modelu i teksturą, jednym glDrawElementsInstanced.
+# Siatka leży raz w buforach na karcie (SiatkaVBO), a dane instancji to
+# tablica NumPy wysyłana do jednego bufora - zamiast pętli w Pythonie
+# z glMultMatrixf i glDrawElements dla każdego obiektu.
+#
+# Tekstury instancji to kafelki atlasu (atlas.py): indeks tekstury wybiera
+# prostokąt UV z tablicy uniformów, więc wszystkie kopie rysują się z jednej
+# podpiętej tekstury. GLSL 1.20 jak w shadery.py - wierzchołki siatki idą
+# przez gl_Vertex / gl_MultiTexCoord0, dane instancji przez atrybuty
+# z glVertexAttribDivisor(..., 1).
+import ctypes
+import numpy as np
+
+from OpenGL.GL import *
+
+from shadery import program
+
+# Najwięcej kafelków atlasu w tablicy uniformów u_prostokaty
+MAKS_TEKSTUR = 64
+
+ZRODLO_WIERZCHOLKOW_INSTANCJI = f"""
+#version 120
+uniform mat4 u_vp;
+uniform vec4 u_prostokaty[{MAKS_TEKSTUR}];  // (u0, v0, szerokość, wysokość) kafelka
+
+attribute mat4 a_model;     // cztery kolejne atrybuty - kolumny macierzy
+attribute float a_tekstura;
+
+varying vec2 v_uv;
+
+void main()
+{{
+    vec4 prostokat = u_prostokaty[int(a_tekstura)];
+    v_uv = prostokat.xy + gl_MultiTexCoord0.xy * prostokat.zw;
+    gl_Position = u_vp * (a_model * gl_Vertex);
+}}
+"""
+
+ZRODLO_FRAGMENTOW_INSTANCJI = """
+#version 120
+uniform sampler2D u_tekstura;
+
+varying vec2 v_uv;
+
+void main()
+{
+    gl_FragColor = texture2D(u_tekstura, v_uv);
+}
+"""
+
+# Na instancję: 16 floatów macierzy modelu (kolumnami) i indeks tekstury
+FLOATY_INSTANCJI = 17
+KROK = FLOATY_INSTANCJI * 4
+
+
+def program_instancji():
+    return program(ZRODLO_WIERZCHOLKOW_INSTANCJI, ZRODLO_FRAGMENTOW_INSTANCJI)
+
+
+def ustaw_atlas(p, atlas):
+    # Prostokąty UV wszystkich kafelków atlasu do tablicy u_prostokaty.
+    # Instancje widzą tylko jedną stronę atlasu (podpiętą teksturę).
+    if len(atlas.texture_ids) > 1:
+        raise ValueError("Atlas dla instancji musi mieścić się na jednej stronie")
+    if len(atlas) > MAKS_TEKSTUR:
+        raise ValueError(f"Za dużo tekstur dla instancji ({len(atlas)} > {MAKS_TEKSTUR})")
+    prostokaty = np.array([atlas.prostokat(i) for i in range(len(atlas))], dtype=np.float32)
+    p.uzyj()
+    glUniform4fv(p.lokalizacja("u_prostokaty"), len(prostokaty), prostokaty)
+    p.ustaw("u_tekstura", 0)
+
+
+def macierze_instancji(pozycje, katy=0.0, skale=1.0):
+    # Macierze modelu (n, 4, 4) w kolejności wierszy (jak macierze.py):
+    # przesunięcie do pozycji, obrót o kąt (stopnie) wokół osi Y, skala.
+    # Liczone wektorowo dla wszystkich instancji naraz.
+    pozycje = np.asarray(pozycje, dtype=np.float32)
+    n = len(pozycje)
+    katy = np.radians(np.broadcast_to(np.asarray(katy, dtype=np.float32), (n,)))
+    skale = np.broadcast_to(np.asarray(skale, dtype=np.float32), (n,))
+    c = np.cos(katy) * skale
+    s = np.sin(katy) * skale
+
+    m = np.zeros((n, 4, 4), dtype=np.float32)
+    m[:, 0, 0] = c
+    m[:, 0, 2] = s
+    m[:, 1, 1] = skale
+    m[:, 2, 0] = -s
+    m[:, 2, 2] = c
+    m[:, :3, 3] = pozycje
+    m[:, 3, 3] = 1.0
+    return m
+
+
+class Instancje:
+    # Kopie siatki z SiatkaVBO. ustaw() zmienia macierze i indeksy tekstur,
+    # rysuj() wysyła je do bufora instancji (tylko po zmianie; glBufferSubData
+    # do istniejącego bufora) i rysuje jednym glDrawElementsInstanced -
+    # wszystkie kopie albo tylko wybrane (np. widoczne, widocznosc.BVH).
+
+    def __init__(self, siatka, macierze, tekstury):
+        self.siatka = siatka
+        self.vbo = glGenBuffers(1)
+        self.dane = np.zeros((0, FLOATY_INSTANCJI), dtype=np.float32)
+        self.pojemnosc = 0       # ile kopii mieści bufor
+        self.w_buforze = None    # numery kopii w buforze (None - wszystkie)
+        self.aktualny = False    # czy bufor ma bieżące dane
+        self.ustaw(macierze, tekstury)
+
+    def __len__(self):
+        return len(self.dane)
+
+    def ustaw(self, macierze, tekstury=None):
+        # macierze: (n, 4, 4) z macierze_instancji; tekstury: (n,) indeksy
+        # kafelków atlasu, None - bez zmian (np. gdy co klatkę ruszamy tylko macierze)
+        n = len(macierze)
+        if n != len(self.dane):
+            self.dane = np.zeros((n, FLOATY_INSTANCJI), dtype=np.float32)
+        # Atrybut mat4 czyta kolumny, a macierze są w kolejności wierszy
+        self.dane[:, :16] = np.asarray(macierze, dtype=np.float32).transpose(0, 2, 1).reshape(n, 16)
+        if tekstury is not None:
+            self.dane[:, 16] = tekstury
+        self.aktualny = False
+
+    def _wyslij(self, wybrane):
+        # Do bufora trafiają tylko wybrane kopie - i tylko gdy coś się zmieniło
+        if self.aktualny and (wybrane is None and self.w_buforze is None
+                              or wybrane is not None and self.w_buforze is not None
+                              and np.array_equal(wybrane, self.w_buforze)):
+            return
+        dane = self.dane if wybrane is None else self.dane[wybrane]
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        if self.pojemnosc != len(self.dane):
+            glBufferData(GL_ARRAY_BUFFER, self.dane.nbytes, None, GL_DYNAMIC_DRAW)
+            self.pojemnosc = len(self.dane)
+        if len(dane):
+            glBufferSubData(GL_ARRAY_BUFFER, 0, dane.nbytes, dane)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.w_buforze = wybrane
+        self.aktualny = True
+
+    def rysuj(self, p, wybrane=None):
+        # p - aktywny program z atrybutami a_model i a_tekstura (program_instancji);
+        # wybrane - numery kopii do narysowania, None - wszystkie
+        liczba = len(self.dane) if wybrane is None else len(wybrane)
+        if liczba == 0:
+            return
+        self._wyslij(wybrane)
+        model = p.atrybut("a_model")
+        atrybuty = [(model + kolumna, 4, 16 * kolumna) for kolumna in range(4)]
+        atrybuty.append((p.atrybut("a_tekstura"), 1, 64))
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        for numer, rozmiar, przesuniecie in atrybuty:
+            glEnableVertexAttribArray(numer)
+            glVertexAttribPointer(numer, rozmiar, GL_FLOAT, GL_FALSE, KROK, ctypes.c_void_p(przesuniecie))
+            glVertexAttribDivisor(numer, 1)
+
+        self.siatka.rysuj(liczba)
+
+        for numer, _, _ in atrybuty:
+            glVertexAttribDivisor(numer, 0)
+            glDisableVertexAttribArray(numer)
+
+    def usun(self):
+        glDeleteBuffers(1, [self.vbo])
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+import numpy as np
+
+
+def oblicz_siatke_jajka(n):
+    # Wylicza wierzchołki jajka i współrzędne tekstury dla całej siatki naraz.
+    # u zmienia się wzdłuż wierszy (oś 0), v wzdłuż kolumn (oś 1), więc
+    # broadcasting (n, 1) x (1, n) daje od razu pełną tablicę n x n.
+    u = np.linspace(0.0, 1.0, n)[:, np.newaxis]
+    v = np.linspace(0.0, 1.0, n)[np.newaxis, :]
+
+    u2 = u * u
+    u3 = u2 * u
+    u4 = u3 * u
+    u5 = u4 * u
+
+    poly_u = (-90 * u5 + 225 * u4 - 270 * u3 + 180 * u2 - 45 * u)
+
+    # Tablice wynikowe są ciągłe i w float32 - można je od razu wysłać do GL
+    pozycje = np.empty((n, n, 3), dtype=np.float32)
+    pozycje[:, :, 0] = poly_u * np.cos(np.pi * v)
+    pozycje[:, :, 1] = 160 * u4 - 320 * u3 + 160 * u2 - 5.0  # -5 wyśrodkowuje jajko w pionie
+    pozycje[:, :, 2] = poly_u * np.sin(np.pi * v)
+
+    # Parametry u i v (zakres 0-1) są bezpośrednio współrzędnymi tekstury
+    uv = np.empty((n, n, 2), dtype=np.float32)
+    uv[:, :, 0] = u
+    uv[:, :, 1] = v
+
+    return pozycje, uv
+
+
+def oblicz_normalne_jajka(n):
+    # Normalne z pochodnych cząstkowych powierzchni (bez liczenia po trójkątach).
+    # Dla x = P(u) cos(pi v), y = Y(u), z = P(u) sin(pi v):
+    #   dp/du x dp/dv = pi P(u) * (Y'(u) cos(pi v), -P'(u), Y'(u) sin(pi v))
+    # Czynnik pi P(u) zeruje się na biegunach i zmienia znak w połowie jajka,
+    # więc bierzemy sam kierunek, zwrócony na zewnątrz - dzięki temu normalne
+    # są określone także na biegunach i ciągłe na szwie.
+    u = np.linspace(0.0, 1.0, n)[:, np.newaxis]
+    v = np.linspace(0.0, 1.0, n)[np.newaxis, :]
+
+    dp_du = -450 * u ** 4 + 900 * u ** 3 - 810 * u ** 2 + 360 * u - 45
+    dy_du = 640 * u ** 3 - 960 * u ** 2 + 320 * u
+
+    normalne = np.empty((n, n, 3), dtype=np.float32)
+    normalne[:, :, 0] = -dy_du * np.cos(np.pi * v)
+    normalne[:, :, 1] = dp_du
+    normalne[:, :, 2] = -dy_du * np.sin(np.pi * v)
+    normalne /= np.linalg.norm(normalne, axis=-1, keepdims=True)
+    return normalne
+
+
+def indeksy_trojkatow(n):
+    # Indeksy trójkątów siatki n x n (po dwa na każdy kwadrat), liczone
+    # względem spłaszczonej tablicy wierzchołków: wierzchołek (i, j) -> i * n + j.
+    i = np.arange(n - 1)[:, np.newaxis]
+    j = np.arange(n - 1)[np.newaxis, :]
+
+    p1 = i * n + j            # (i, j)
+    p2 = p1 + n               # (i + 1, j)
+    p3 = p1 + 1               # (i, j + 1)
+    p4 = p2 + 1               # (i + 1, j + 1)
+
+    # POŁOWA 1: (p1, p2, p3), (p2, p4, p3)
+    # POŁOWA 2: odwrócona kolejność - (p1, p3, p2), (p2, p3, p4)
+    polowa_1 = np.stack(np.broadcast_arrays(p1, p2, p3, p2, p4, p3), axis=-1)
+    polowa_2 = np.stack(np.broadcast_arrays(p1, p3, p2, p2, p3, p4), axis=-1)
+    indeksy = np.where((i < n / 2)[..., np.newaxis], polowa_1, polowa_2)
+
+    # uint16 wystarcza do 65536 wierzchołków (N <= 256) i zajmuje połowę miejsca
+    typ = np.uint16 if n * n <= 65536 else np.uint32
+    return indeksy.astype(typ).ravel()
+
+
+def indeksy_podsiatki(n, krok):
+    # Indeksy trójkątów rzadszej siatki: co `krok`-ty wiersz i kolumna siatki
+    # n x n, ale liczone względem wierzchołków pełnej siatki - wszystkie
+    # poziomy szczegółowości mogą więc korzystać z jednego bufora wierzchołków.
+    # Wymaga, żeby (n - 1) dzieliło się przez krok (np. n = 2^k + 1).
+    m = (n - 1) // krok + 1
+    wiersz, kolumna = np.divmod(indeksy_trojkatow(m).astype(np.int64), m)
+    indeksy = wiersz * krok * n + kolumna * krok
+
+    typ = np.uint16 if n * n <= 65536 else np.uint32
+    return indeksy.astype(typ)
+
+
+class Siatka:
+    # Siatka indeksowana: każdy wierzchołek siatki zapisany jest raz,
+    # a trójkąty (z właściwą kolejnością wierzchołków) to trójki indeksów.
+    # Z tej samej struktury korzysta tryb natychmiastowy i bufory (VBO).
+    # Normalne (do oświetlenia) są opcjonalne.
+
+    def __init__(self, pozycje, uv, indeksy, normalne=None):
+        self.pozycje = np.ascontiguousarray(pozycje, dtype=np.float32).reshape(-1, 3)
+        self.uv = np.ascontiguousarray(uv, dtype=np.float32).reshape(-1, 2)
+        self.indeksy = np.ascontiguousarray(indeksy).ravel()
+        self.normalne = None
+        if normalne is not None:
+            self.normalne = np.ascontiguousarray(normalne, dtype=np.float32).reshape(-1, 3)
+
+    @property
+    def liczba_wierzcholkow(self):
+        return len(self.pozycje)
+
+    @property
+    def liczba_trojkatow(self):
+        return self.indeksy.size // 3
+
+
+def usun_zdegenerowane(pozycje, indeksy, eps=1e-10):
+    # Usuwa trójkąty o zerowym polu: z powtórzonym wierzchołkiem albo
+    # z wierzchołkami w jednym punkcie (rzędy na biegunach jajka).
+    # Zwraca (indeksy pozostałych trójkątów, liczba usuniętych).
+    trojkaty = indeksy.reshape(-1, 3)
+    a, b, c = (pozycje[trojkaty[:, k]] for k in range(3))
+    pole = np.linalg.norm(np.cross(b - a, c - a), axis=1)
+    dobre = ((trojkaty[:, 0] != trojkaty[:, 1]) & (trojkaty[:, 1] != trojkaty[:, 2])
+             & (trojkaty[:, 0] != trojkaty[:, 2]) & (pole > eps))
+    return trojkaty[dobre].ravel(), int(len(trojkaty) - dobre.sum())
+
+
+def oczysc_siatke(siatka):
+    # Usuwa zdegenerowane trójkąty. Wierzchołków nie spawamy: w siatce jajka
+    # te same pozycje mają tylko wierzchołki szwu tekstury i biegunów, a te
+    # różnią się współrzędnymi tekstury - połączone rozmazałyby teksturę.
+    # Zwraca (nowa Siatka, raport z liczbą trójkątów przed i po).
+    indeksy, usuniete = usun_zdegenerowane(siatka.pozycje, siatka.indeksy)
+
+    typ = np.uint16 if siatka.liczba_wierzcholkow <= 65536 else np.uint32
+    wynik = Siatka(siatka.pozycje, siatka.uv, indeksy.astype(typ), siatka.normalne)
+    raport = {
+        "trojkaty": (siatka.liczba_trojkatow, wynik.liczba_trojkatow),
+        "zdegenerowane": usuniete,
+    }
+    return wynik, raport
+
+
+def zbuduj_jajko(n):
+    # Cała siatka jajka: wierzchołki, współrzędne tekstury, normalne i indeksy trójkątów
+    pozycje, uv = oblicz_siatke_jajka(n)
+    return Siatka(pozycje, uv, indeksy_trojkatow(n), oblicz_normalne_jajka(n))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# Kamera skryptów: macierz widoku (gluLookAt + obroty theta / phi myszką)
+# i rzutowania (gluPerspective) liczone w NumPy (macierze.py) i trzymane
+# w pamięci. Przeliczamy je tylko wtedy, gdy zmieni się viewer, theta, phi
+# albo rozmiar okna, a do GL trafiają jednym glLoadMatrixf - zamiast
+# glLoadIdentity + gluLookAt + glRotatef w każdej klatce.
+import numpy as np
+
+from OpenGL.GL import *
+
+from macierze import perspektywa, widok_kamery
+from shadery import ustaw_macierze
+from widocznosc import plaszczyzny_widzenia
+
+
+class Kamera:
+
+    def __init__(self, fov=70.0, aspekt=1.0, blisko=0.1, daleko=300.0,
+                 cel=(0.0, 0.0, 0.0), gora=(0.0, 1.0, 0.0)):
+        self.fov = fov
+        self.aspekt = aspekt
+        self.blisko = blisko
+        self.daleko = daleko
+        self.cel = cel
+        self.gora = gora
+
+        self._stan = None            # (viewer, theta, phi) z ostatniego ustaw()
+        self._widok = None           # None = do przeliczenia
+        self._rzutowanie = None
+        self._rzutowanie_w_gl = False
+        self._plaszczyzny = None
+        self._wersja_plaszczyzn = None
+        self.wersja = 0              # rośnie przy każdej zmianie którejś macierzy
+        self.przeliczenia = 0        # ile razy naprawdę liczyliśmy macierze
+        self._wersje_w_programach = {}  # id programu GLSL -> wersja w jego uniformach
+
+    def ustaw(self, viewer, theta=0.0, phi=0.0):
+        # Wołane co klatkę z bieżącym stanem skryptu. viewer bywa listą
+        # zmienianą w miejscu (np. kółkiem myszy), więc porównujemy wartości.
+        stan = (tuple(viewer), theta, phi)
+        if stan != self._stan:
+            self._stan = stan
+            self._widok = None
+            self.wersja += 1
+
+    def ustaw_rzutowanie(self, fov=None, aspekt=None, blisko=None, daleko=None):
+        nowe = (fov if fov is not None else self.fov,
+                aspekt if aspekt is not None else self.aspekt,
+                blisko if blisko is not None else self.blisko,
+                daleko if daleko is not None else self.daleko)
+        if self._rzutowanie is None or nowe != (self.fov, self.aspekt, self.blisko, self.daleko):
+            self.fov, self.aspekt, self.blisko, self.daleko = nowe
+            self._rzutowanie = None
+            self._rzutowanie_w_gl = False
+            self.wersja += 1
+
+    @property
+    def widok(self):
+        # gluLookAt(viewer, cel, gora), potem glRotatef(theta, Y), glRotatef(phi, X)
+        if self._widok is None:
+            viewer, theta, phi = self._stan
+            self._widok = widok_kamery(viewer, theta, phi, self.cel, self.gora)
+            # GL chce macierzy w kolejności kolumn
+            self._widok_gl = np.ascontiguousarray(self._widok.T)
+            self.przeliczenia += 1
+        return self._widok
+
+    @property
+    def rzutowanie(self):
+        if self._rzutowanie is None:
+            self._rzutowanie = perspektywa(self.fov, self.aspekt, self.blisko, self.daleko)
+            self._rzutowanie_gl = np.ascontiguousarray(self._rzutowanie.T)
+            self.przeliczenia += 1
+        return self._rzutowanie
+
+    @property
+    def plaszczyzny(self):
+        # Płaszczyzny bryły widzenia (widocznosc.py) dla bieżących macierzy
+        if self._wersja_plaszczyzn != self.wersja:
+            self._plaszczyzny = plaszczyzny_widzenia(self.rzutowanie @ self.widok)
+            self._wersja_plaszczyzn = self.wersja
+        return self._plaszczyzny
+
+    def zaladuj(self):
+        # Potok stały: rzutowanie tylko po zmianie, widok jednym wywołaniem.
+        # Zostawia aktywną macierz GL_MODELVIEW.
+        if not self._rzutowanie_w_gl:
+            self.rzutowanie
+            glMatrixMode(GL_PROJECTION)
+            glLoadMatrixf(self._rzutowanie_gl)
+            glMatrixMode(GL_MODELVIEW)
+            self._rzutowanie_w_gl = True
+        self.widok
+        glLoadMatrixf(self._widok_gl)
+
+    def zaladuj_do(self, program):
+        # Shader: uniformy zostają w programie, więc wysyłamy je tylko po zmianie
+        if self._wersje_w_programach.get(program.id) != self.wersja:
+            ustaw_macierze(program, self.rzutowanie, self.widok)
+            self._wersje_w_programach[program.id] = self.wersja
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# Kompresuje tekstury do plików .dxt1 (bloki S3TC DXT1 z pełnym łańcuchem
+# mipmap), które tekstury_gl wysyła przez glCompressedTexImage2D przy
+# TEKSTURY_FORMAT=dxt1. Plik .dxt1 ląduje obok źródłowej tekstury.
+# Na koniec wypisuje, ile bajtów na karcie oszczędza każdy format.
+#
+# Użycie: python3 kompresuj_tekstury.py [plik.tga ...]   (domyślnie tekstury/*.tga)
+import os
+import sys
+import glob
+
+from formaty_tekstur import kompresuj_dxt1, zapisz_dxt1, rozmiar_w_gl
+from tekstury_gl import wczytaj_piksele, piramida_mipmap
+
+
+def main():
+    pliki = sys.argv[1:] or sorted(glob.glob("tekstury/*.tga"))
+
+    print(f"{'plik':<24} {'rgb':>9} {'565':>9} {'dxt1':>9} {'oszczędność 565/dxt1':>22}")
+    suma = {"rgb": 0, "565": 0, "dxt1": 0}
+    for plik in pliki:
+        piksele = wczytaj_piksele(plik)
+        wysokosc, szerokosc = piksele.shape[:2]
+
+        poziomy = [piksele] + piramida_mipmap(piksele)
+        zapisz_dxt1(os.path.splitext(plik)[0] + ".dxt1", szerokosc, wysokosc,
+                    [kompresuj_dxt1(obraz) for obraz in poziomy])
+
+        # Rozmiary z całym łańcuchem mipmap
+        rozmiary = {format: sum(rozmiar_w_gl(obraz.shape[1], obraz.shape[0], format)
+                                for obraz in poziomy)
+                    for format in suma}
+        for format in suma:
+            suma[format] += rozmiary[format]
+
+        print(f"{plik:<24} {rozmiary['rgb']:>9} {rozmiary['565']:>9} {rozmiary['dxt1']:>9} "
+              f"{rozmiary['rgb'] - rozmiary['565']:>10} / {rozmiary['rgb'] - rozmiary['dxt1']:>9}")
+
+    print(f"{'razem':<24} {suma['rgb']:>9} {suma['565']:>9} {suma['dxt1']:>9} "
+          f"{suma['rgb'] - suma['565']:>10} / {suma['rgb'] - suma['dxt1']:>9}")
+
+
+if __name__ == '__main__':
+    main()
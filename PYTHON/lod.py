@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# Poziomy szczegółowości (LOD) jajka: jeden bufor wierzchołków z gęstą
+# siatką MAKS_N x MAKS_N i osobny bufor indeksów dla każdego poziomu
+# (co 2., 4., 8. ... wiersz i kolumna, patrz jajko.indeksy_podsiatki).
+# Co klatkę wybieramy poziom z wielkości jajka na ekranie, więc z daleka
+# rysujemy kilkaset trójkątów, a z bliska - nawet 2 miliony.
+import math
+import numpy as np
+
+from OpenGL.GL import *
+
+from bufory import SiatkaVBO, TYPY_INDEKSOW
+from jajko import zbuduj_jajko, indeksy_podsiatki, usun_zdegenerowane
+
+# Najgęstsza siatka musi mieć 2^k + 1 punktów, żeby rzadsze poziomy trafiały
+# w jej wierzchołki. MIN_N to najrzadszy poziom.
+MAKS_N = 1025
+MIN_N = 17
+
+# Docelowa długość krawędzi trójkąta na ekranie
+PIKSELE_NA_KRAWEDZ = 6.0
+
+
+def rozmiar_na_ekranie(promien, odleglosc, fov, wysokosc_px):
+    # Przybliżona średnica (w pikselach) kuli o danym promieniu widzianej
+    # z danej odległości przy pionowym kącie widzenia fov (w stopniach)
+    if odleglosc <= promien:
+        return math.inf
+    return promien / (odleglosc * math.tan(math.radians(fov) / 2)) * wysokosc_px
+
+
+class SiatkaLOD(SiatkaVBO):
+    # SiatkaVBO z kilkoma buforami indeksów. wybierz() podpina bufor
+    # właściwego poziomu, a rysuj() (z SiatkaVBO) rysuje go jednym
+    # glDrawElements - pozycje i współrzędne tekstury są wspólne.
+
+    def __init__(self, siatka, n, min_n=MIN_N):
+        super().__init__(siatka)
+        self.promien = float(np.linalg.norm(siatka.pozycje, axis=1).max())
+
+        # Poziomy od najgęstszego: (N poziomu, bufor indeksów, liczba indeksów, typ)
+        self.poziomy = [(n, self.ibo, self.liczba_indeksow, self.typ_indeksow)]
+        krok = 2
+        while (n - 1) % krok == 0 and (n - 1) // krok + 1 >= min_n:
+            indeksy, _ = usun_zdegenerowane(siatka.pozycje, indeksy_podsiatki(n, krok))
+            ibo = glGenBuffers(1)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indeksy.nbytes, indeksy, GL_STATIC_DRAW)
+            self.poziomy.append(((n - 1) // krok + 1, ibo, indeksy.size, TYPY_INDEKSOW[indeksy.dtype]))
+            krok *= 2
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        self.aktywny = 0
+
+    @property
+    def n(self):
+        return self.poziomy[self.aktywny][0]
+
+    def ustaw_poziom(self, poziom):
+        self.aktywny = poziom
+        _, self.ibo, self.liczba_indeksow, self.typ_indeksow = self.poziomy[poziom]
+
+    def wybierz(self, odleglosc, wysokosc_px, fov=70.0):
+        # Najrzadszy poziom, przy którym krawędź trójkąta ma na ekranie
+        # najwyżej PIKSELE_NA_KRAWEDZ (obwód jajka ~ pi * średnica).
+        # Zwraca N wybranego poziomu.
+        potrzebne_n = rozmiar_na_ekranie(self.promien, odleglosc, fov, wysokosc_px) * math.pi / PIKSELE_NA_KRAWEDZ
+        poziom = 0
+        while poziom + 1 < len(self.poziomy) and self.poziomy[poziom + 1][0] >= potrzebne_n:
+            poziom += 1
+        if poziom != self.aktywny:
+            self.ustaw_poziom(poziom)
+        return self.n
+
+    def usun(self):
+        self.ustaw_poziom(0)
+        glDeleteBuffers(len(self.poziomy) - 1, [ibo for _, ibo, _, _ in self.poziomy[1:]])
+        super().usun()
+
+
+def zbuduj_jajko_lod(maks_n=MAKS_N, min_n=MIN_N):
+    # Bez trójkątów o zerowym polu na biegunach. Wierzchołków nie spawamy -
+    # rzadsze poziomy adresują je po położeniu w siatce maks_n x maks_n.
+    siatka = zbuduj_jajko(maks_n)
+    siatka.indeksy, _ = usun_zdegenerowane(siatka.pozycje, siatka.indeksy)
+    return SiatkaLOD(siatka, maks_n, min_n)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# Macierze 4x4 w NumPy odpowiadające wywołaniom z potoku stałego
+# (gluPerspective, gluLookAt, glRotatef, glTranslatef, glScalef) - do
+# liczenia MVP raz na klatkę i wysyłania jej do shadera jednym uniformem.
+# Konwencja jak w OpenGL: wektory kolumnowe, macierz * punkt. Tablice są
+# w kolejności wierszy, więc do glUniformMatrix4fv idą z transpose=GL_TRUE.
+import math
+import numpy as np
+
+
+def jednostkowa():
+    return np.identity(4, dtype=np.float32)
+
+
+def perspektywa(fov, aspekt, blisko, daleko):
+    # Jak gluPerspective: fov to pionowy kąt widzenia w stopniach
+    f = 1.0 / math.tan(math.radians(fov) / 2)
+    m = np.zeros((4, 4), dtype=np.float32)
+    m[0, 0] = f / aspekt
+    m[1, 1] = f
+    m[2, 2] = (daleko + blisko) / (blisko - daleko)
+    m[2, 3] = 2 * daleko * blisko / (blisko - daleko)
+    m[3, 2] = -1.0
+    return m
+
+
+def patrz_na(oko, cel, gora):
+    # Jak gluLookAt
+    oko = np.asarray(oko, dtype=np.float32)
+    przod = np.asarray(cel, dtype=np.float32) - oko
+    przod /= np.linalg.norm(przod)
+    prawo = np.cross(przod, np.asarray(gora, dtype=np.float32))
+    prawo /= np.linalg.norm(prawo)
+    gora = np.cross(prawo, przod)
+
+    m = jednostkowa()
+    m[0, :3] = prawo
+    m[1, :3] = gora
+    m[2, :3] = -przod
+    m[:3, 3] = -m[:3, :3] @ oko
+    return m
+
+
+def widok_kamery(viewer, theta=0.0, phi=0.0, cel=(0.0, 0.0, 0.0), gora=(0.0, 1.0, 0.0)):
+    # Widok skryptów laboratorium: gluLookAt(viewer, cel, gora), potem
+    # glRotatef(theta, 0, 1, 0) i glRotatef(phi, 1, 0, 0)
+    widok = patrz_na(viewer, cel, gora)
+    if theta:
+        widok = widok @ obrot(theta, 0.0, 1.0, 0.0)
+    if phi:
+        widok = widok @ obrot(phi, 1.0, 0.0, 0.0)
+    return widok
+
+
+def obrot(kat, x, y, z):
+    # Jak glRotatef: kąt w stopniach wokół osi (x, y, z)
+    os_ = np.array([x, y, z], dtype=np.float64)
+    x, y, z = os_ / np.linalg.norm(os_)
+    c = math.cos(math.radians(kat))
+    s = math.sin(math.radians(kat))
+    m = jednostkowa()
+    m[:3, :3] = [
+        [x * x * (1 - c) + c, x * y * (1 - c) - z * s, x * z * (1 - c) + y * s],
+        [y * x * (1 - c) + z * s, y * y * (1 - c) + c, y * z * (1 - c) - x * s],
+        [z * x * (1 - c) - y * s, z * y * (1 - c) + x * s, z * z * (1 - c) + c],
+    ]
+    return m
+
+
+def przesuniecie(x, y, z):
+    m = jednostkowa()
+    m[:3, 3] = [x, y, z]
+    return m
+
+
+def skala(x, y, z):
+    return np.diag(np.array([x, y, z, 1.0], dtype=np.float32))
+
+
+def macierz_normalnych(model_widok):
+    # Odwrotność transpozycji lewej górnej części 3x3 - przekształca normalne
+    # także przy nierównomiernym skalowaniu
+    return np.linalg.inv(model_widok[:3, :3]).T.astype(np.float32)
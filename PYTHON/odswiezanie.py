@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# Rysowanie na żądanie: zamiast render() + glfwSwapBuffers co odświeżenie
+# ekranu pętla główna śpi w glfwWaitEvents, dopóki zdarzenie (klawisz,
+# przycisk i kółko myszy, zmiana rozmiaru, odsłonięcie okna) nie zmieni
+# sceny. Bezczynne okno prawie nie zużywa procesora - ma to znaczenie, gdy
+# na jednej maszynie działa wiele przeglądarek naraz.
+#
+# W skrypcie (opcje z linii poleceń):
+#   --na-zadanie          rysuje tylko po zmianie sceny
+#   --odswiez-co SEKUNDY  i dodatkowo co najmniej raz na tyle sekund
+#                         (glfwWaitEventsTimeout, np. dla tekstur z tła)
+import sys
+
+from glfw.GLFW import *
+
+
+class Odswiezanie:
+
+    def __init__(self, na_zadanie=False, okres=None):
+        self.na_zadanie = na_zadanie
+        self.okres = okres
+        self.brudne = True    # pierwsza klatka zawsze
+        self.uspienia = 0     # ile razy pętla zasnęła zamiast rysować
+
+    @classmethod
+    def z_argumentow(cls, okno=None, argv=None):
+        argv = sys.argv if argv is None else argv
+        okres = None
+        if "--odswiez-co" in argv:
+            okres = float(argv[argv.index("--odswiez-co") + 1])
+        odswiezanie = cls(na_zadanie="--na-zadanie" in argv or okres is not None, okres=okres)
+        if okno is not None and odswiezanie.na_zadanie:
+            # Okno odsłonięte / uszkodzone przez system - trzeba je przerysować
+            glfwSetWindowRefreshCallback(okno, lambda okno: odswiezanie.oznacz())
+        return odswiezanie
+
+    def oznacz(self):
+        # Wołane z callbacków, które zmieniają scenę
+        self.brudne = True
+
+    def czekaj(self, okno, animacja=False):
+        # Wołane po klatce. W trybie ciągłym nie robi nic. Na żądanie śpi,
+        # dopóki scena nie będzie brudna; animacja=True (np. obrót przy
+        # wciśniętym przycisku myszy) oznacza rysowanie co klatkę jak dotąd.
+        # Zwraca True, jeśli pętla spała - ten czas nie należy do klatki.
+        if not self.na_zadanie:
+            return False
+        if animacja:
+            self.brudne = False
+            return False
+
+        spala = False
+        if self.okres is not None:
+            termin = glfwGetTime() + self.okres
+        while not self.brudne and not glfwWindowShouldClose(okno):
+            if self.okres is None:
+                glfwWaitEvents()
+            else:
+                # Zdarzenia bez zmiany sceny (np. ruch myszy) nie przesuwają terminu
+                zostalo = termin - glfwGetTime()
+                if zostalo <= 0:
+                    break
+                glfwWaitEventsTimeout(zostalo)
+            spala = True
+        if spala:
+            self.uspienia += 1
+        self.brudne = False
+        return spala
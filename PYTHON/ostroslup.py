@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+from glfw.GLFW import *
+from OpenGL.GL import *
+
+from bufory import ListyWyswietlania
+from silnik import Scena
+from widocznosc import sfera_otaczajaca
+from siatka_ostroslupa import POZYCJE, SIATKI
+
+# Sfera otaczająca ostrosłupa (Scena.widoczna)
+SFERA = sfera_otaczajaca(POZYCJE)
+
+
+def rysuj_ostroslup(show_front_wall):
+    # Tryb natychmiastowy: każdy wierzchołek osobnym glVertex3fv
+    siatka = SIATKI[show_front_wall]
+
+    glBegin(GL_TRIANGLES)
+    for k in siatka.indeksy:
+        glTexCoord2fv(siatka.uv[k])
+        glVertex3fv(siatka.pozycje[k])
+    glEnd()
+
+
+class ScenaOstroslupa(Scena):
+    # Wspólna scena zad3.5 - zad4.5: ostrosłup z teksturą, [H] chowa ścianę
+    # przednią, [B] przełącza listy wyświetlania / tryb natychmiastowy
+    tekstura = None  # plik jedynej tekstury; None - podklasa wczytuje własne
+
+    def __init__(self):
+        super().__init__()
+        self.show_front_wall = True
+
+        # Geometria nagrana w listach wyświetlania; [B] przełącza na tryb natychmiastowy
+        self.ostroslup = None
+        self.UZYJ_LIST = True
+
+    def startup(self):
+        super().startup()
+        if self.tekstura is not None:
+            self.load_texture(self.tekstura)
+        self.ostroslup = ListyWyswietlania(rysuj_ostroslup)
+        self.sfera = SFERA
+
+    def shutdown(self):
+        super().shutdown()
+        self.ostroslup.usun()
+
+    def rysuj(self):
+        # Ostrosłup z listy wyświetlania - nagrywany raz dla każdego stanu
+        # ściany przedniej, potem co klatkę tylko glCallList
+        if self.UZYJ_LIST:
+            self.ostroslup.wywolaj(self.show_front_wall)
+        else:
+            rysuj_ostroslup(self.show_front_wall)
+
+    def klawisz(self, key):
+        # Klawisz H - przełączanie widoczności ściany
+        if key == GLFW_KEY_H:
+            self.show_front_wall = not self.show_front_wall
+            print(f"Ściana widoczna: {self.show_front_wall}")
+
+        # Przełączanie ścieżki rysowania [B]: listy wyświetlania / tryb natychmiastowy
+        if key == GLFW_KEY_B:
+            self.UZYJ_LIST = not self.UZYJ_LIST
+            print(f"Rysowanie z list wyświetlania: {self.UZYJ_LIST}")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Oświetlenie z lab6: materiał, źródło GL_LIGHT0 z tłumieniem z odległością.
+# Wspólne dla lab6.py i jajka z zad5.0 (normalne z jajko.oblicz_normalne_jajka).
+from OpenGL.GL import *
+
+mat_ambient = [1.0, 1.0, 1.0, 1.0]
+mat_diffuse = [1.0, 1.0, 1.0, 1.0]
+mat_specular = [1.0, 1.0, 1.0, 1.0]
+mat_shininess = 20.0
+
+light_ambient = [0.1, 0.1, 0.0, 1.0]
+light_diffuse = [0.8, 0.8, 0.0, 1.0]
+light_specular = [1.0, 1.0, 1.0, 1.0]
+light_position = [0.0, 0.0, 10.0, 1.0]
+
+att_constant = 1.0
+att_linear = 0.05
+att_quadratic = 0.001
+
+# Domyślne światło otoczenia sceny (GL_LIGHT_MODEL_AMBIENT)
+scene_ambient = [0.2, 0.2, 0.2, 1.0]
+
+
+def ustaw_oswietlenie(dwustronne=False):
+    # Pozycja światła jest przeliczana przez bieżącą macierz MODELVIEW -
+    # wołamy przy macierzy jednostkowej, więc światło stoi w układzie kamery.
+    # dwustronne: tylne ściany dostają ten sam materiał i odwróconą normalną
+    # (GL_LIGHT_MODEL_TWO_SIDE) - dla scen, w których widać tylne ściany.
+    strony = GL_FRONT_AND_BACK if dwustronne else GL_FRONT
+    glMaterialfv(strony, GL_AMBIENT, mat_ambient)
+    glMaterialfv(strony, GL_DIFFUSE, mat_diffuse)
+    glMaterialfv(strony, GL_SPECULAR, mat_specular)
+    glMaterialf(strony, GL_SHININESS, mat_shininess)
+    glLightModeli(GL_LIGHT_MODEL_TWO_SIDE, GL_TRUE if dwustronne else GL_FALSE)
+
+    glLightfv(GL_LIGHT0, GL_AMBIENT, light_ambient)
+    glLightfv(GL_LIGHT0, GL_DIFFUSE, light_diffuse)
+    glLightfv(GL_LIGHT0, GL_SPECULAR, light_specular)
+    glLightfv(GL_LIGHT0, GL_POSITION, light_position)
+
+    glLightf(GL_LIGHT0, GL_CONSTANT_ATTENUATION, att_constant)
+    glLightf(GL_LIGHT0, GL_LINEAR_ATTENUATION, att_linear)
+    glLightf(GL_LIGHT0, GL_QUADRATIC_ATTENUATION, att_quadratic)
+
+    glShadeModel(GL_SMOOTH)
+    glEnable(GL_LIGHTING)
+    glEnable(GL_LIGHT0)
+
+
+def ustaw_uniformy_oswietlenia(program, dwustronne=False):
+    # To samo oświetlenie dla shadera (shadery.program_phong). Uniformy
+    # zostają w programie, więc wysyłamy je raz, a nie co klatkę.
+    program.uzyj()
+    program.ustaw("u_ambient_sceny", scene_ambient)
+    program.ustaw("u_mat_ambient", mat_ambient)
+    program.ustaw("u_mat_diffuse", mat_diffuse)
+    program.ustaw("u_mat_specular", mat_specular)
+    program.ustaw("u_mat_shininess", mat_shininess)
+    program.ustaw("u_light_ambient", light_ambient)
+    program.ustaw("u_light_diffuse", light_diffuse)
+    program.ustaw("u_light_specular", light_specular)
+    program.ustaw("u_light_position", light_position)
+    program.ustaw("u_tlumienie", [att_constant, att_linear, att_quadratic])
+    program.ustaw("u_oswietlenie", True)
+    program.ustaw("u_dwustronne", dwustronne)
+    program.ustaw("u_teksturowanie", True)
+    program.ustaw("u_tekstura", 0)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# Pomiar czasu klatki w pętli głównej GLFW: czasy faz (zdarzenia, render,
+# wysłanie geometrii, swap) w buforze cyklicznym, liczba wywołań GL na
+# klatkę, obiekty wysłane do GL i odrzucone poza bryłą widzenia
+# (widocznosc.py), HUD w konsoli i tytule okna (FPS, p50/p99, najdłuższa
+# klatka) oraz zapis do CSV/JSON.
+#
+# W skrypcie (opcje z linii poleceń):
+#   --profil              HUD co sekundę i liczenie wywołań GL
+#   --profil-zapis PLIK   po zamknięciu okna zapis klatek do PLIK (.csv albo .json)
+import os
+import sys
+import csv
+import json
+import time
+import numpy as np
+
+# Kolumny bufora: czas całej klatki, fazy, liczba wywołań GL, obiekty
+# wysłane do GL i odrzucone. "geometria" to część fazy "render" (samo
+# wysłanie siatki), nie osobny czas.
+FAZY = ("zdarzenia", "render", "geometria", "swap")
+KOLUMNY = (("klatka_ms",) + tuple(f"{faza}_ms" for faza in FAZY)
+           + ("wywolania_gl", "obiekty_wyslane", "obiekty_odrzucone"))
+CZASY = 1 + len(FAZY)  # kolumny z czasami (na początku)
+WYWOLANIA, WYSLANE, ODRZUCONE = CZASY, CZASY + 1, CZASY + 2
+
+ROZMIAR_BUFORA = 1024
+OKRES_HUD = 1.0  # sekundy
+
+
+class _Faza:
+    # Kontekst `with profiler.faza(...)` - jeden obiekt na fazę, bez alokacji co klatkę
+
+    def __init__(self, profiler, kolumna):
+        self.profiler = profiler
+        self.kolumna = kolumna
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *wyjatek):
+        self.profiler.biezaca[self.kolumna] += time.perf_counter() - self.start
+
+
+class Profiler:
+
+    def __init__(self, rozmiar=ROZMIAR_BUFORA, hud=False, okno=None):
+        self.bufor = np.zeros((rozmiar, len(KOLUMNY)), dtype=np.float64)
+        self.biezaca = np.zeros(len(KOLUMNY), dtype=np.float64)
+        self.klatki = 0
+        self.hud = hud
+        self.okno = okno
+        self.tytul = None
+        self.plik_zapisu = None
+        self.wywolania_gl = 0
+        self._fazy = {faza: _Faza(self, 1 + i) for i, faza in enumerate(FAZY)}
+        self._oryginaly = []
+        self._poczatek_klatki = time.perf_counter()
+        self._ostatni_hud = self._poczatek_klatki
+
+    @classmethod
+    def z_argumentow(cls, okno=None, argv=None):
+        # Profiler skonfigurowany opcjami --profil / --profil-zapis. Bez nich
+        # czasy faz i tak są zbierane (kilka perf_counter na klatkę), ale bez
+        # HUD i bez podmieniania funkcji GL.
+        argv = sys.argv if argv is None else argv
+        profiler = cls(hud="--profil" in argv, okno=okno)
+        if "--profil-zapis" in argv:
+            profiler.plik_zapisu = argv[argv.index("--profil-zapis") + 1]
+        if profiler.hud:
+            profiler.licz_wywolania_gl()
+        return profiler
+
+    def faza(self, nazwa):
+        return self._fazy[nazwa]
+
+    def koniec_klatki(self):
+        teraz = time.perf_counter()
+        self.biezaca[0] = teraz - self._poczatek_klatki
+        self.biezaca[WYWOLANIA] = self.wywolania_gl
+        self.bufor[self.klatki % len(self.bufor)] = self.biezaca
+        self.klatki += 1
+
+        self.biezaca[:] = 0.0
+        self.wywolania_gl = 0
+        self._poczatek_klatki = teraz
+
+        if self.hud and teraz - self._ostatni_hud >= OKRES_HUD:
+            self._ostatni_hud = teraz
+            self.pokaz_hud()
+
+    def obiekty(self, wyslane, odrzucone):
+        # Wołane przez scenę po odrzucaniu obiektów poza bryłą widzenia
+        self.biezaca[WYSLANE] += wyslane
+        self.biezaca[ODRZUCONE] += odrzucone
+
+    def wznow(self):
+        # Po uśpieniu pętli (rysowanie na żądanie, odswiezanie.py): czas
+        # bezczynności nie wlicza się do następnej klatki
+        self._poczatek_klatki = time.perf_counter()
+
+    def zapisane(self):
+        # Zapisane klatki od najstarszej; czasy w milisekundach
+        if self.klatki <= len(self.bufor):
+            dane = self.bufor[:self.klatki]
+        else:
+            poczatek = self.klatki % len(self.bufor)
+            dane = np.concatenate([self.bufor[poczatek:], self.bufor[:poczatek]])
+        dane = dane.copy()
+        dane[:, :CZASY] *= 1000.0
+        return dane
+
+    def podsumowanie(self):
+        dane = self.zapisane()
+        if len(dane) == 0:
+            return {}
+        klatka = dane[:, 0]
+        wynik = {
+            "klatki": len(dane),
+            "fps": 1000.0 / klatka.mean() if klatka.mean() > 0 else 0.0,
+            "p50_ms": float(np.percentile(klatka, 50)),
+            "p99_ms": float(np.percentile(klatka, 99)),
+            "max_ms": float(klatka.max()),
+            "wywolania_gl": float(dane[:, WYWOLANIA].mean()),
+            "obiekty_wyslane": float(dane[:, WYSLANE].mean()),
+            "obiekty_odrzucone": float(dane[:, ODRZUCONE].mean()),
+        }
+        for i, faza in enumerate(FAZY):
+            wynik[f"{faza}_ms"] = float(dane[:, 1 + i].mean())
+        return wynik
+
+    def pokaz_hud(self):
+        p = self.podsumowanie()
+        tekst = (f"{p['fps']:.1f} FPS | p50 {p['p50_ms']:.2f} ms | p99 {p['p99_ms']:.2f} ms | "
+                 f"max {p['max_ms']:.2f} ms | "
+                 + " ".join(f"{faza} {p[faza + '_ms']:.2f}" for faza in FAZY)
+                 + f" | GL {p['wywolania_gl']:.0f}/klatkę")
+        if p["obiekty_wyslane"] or p["obiekty_odrzucone"]:
+            tekst += f" | obiekty {p['obiekty_wyslane']:.0f} wysłane, {p['obiekty_odrzucone']:.0f} odrzucone"
+        print(tekst)
+        if self.okno is not None:
+            from glfw.GLFW import glfwSetWindowTitle
+            if self.tytul is None:
+                self.tytul = os.path.basename(sys.argv[0])
+            glfwSetWindowTitle(self.okno, f"{self.tytul} - {tekst}")
+
+    def zapisz(self, plik):
+        dane = self.zapisane()
+        if plik.endswith(".json"):
+            with open(plik, "w", encoding="utf-8") as f:
+                json.dump({"kolumny": KOLUMNY, "podsumowanie": self.podsumowanie(),
+                           "klatki": dane.tolist()}, f, indent=1)
+        else:
+            with open(plik, "w", newline="") as f:
+                zapis = csv.writer(f)
+                zapis.writerow(KOLUMNY)
+                zapis.writerows(dane.round(4).tolist())
+
+    def licz_wywolania_gl(self, moduly=None):
+        # Podmienia funkcje gl*/glu* w globalnych nazwach modułów na wersje
+        # liczące wywołania. Domyślnie: wszystkie wczytane moduły z katalogu
+        # laboratorium (skrypty robią "from OpenGL.GL import *"). Funkcje
+        # nagrane w listach wyświetlania liczą się raz, przy nagrywaniu -
+        # co klatkę widać tylko glCallList, tak jak widzi to sterownik.
+        if moduly is None:
+            katalog = os.path.dirname(os.path.abspath(__file__))
+            moduly = [m for m in list(sys.modules.values())
+                      if os.path.dirname(os.path.abspath(getattr(m, "__file__", None) or "/")) == katalog]
+
+        for modul in moduly:
+            nazwy = vars(modul)
+            for nazwa, funkcja in list(nazwy.items()):
+                if nazwa.startswith("gl") and not nazwa.startswith("glfw") and callable(funkcja):
+                    self._oryginaly.append((nazwy, nazwa, funkcja))
+                    nazwy[nazwa] = self._licznik(funkcja)
+
+    def _licznik(self, funkcja):
+        def opakowanie(*args, **kwargs):
+            self.wywolania_gl += 1
+            return funkcja(*args, **kwargs)
+        return opakowanie
+
+    def zakoncz(self):
+        for nazwy, nazwa, funkcja in self._oryginaly:
+            nazwy[nazwa] = funkcja
+        self._oryginaly = []
+
+        if self.plik_zapisu:
+            self.zapisz(self.plik_zapisu)
+            print(f"Profil {self.klatki} klatek zapisany do {self.plik_zapisu}")
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# Programowy rasteryzator w czystym NumPy: obraz jajka (zad5.0) i ostrosłupa
+# (zad3.5) bez karty graficznej i bez OpenGL - np. na maszynach CI, gdzie
+# nie ma żadnego sterownika GL. Liczy to samo co potok skryptów: wierzchołki
+# przez macierz rzutowanie @ widok (macierze.py), obcięcie płaszczyzną bliską,
+# odrzucanie ścian (glCullFace), bufor głębokości (GL_LESS) i dwuliniowe
+# próbkowanie tekstury (GL_LINEAR, GL_REPEAT) z poprawką perspektywy.
+#
+# Trójkąty idą paczkami, bez pętli po pikselach: dla wszystkich wierszy
+# pikseli trójkątów z paczki naraz liczymy odcinek wewnątrz trójkąta (z trzech
+# krawędzi), z odcinków - fragmenty z głębokością, test głębokości w tablicach.
+# Z kilku fragmentów jednego piksela wygrywa najbliższy (przy równej głębokości
+# - wcześniejszy trójkąt, jak w GL), a teksturę próbkujemy tylko dla zwycięzców.
+#
+# Obraz jest wzorcem dla wyniku GL: --porownaj rysuje tę samą klatkę skryptem
+# przez bez_okna.py i wypisuje różnice.
+#
+# Użycie: python3 rasteryzator.py [jajko|ostroslup] [--rozmiar 600x600]
+#             [--theta KĄT] [--phi KĄT] [--zapisz PLIK.png] [--porownaj]
+import os
+import sys
+import time
+import argparse
+import numpy as np
+from PIL import Image
+
+from jajko import zbuduj_jajko, oczysc_siatke
+from siatka_ostroslupa import SIATKI
+from macierze import perspektywa, widok_kamery
+from tga import wczytaj_tga
+
+# Ile pikseli (z prostokątów otaczających trójkątów) rysujemy najwyżej w jednej paczce
+PIKSELE_W_PACZCE = 1 << 19
+
+# Rzutowanie jak w kamera.Kamera
+FOV, BLISKO, DALEKO = 70.0, 0.1, 300.0
+
+# Sceny skryptów: (skrypt, tekstura, viewer, odrzucane ściany, kwadratowy viewport)
+SCENY = {
+    "jajko": ("zad5.0.py", "tekstury/P1_t.tga", (0.0, 0.0, 15.0), "przod", False),
+    "ostroslup": ("zad3.5.py", "tekstura.tga", (0.0, 0.0, 10.0), "tyl", True),
+}
+
+# Gęstość siatki jajka jak w zad5.0
+N_JAJKA = 50
+
+
+def wczytaj_teksture(plik):
+    # Piksele (wysokość, szerokość, 4) uint8, pierwszy wiersz = dół obrazka
+    # (v = 0), jak tekstury_gl.wczytaj_piksele - ale bez importu OpenGL.
+    # Czwarty bajt (alfa = 255) dopełnia teksel do jednej liczby uint32.
+    try:
+        piksele = wczytaj_tga(plik)
+    except ValueError:
+        obraz = Image.open(plik).convert("RGB")
+        dane = obraz.tobytes("raw", "RGB", 0, -1)
+        piksele = np.frombuffer(dane, dtype=np.uint8).reshape(obraz.height, obraz.width, 3)
+    tekstura = np.full(piksele.shape[:2] + (4,), 255, dtype=np.uint8)
+    tekstura[:, :, :3] = piksele
+    return tekstura
+
+
+def probkuj(tekstura, u, v):
+    # Filtrowanie dwuliniowe (GL_LINEAR) z powtarzaniem (GL_REPEAT): cztery
+    # najbliższe teksele ważone odległością od środka próbki. Zwraca (n, 4) float32.
+    wysokosc, szerokosc = tekstura.shape[:2]
+    x = u * szerokosc - 0.5
+    y = v * wysokosc - 0.5
+    x0 = np.floor(x)
+    y0 = np.floor(y)
+    fx = (x - x0).astype(np.float32)[:, None]
+    fy = (y - y0).astype(np.float32)[:, None]
+    x0 = x0.astype(np.int64) % szerokosc
+    y0 = y0.astype(np.int64) % wysokosc
+    x1 = (x0 + 1) % szerokosc
+    y1 = (y0 + 1) % wysokosc
+
+    # Teksele jako uint32 - cztery na próbkę jednym np.take z tablicy 1D
+    teksele = np.ascontiguousarray(tekstura).view(np.uint32).ravel()
+    probki = np.take(teksele, np.concatenate([
+        y0 * szerokosc + x0, y0 * szerokosc + x1, y1 * szerokosc + x0, y1 * szerokosc + x1]))
+    t00, t10, t01, t11 = probki.view(np.uint8).reshape(4, -1, 4).astype(np.float32)
+    dolne = t00 + (t10 - t00) * fx
+    gorne = t01 + (t11 - t01) * fx
+    return dolne + (gorne - dolne) * fy
+
+
+def _przestaw(tablica, pierwszy):
+    # Wierzchołki każdego trójkąta przesunięte cyklicznie tak, żeby pierwszy[i]
+    # był na początku - kolejność obiegu (i strona ściany) się nie zmienia
+    kolejnosc = (pierwszy[:, None] + np.arange(3)) % 3
+    return np.take_along_axis(tablica, kolejnosc[:, :, None], axis=1)
+
+
+def _punkt(a, b, da, db):
+    # Punkt na odcinku a-b, w którym odległość od płaszczyzny spada do zera
+    t = (da / (da - db))[:, None]
+    return a + (b - a) * t
+
+
+def obetnij_blisko(klip, uv):
+    # Obcięcie trójkątów (t, 3, 4) we współrzędnych przycięcia płaszczyzną
+    # bliską z >= -w. Trójkąt z jednym wierzchołkiem po złej stronie staje
+    # się czworokątem (dwa trójkąty), z dwoma - mniejszym trójkątem. uv są
+    # interpolowane razem z pozycją (liniowo w przestrzeni przycięcia).
+    odleglosc = klip[:, :, 2] + klip[:, :, 3]
+    w_srodku = odleglosc >= 0
+    ile = w_srodku.sum(axis=1)
+    wynik_klip = [klip[ile == 3]]
+    wynik_uv = [uv[ile == 3]]
+
+    dane = np.concatenate([klip, uv, odleglosc[:, :, None]], axis=2)
+
+    # Jeden wierzchołek w środku (na początku po przestawieniu): A, B, C -> A, AB, AC
+    jeden = dane[ile == 1]
+    if len(jeden):
+        jeden = _przestaw(jeden, np.argmax(w_srodku[ile == 1], axis=1))
+        a, b, c = jeden[:, 0], jeden[:, 1], jeden[:, 2]
+        ab = _punkt(a, b, a[:, 6], b[:, 6])
+        ac = _punkt(a, c, a[:, 6], c[:, 6])
+        trojkaty = np.stack([a, ab, ac], axis=1)
+        wynik_klip.append(trojkaty[:, :, :4])
+        wynik_uv.append(trojkaty[:, :, 4:6])
+
+    # Jeden wierzchołek na zewnątrz (na początku): O, B, C -> OB, B, C, CO
+    dwa = dane[ile == 2]
+    if len(dwa):
+        dwa = _przestaw(dwa, np.argmin(w_srodku[ile == 2], axis=1))
+        o, b, c = dwa[:, 0], dwa[:, 1], dwa[:, 2]
+        ob = _punkt(o, b, o[:, 6], b[:, 6])
+        co = _punkt(c, o, c[:, 6], o[:, 6])
+        trojkaty = np.concatenate([np.stack([ob, b, c], axis=1), np.stack([ob, c, co], axis=1)])
+        wynik_klip.append(trojkaty[:, :, :4])
+        wynik_uv.append(trojkaty[:, :, 4:6])
+
+    return np.concatenate(wynik_klip), np.concatenate(wynik_uv)
+
+
+class Rasteryzator:
+    # Bufor koloru i głębokości w pamięci. Piksele jak w GL: wiersz 0 = dół
+    # okna; obraz() odwraca je jak bez_okna.odczytaj_klatke.
+
+    def __init__(self, szerokosc, wysokosc):
+        self.szerokosc = szerokosc
+        self.wysokosc = wysokosc
+        # Piksel RGBA jako jedna liczba uint32 - zapis jednym przypisaniem 1D
+        self.kolor = np.zeros(wysokosc * szerokosc, dtype=np.uint32)
+        self.glebia = np.ones(wysokosc * szerokosc, dtype=np.float32)
+        self.obszar = (0, 0, szerokosc, wysokosc)  # glViewport
+        self.trojkaty = 0  # trójkąty narysowane w ostatnim rysuj() (po obcięciu i odrzuceniu)
+
+    def wyczysc(self, kolor=(0, 0, 0)):
+        self.kolor[:] = np.array([*kolor, 255], dtype=np.uint8).view(np.uint32)[0]
+        self.glebia[:] = 1.0
+
+    def obraz(self):
+        # (wysokość, szerokość, 3) uint8, pierwszy wiersz = góra
+        return self.kolor.view(np.uint8).reshape(self.wysokosc, self.szerokosc, 4)[::-1, :, :3]
+
+    def rysuj(self, siatka, mvp, tekstura, odrzucane="tyl"):
+        # siatka - jajko.Siatka; mvp - rzutowanie @ widok (@ model) w kolejności
+        # wierszy; tekstura - z wczytaj_teksture; odrzucane - "tyl" (GL_BACK),
+        # "przod" (GL_FRONT) albo None
+        pozycje = np.hstack([siatka.pozycje, np.ones((len(siatka.pozycje), 1), dtype=np.float32)])
+        klip = pozycje.astype(np.float64) @ np.asarray(mvp, dtype=np.float64).T
+        trojkaty = siatka.indeksy.reshape(-1, 3)
+        klip = klip[trojkaty]
+        uv = siatka.uv[trojkaty].astype(np.float64)
+
+        # Trójkąty całe poza jedną z bocznych płaszczyzn bryły od razu odpadają
+        x, y, w = klip[:, :, 0], klip[:, :, 1], klip[:, :, 3]
+        poza = ((x > w).all(axis=1) | (x < -w).all(axis=1)
+                | (y > w).all(axis=1) | (y < -w).all(axis=1))
+        klip, uv = obetnij_blisko(klip[~poza], uv[~poza])
+
+        # Współrzędne okna (piksele, y w górę) i głębokość 0-1
+        ox, oy, szerokosc, wysokosc = self.obszar
+        w = klip[:, :, 3]
+        x = ox + (klip[:, :, 0] / w + 1) * 0.5 * szerokosc
+        y = oy + (klip[:, :, 1] / w + 1) * 0.5 * wysokosc
+        z = (klip[:, :, 2] / w + 1) * 0.5
+
+        # Podwojone pole ze znakiem: > 0 - wierzchołki przeciwnie do zegara (przód)
+        pole = (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0]) - (x[:, 2] - x[:, 0]) * (y[:, 1] - y[:, 0])
+        if odrzucane == "tyl":
+            zostaja = pole > 0
+        elif odrzucane == "przod":
+            zostaja = pole < 0
+        else:
+            zostaja = pole != 0
+        x, y, z, w, uv, pole = x[zostaja], y[zostaja], z[zostaja], w[zostaja], uv[zostaja], pole[zostaja]
+        self.trojkaty = len(x)
+
+        # Wielkości interpolowane po trójkącie jako płaszczyzny na ekranie:
+        # wartość(px, py) = A * px + B * py + C. Głębokość jest liniowa na ekranie,
+        # a dla poprawki perspektywy interpolujemy 1/w i uv/w.
+        nastepny = [1, 2, 0]
+        poprzedni = [2, 0, 1]
+        wsp_x = (y[:, nastepny] - y[:, poprzedni]) / pole[:, None]
+        wsp_y = (x[:, poprzedni] - x[:, nastepny]) / pole[:, None]
+        wsp_c = (x[:, nastepny] * y[:, poprzedni] - x[:, poprzedni] * y[:, nastepny]) / pole[:, None]
+        odwrotnosc_w = 1.0 / w
+        wartosci = np.stack([z, odwrotnosc_w, uv[:, :, 0] * odwrotnosc_w, uv[:, :, 1] * odwrotnosc_w], axis=2)
+        plaszczyzna_a = (wsp_x[:, :, None] * wartosci).sum(axis=1)
+        plaszczyzna_b = (wsp_y[:, :, None] * wartosci).sum(axis=1)
+        plaszczyzna_c = (wsp_c[:, :, None] * wartosci).sum(axis=1)
+
+        # Wiersze pikseli (środki w i + 0.5) pokryte przez trójkąty, przycięte do viewportu
+        y_min = np.maximum(np.ceil(y.min(axis=1) - 0.5), oy).astype(np.int64)
+        y_max = np.minimum(np.floor(y.max(axis=1) - 0.5), oy + wysokosc - 1).astype(np.int64)
+        wiersze = np.maximum(y_max - y_min + 1, 0)
+        # Górne oszacowanie liczby pikseli - do podziału na paczki
+        szerokosci = np.maximum(np.ceil(x.max(axis=1) - x.min(axis=1)) + 1, 0)
+        narastajaco = np.cumsum(wiersze * szerokosci)
+
+        # Paczki kolejnych trójkątów o łącznie najwyżej ok. PIKSELE_W_PACZCE pikselach
+        poczatek = 0
+        while poczatek < len(wiersze):
+            przed = narastajaco[poczatek - 1] if poczatek else 0
+            koniec = max(int(np.searchsorted(narastajaco, przed + PIKSELE_W_PACZCE, side="right")),
+                         poczatek + 1)
+            self._rysuj_paczke(np.arange(poczatek, koniec), y_min, wiersze, wsp_x, wsp_y, wsp_c,
+                               plaszczyzna_a, plaszczyzna_b, plaszczyzna_c, tekstura)
+            poczatek = koniec
+
+    def _rysuj_paczke(self, wybrane, y_min, wiersze, wsp_x, wsp_y, wsp_c,
+                      plaszczyzna_a, plaszczyzna_b, plaszczyzna_c, tekstura):
+        ox, _, szerokosc, _ = self.obszar
+
+        # Odcinek każdego wiersza w trójkącie: współrzędna barycentryczna
+        # b_i = wsp_x * sx + (wsp_y * sy + wsp_c) >= 0 ogranicza sx z jednej strony
+        ile = wiersze[wybrane]
+        if ile.sum() == 0:
+            return
+        trojkat = np.repeat(wybrane, ile)
+        py = y_min[trojkat] + np.arange(ile.sum()) - np.repeat(np.cumsum(ile) - ile, ile)
+        sy = py + 0.5
+        a = wsp_x[trojkat]
+        c = wsp_y[trojkat] * sy[:, None] + wsp_c[trojkat]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            granica = -c / a
+        lewo = np.where(a > 0, granica, -np.inf).max(axis=1)
+        prawo = np.where(a < 0, granica, np.inf).min(axis=1)
+        pusty = ((a == 0) & (c < 0)).any(axis=1)
+        x0 = np.maximum(np.ceil(np.maximum(lewo, ox - 1.0) - 0.5), ox).astype(np.int64)
+        x1 = np.minimum(np.floor(np.minimum(prawo, ox + szerokosc + 1.0) - 0.5), ox + szerokosc - 1).astype(np.int64)
+        dlugosci = np.where(pusty, 0, np.maximum(x1 - x0 + 1, 0))
+        if dlugosci.sum() == 0:
+            return
+
+        # Fragmenty: piksele wszystkich odcinków; głębokość z płaszczyzny trójkąta
+        wiersz = np.repeat(np.arange(len(py)), dlugosci)
+        px = x0[wiersz] + np.arange(dlugosci.sum()) - np.repeat(np.cumsum(dlugosci) - dlugosci, dlugosci)
+        z_wiersza = plaszczyzna_b[trojkat, 0] * sy + plaszczyzna_c[trojkat, 0]
+        glebokosc = plaszczyzna_a[trojkat, 0][wiersz] * (px + 0.5) + z_wiersza[wiersz]
+        piksel = py[wiersz] * self.szerokosc + px
+
+        trafione = (glebokosc >= 0) & (glebokosc <= 1) & (glebokosc < self.glebia[piksel])
+        if not trafione.any():
+            return
+        glebokosc, piksel, wiersz = glebokosc[trafione], piksel[trafione], wiersz[trafione]
+
+        # Z fragmentów jednego piksela zostaje najbliższy, przy remisie (głębokość
+        # z dokładnością bufora 24-bitowego) - wcześniejszy trójkąt: stabilne
+        # sortowanie zachowuje kolejność trójkątów
+        klucz = piksel * (1 << 24) + (glebokosc * ((1 << 24) - 1)).astype(np.int64)
+        kolejnosc = np.argsort(klucz, kind="stable")
+        piksel = piksel[kolejnosc]
+        pierwsze = np.ones(len(piksel), dtype=bool)
+        pierwsze[1:] = piksel[1:] != piksel[:-1]
+        zwyciezcy = kolejnosc[pierwsze]
+        piksel = piksel[pierwsze]
+
+        # Tekstura tylko dla zwycięzców
+        t = trojkat[wiersz[zwyciezcy]]
+        sx = piksel % self.szerokosc + 0.5
+        sy = piksel // self.szerokosc + 0.5
+        q, u, v = (np.take(plaszczyzna_a[:, k], t) * sx + np.take(plaszczyzna_b[:, k], t) * sy
+                   + np.take(plaszczyzna_c[:, k], t) for k in (1, 2, 3))
+        kolor = np.rint(probkuj(tekstura, u / q, v / q)).astype(np.uint8)
+        self.kolor[piksel] = kolor.view(np.uint32).ravel()
+        self.glebia[piksel] = glebokosc[zwyciezcy]
+
+
+def siatka_sceny(nazwa):
+    if nazwa == "jajko":
+        return oczysc_siatke(zbuduj_jajko(N_JAJKA))[0]
+    return SIATKI[True]
+
+
+def mvp_sceny(nazwa, szerokosc, wysokosc, theta=0.0, phi=0.0):
+    # Kamera skryptu (kamera.Kamera): jajko ma viewport na całe okno, ostrosłup
+    # - kwadratowy na środku (Scena.update_viewport)
+    _, _, viewer, _, kwadrat = SCENY[nazwa]
+    aspekt = 1.0 if kwadrat else szerokosc / wysokosc
+    return perspektywa(FOV, aspekt, BLISKO, DALEKO) @ widok_kamery(viewer, theta, phi)
+
+
+def obszar_sceny(nazwa, szerokosc, wysokosc):
+    if not SCENY[nazwa][4]:
+        return 0, 0, szerokosc, wysokosc
+    bok = min(szerokosc, wysokosc)
+    return (szerokosc - bok) // 2, (wysokosc - bok) // 2, bok, bok
+
+
+def klatka_gl(nazwa, szerokosc, wysokosc, theta=0.0, phi=0.0):
+    # Ta sama klatka narysowana skryptem przez GL bez okna (bez_okna.py) - do porównania
+    from bez_okna import ustaw_platforme, utworz_kontekst, odczytaj_klatke
+    ustaw_platforme("egl")
+    from OpenGL.GL import glFinish
+    from bench_wspolne import wczytaj_scene
+
+    sys.argv = [SCENY[nazwa][0]]
+    kontekst = utworz_kontekst("egl", szerokosc, wysokosc)
+    scena = wczytaj_scene(SCENY[nazwa][0])
+    scena.startup()
+    scena.update_viewport(None, szerokosc, wysokosc)
+    scena.theta, scena.phi = theta, phi
+    scena.render(0.0)
+    glFinish()
+    obraz = odczytaj_klatke(szerokosc, wysokosc).copy()
+    scena.shutdown()
+    kontekst.usun()
+    return obraz
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Programowy rasteryzator NumPy (bez OpenGL)")
+    parser.add_argument("scena", nargs="?", choices=sorted(SCENY), default="jajko")
+    parser.add_argument("--rozmiar", default="600x600")
+    parser.add_argument("--theta", type=float, default=0.0)
+    parser.add_argument("--phi", type=float, default=0.0)
+    parser.add_argument("--klatki", type=int, default=5, help="ile razy rysować (do pomiaru czasu)")
+    parser.add_argument("--zapisz", help="plik PNG na obraz")
+    parser.add_argument("--porownaj", action="store_true", help="porównaj z klatką GL (bez_okna.py)")
+    args = parser.parse_args()
+
+    # Tekstury ze ścieżek względnych, jak w skryptach
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    szerokosc, wysokosc = (int(x) for x in args.rozmiar.split("x"))
+    _, plik_tekstury, _, odrzucane, _ = SCENY[args.scena]
+
+    siatka = siatka_sceny(args.scena)
+    tekstura = wczytaj_teksture(plik_tekstury)
+    mvp = mvp_sceny(args.scena, szerokosc, wysokosc, args.theta, args.phi)
+
+    rasteryzator = Rasteryzator(szerokosc, wysokosc)
+    rasteryzator.obszar = obszar_sceny(args.scena, szerokosc, wysokosc)
+    czasy = []
+    for _ in range(max(args.klatki, 1)):
+        start = time.perf_counter()
+        rasteryzator.wyczysc()
+        rasteryzator.rysuj(siatka, mvp, tekstura, odrzucane)
+        czasy.append(time.perf_counter() - start)
+    obraz = rasteryzator.obraz()
+
+    print(f"{args.scena}: {siatka.liczba_trojkatow} trójkątów ({rasteryzator.trojkaty} narysowanych), "
+          f"{szerokosc}x{wysokosc} w {min(czasy) * 1000:.1f} ms "
+          f"(mediana {np.median(czasy) * 1000:.1f} ms, {1 / np.median(czasy):.1f} klatek/s)")
+    if args.zapisz:
+        Image.fromarray(obraz).save(args.zapisz)
+
+    if args.porownaj:
+        gl = klatka_gl(args.scena, szerokosc, wysokosc, args.theta, args.phi)
+        roznica = np.abs(obraz.astype(np.int16) - gl.astype(np.int16)).max(axis=2)
+        print(f"Różnica z GL: największa {roznica.max()}, średnia {roznica.mean():.3f}, "
+              f"pikseli różnych o > 8: {(roznica > 8).mean() * 100:.3f}%")
+
+
+if __name__ == '__main__':
+    main()
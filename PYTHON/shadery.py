@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# Programy GLSL: kompilacja (z pamięcią podręczną programów), wysyłanie
+# uniformów i program z oświetleniem z lab6 liczonym na fragment.
+#
+# GLSL 1.20 czyta wierzchołki z tych samych tablic co potok stały
+# (gl_Vertex, gl_Normal, gl_MultiTexCoord0), więc SiatkaVBO, poziomy LOD
+# i tryb natychmiastowy rysują z shaderem bez zmian. Macierze (MVP) liczy
+# NumPy raz na klatkę (macierze.py) i idą do shadera jako uniformy.
+import numpy as np
+
+from OpenGL.GL import *
+
+from macierze import macierz_normalnych
+
+ZRODLO_WIERZCHOLKOW_PHONG = """
+#version 120
+uniform mat4 u_mvp;
+uniform mat4 u_mv;
+uniform mat3 u_normalna;
+
+varying vec3 v_pozycja;
+varying vec3 v_normalna;
+varying vec2 v_uv;
+
+void main()
+{
+    v_pozycja = (u_mv * gl_Vertex).xyz;
+    v_normalna = u_normalna * gl_Normal;
+    v_uv = (gl_TextureMatrix[0] * gl_MultiTexCoord0).xy;
+    gl_Position = u_mvp * gl_Vertex;
+}
+"""
+
+# Model oświetlenia jak w potoku stałym (ambient sceny, GL_LIGHT0 z tłumieniem,
+# półwektor bez lokalnego obserwatora, GL_MODULATE z teksturą), tylko liczony
+# dla każdego piksela zamiast dla każdego wierzchołka
+ZRODLO_FRAGMENTOW_PHONG = """
+#version 120
+uniform sampler2D u_tekstura;
+uniform bool u_teksturowanie;
+uniform bool u_oswietlenie;
+uniform bool u_dwustronne;
+
+uniform vec4 u_ambient_sceny;
+uniform vec4 u_mat_ambient;
+uniform vec4 u_mat_diffuse;
+uniform vec4 u_mat_specular;
+uniform float u_mat_shininess;
+
+uniform vec4 u_light_ambient;
+uniform vec4 u_light_diffuse;
+uniform vec4 u_light_specular;
+uniform vec4 u_light_position;  // w układzie kamery
+uniform vec3 u_tlumienie;       // stałe, liniowe, kwadratowe
+
+varying vec3 v_pozycja;
+varying vec3 v_normalna;
+varying vec2 v_uv;
+
+void main()
+{
+    vec4 kolor = vec4(1.0);
+    if (u_oswietlenie) {
+        vec3 n = normalize(v_normalna);
+        if (u_dwustronne && !gl_FrontFacing)
+            n = -n;
+
+        vec3 do_swiatla = u_light_position.xyz - v_pozycja * u_light_position.w;
+        float d = length(do_swiatla);
+        vec3 l = do_swiatla / d;
+        float tlumienie = 1.0;
+        if (u_light_position.w != 0.0)
+            tlumienie = 1.0 / (u_tlumienie.x + u_tlumienie.y * d + u_tlumienie.z * d * d);
+
+        float rozproszone = max(dot(n, l), 0.0);
+        float odbite = 0.0;
+        if (rozproszone > 0.0)
+            odbite = pow(max(dot(n, normalize(l + vec3(0.0, 0.0, 1.0))), 0.0), u_mat_shininess);
+
+        kolor = u_ambient_sceny * u_mat_ambient
+              + tlumienie * (u_light_ambient * u_mat_ambient
+                             + rozproszone * u_light_diffuse * u_mat_diffuse
+                             + odbite * u_light_specular * u_mat_specular);
+        kolor = vec4(clamp(kolor.rgb, 0.0, 1.0), u_mat_diffuse.a);
+    }
+    if (u_teksturowanie)
+        kolor *= texture2D(u_tekstura, v_uv);
+    gl_FragColor = kolor;
+}
+"""
+
+
+def _skompiluj(typ, zrodlo):
+    shader = glCreateShader(typ)
+    glShaderSource(shader, zrodlo)
+    glCompileShader(shader)
+    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+        log = glGetShaderInfoLog(shader).decode(errors="replace")
+        glDeleteShader(shader)
+        raise RuntimeError(f"Błąd kompilacji shadera:\n{log}")
+    return shader
+
+
+class Program:
+    # Program GLSL z zapamiętanymi położeniami uniformów. ustaw() dobiera
+    # wywołanie glUniform* do typu wartości: float, int/bool (też sampler),
+    # wektor 2-4 floatów albo macierz 3x3 / 4x4 (NumPy, w kolejności wierszy).
+
+    def __init__(self, zrodlo_wierzcholkow, zrodlo_fragmentow):
+        shadery = [_skompiluj(GL_VERTEX_SHADER, zrodlo_wierzcholkow),
+                   _skompiluj(GL_FRAGMENT_SHADER, zrodlo_fragmentow)]
+        self.id = glCreateProgram()
+        for shader in shadery:
+            glAttachShader(self.id, shader)
+        glLinkProgram(self.id)
+        # Po zlinkowaniu same shadery nie są już potrzebne
+        for shader in shadery:
+            glDetachShader(self.id, shader)
+            glDeleteShader(shader)
+        if not glGetProgramiv(self.id, GL_LINK_STATUS):
+            log = glGetProgramInfoLog(self.id).decode(errors="replace")
+            glDeleteProgram(self.id)
+            raise RuntimeError(f"Błąd linkowania programu:\n{log}")
+        self.lokalizacje = {}
+        self.atrybuty = {}
+
+    def uzyj(self):
+        glUseProgram(self.id)
+
+    def lokalizacja(self, nazwa):
+        lokalizacja = self.lokalizacje.get(nazwa)
+        if lokalizacja is None:
+            # -1 dla uniformu, którego kompilator się pozbył - glUniform go zignoruje
+            lokalizacja = self.lokalizacje[nazwa] = glGetUniformLocation(self.id, nazwa)
+        return lokalizacja
+
+    def atrybut(self, nazwa):
+        # Numer atrybutu wierzchołka (attribute) - np. danych instancji
+        numer = self.atrybuty.get(nazwa)
+        if numer is None:
+            numer = self.atrybuty[nazwa] = glGetAttribLocation(self.id, nazwa)
+        return numer
+
+    def ustaw(self, nazwa, wartosc):
+        # Program musi być aktywny (uzyj())
+        lokalizacja = self.lokalizacja(nazwa)
+        if isinstance(wartosc, (bool, int, np.integer)):
+            glUniform1i(lokalizacja, int(wartosc))
+        elif isinstance(wartosc, (float, np.floating)):
+            glUniform1f(lokalizacja, wartosc)
+        else:
+            wartosc = np.asarray(wartosc, dtype=np.float32)
+            if wartosc.shape == (4, 4):
+                glUniformMatrix4fv(lokalizacja, 1, GL_TRUE, wartosc)
+            elif wartosc.shape == (3, 3):
+                glUniformMatrix3fv(lokalizacja, 1, GL_TRUE, wartosc)
+            else:
+                [glUniform1fv, glUniform2fv, glUniform3fv, glUniform4fv][len(wartosc) - 1](lokalizacja, 1, wartosc)
+
+    def usun(self):
+        glDeleteProgram(self.id)
+        self.id = 0
+
+
+# Skompilowane programy według źródeł - kompilujemy każdy tylko raz.
+# Programy należą do kontekstu GL, więc po jego zniszczeniu: wyczysc_pamiec()
+_programy = {}
+
+
+def program(zrodlo_wierzcholkow, zrodlo_fragmentow):
+    klucz = (zrodlo_wierzcholkow, zrodlo_fragmentow)
+    wynik = _programy.get(klucz)
+    if wynik is None:
+        wynik = _programy[klucz] = Program(zrodlo_wierzcholkow, zrodlo_fragmentow)
+    return wynik
+
+
+def wyczysc_pamiec():
+    for p in _programy.values():
+        p.usun()
+    _programy.clear()
+
+
+def program_phong():
+    return program(ZRODLO_WIERZCHOLKOW_PHONG, ZRODLO_FRAGMENTOW_PHONG)
+
+
+def ustaw_macierze(p, rzutowanie, model_widok):
+    # Jedyne uniformy zmieniające się co klatkę
+    p.ustaw("u_mvp", rzutowanie @ model_widok)
+    p.ustaw("u_mv", model_widok)
+    p.ustaw("u_normalna", macierz_normalnych(model_widok))
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# Siatka ostrosłupa bez OpenGL - korzystają z niej ostroslup.py (rysowanie
+# i scena) oraz rasteryzator.py.
+import numpy as np
+
+from jajko import Siatka
+
+# Ostrosłup z zad3.5 - zad4.5: podstawa 10x10 w płaszczyźnie z = 0,
+# wierzchołek w punkcie (0, 0, 5) -> środek tekstury (0.5, 0.5)
+POZYCJE = np.array([
+    [-5.0, -5.0, 0.0],
+    [5.0, -5.0, 0.0],
+    [5.0, 5.0, 0.0],
+    [-5.0, 5.0, 0.0],
+    [0.0, 0.0, 5.0],  # Szczyt
+], dtype=np.float32)
+
+UV = np.array([
+    [0.0, 0.0],
+    [1.0, 0.0],
+    [1.0, 1.0],
+    [0.0, 1.0],
+    [0.5, 0.5],
+], dtype=np.float32)
+
+PODSTAWA = [0, 1, 2, 0, 2, 3]
+SCIANA_PRZEDNIA = [0, 1, 4]  # Tę ukrywamy klawiszem H
+SCIANY_BOCZNE = [
+    1, 2, 4,  # Prawa
+    2, 3, 4,  # Tył
+    3, 0, 4,  # Lewa
+]
+
+
+def zbuduj_ostroslup(show_front_wall=True):
+    indeksy = PODSTAWA + (SCIANA_PRZEDNIA if show_front_wall else []) + SCIANY_BOCZNE
+    return Siatka(POZYCJE, UV, np.array(indeksy, dtype=np.uint16))
+
+
+# Obie wersje siatki (ze ścianą przednią i bez) liczymy raz
+SIATKI = {widoczna: zbuduj_ostroslup(widoczna) for widoczna in (True, False)}
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# Wspólny szkielet skryptów laboratorium: okno GLFW z callbackami i pętlą
+# główną (profiler.py, odswiezanie.py), stan myszy (Wejscie), tekstury
+# (tekstury_gl.py / atlas.py) i bazowa scena z kamerą obracaną myszką.
+#
+# Skrypt zadania to podklasa Scena: startup() przygotowuje zasoby, rysuj()
+# wysyła geometrię (kamera jest już ustawiona), klawisz() obsługuje własne
+# klawisze. Scena z ustawioną sferą otaczającą (self.sfera) nie rysuje się,
+# gdy cała jest poza bryłą widzenia. Moduł skryptu tworzy obiekt `scena`,
+# a uruchom(scena) otwiera okno - bez_okna.py i benchmarki rysują ten sam
+# obiekt bez okna.
+import sys
+import glob
+import numpy as np
+
+from glfw.GLFW import *
+from OpenGL.GL import *
+
+from tekstury_gl import wczytaj_piksele, utworz_teksture, MenedzerTekstur
+from atlas import AtlasTekstur, zbuduj_atlas
+from profiler import Profiler
+from odswiezanie import Odswiezanie
+from kamera import Kamera
+from widocznosc import widoczne_sfery
+
+
+class Wejscie:
+    # Stan myszy: przeciąganie z wciśniętym lewym przyciskiem obraca scenę
+
+    def __init__(self):
+        self.pix2angle = 1.0
+        self.left_mouse_button_pressed = 0
+        self.mouse_x_pos_old = 0
+        self.mouse_y_pos_old = 0
+        self.delta_x = 0
+        self.delta_y = 0
+
+    def ruch(self, x_pos, y_pos):
+        self.delta_x = x_pos - self.mouse_x_pos_old
+        self.mouse_x_pos_old = x_pos
+        self.delta_y = y_pos - self.mouse_y_pos_old
+        self.mouse_y_pos_old = y_pos
+
+    def przycisk(self, button, action):
+        if button == GLFW_MOUSE_BUTTON_LEFT and action == GLFW_PRESS:
+            self.left_mouse_button_pressed = 1
+        else:
+            self.left_mouse_button_pressed = 0
+
+    def obrot(self):
+        # Przyrost kątów (theta, phi) w tej klatce - tylko przy wciśniętym przycisku
+        if self.left_mouse_button_pressed:
+            return self.delta_x * self.pix2angle, self.delta_y * self.pix2angle
+        return 0.0, 0.0
+
+
+class Scena:
+    # Scena z kamerą patrzącą na początek układu i kwadratowym viewportem
+    # (jak w zad3.0 - zad4.5). Podklasy nadpisują startup(), rysuj(),
+    # klawisz(), a w razie potrzeby ustaw_obszar() i ustaw_kamere().
+    tytul = "Lab 6"
+    rozmiar_okna = (400, 400)
+    obrot_pionowy = True  # ruch myszy w pionie obraca scenę (phi)
+
+    def __init__(self):
+        self.viewer = [0.0, 0.0, 10.0]
+        self.theta = 0.0
+        self.phi = 0.0
+        self.wejscie = Wejscie()
+
+        # Widok i rzutowanie liczone w NumPy tylko po zmianie (kamera.py)
+        self.kamera = Kamera()
+        # Czasy faz klatki (profiler.py); --profil włącza HUD z FPS i p50/p99
+        self.profiler = Profiler()
+        # Rysowanie tylko po zmianie sceny (odswiezanie.py); --na-zadanie włącza
+        self.odswiezanie = Odswiezanie()
+
+        # MenedzerTekstur albo AtlasTekstur (wczytaj_tekstury) i indeks aktywnej
+        self.tekstury = None
+        self.current_texture_index = 0
+
+        # Sfera otaczająca rysowanej geometrii (środek, promień) w układzie
+        # modelu - np. SiatkaVBO.sfera; None - rysujemy zawsze
+        self.sfera = None
+
+    def startup(self):
+        self.update_viewport(None, 400, 400)
+        glClearColor(0.0, 0.0, 0.0, 1.0)
+        glEnable(GL_DEPTH_TEST)
+        glEnable(GL_TEXTURE_2D)
+        glEnable(GL_CULL_FACE)
+
+    def shutdown(self):
+        if self.tekstury is not None:
+            self.tekstury.usun()
+
+    def render(self, time):
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+        # Obsługa obrotu myszką
+        obrot_theta, obrot_phi = self.wejscie.obrot()
+        self.theta += obrot_theta
+        if self.obrot_pionowy:
+            self.phi += obrot_phi
+
+        self.ustaw_kamere()
+
+        with self.profiler.faza("geometria"):
+            if self.widoczna():
+                self.rysuj()
+
+        glFlush()
+
+        # Tekstura wczytana w tle trafia do GL po klatce
+        if self.tekstury is not None:
+            self.tekstury.po_klatce()
+
+    def ustaw_kamere(self):
+        # Macierze przeliczane tylko po zmianie viewer / theta / phi (kamera.py)
+        self.kamera.ustaw(self.viewer, self.theta, self.phi)
+        self.kamera.zaladuj()
+
+    def widoczna(self):
+        # Test sfery otaczającej z bryłą widzenia kamery (widocznosc.py)
+        if self.sfera is None:
+            return True
+        srodek, promien = self.sfera
+        widoczna = bool(widoczne_sfery(self.kamera.plaszczyzny, np.reshape(srodek, (1, 3)), [promien])[0])
+        self.profiler.obiekty(int(widoczna), int(not widoczna))
+        return widoczna
+
+    def rysuj(self):
+        pass
+
+    def klawisz(self, key):
+        # Wciśnięty klawisz inny niż Escape
+        pass
+
+    def przewin(self, y_offset):
+        pass
+
+    def update_viewport(self, window, width, height):
+        self.odswiezanie.oznacz()
+        # Zminimalizowane okno ma rozmiar 0
+        if width == 0: width = 1
+        if height == 0: height = 1
+        self.wejscie.pix2angle = 360.0 / width
+        self.ustaw_obszar(width, height)
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+
+    def ustaw_obszar(self, width, height):
+        # Kwadratowy viewport na środku okna, rzutowanie o proporcjach 1:1
+        self.kamera.ustaw_rzutowanie(aspekt=1.0)
+        if width <= height:
+            glViewport(0, int((height - width) / 2), width, width)
+        else:
+            glViewport(int((width - height) / 2), 0, height, height)
+
+    def load_texture(self, filename):
+        # Jedna tekstura na całe zadanie. Piksele z pamięci podręcznej (patrz
+        # tekstury_gl.py) - PIL dekoduje plik tylko przy pierwszym
+        # uruchomieniu albo po jego zmianie
+        try:
+            piksele = wczytaj_piksele(filename)
+        except IOError:
+            print(f"Błąd: Nie można otworzyć pliku {filename}. Sprawdź czy plik jest w folderze!")
+            sys.exit()
+
+        return utworz_teksture(piksele)
+
+    def wczytaj_tekstury(self, pliki_tekstur, limit=3, powtarzanie=False):
+        # Kilka tekstur przełączanych klawiszem T; z --wszystkie cały katalog tekstury/
+        if "--wszystkie" in sys.argv:
+            pliki_tekstur = sorted(glob.glob("tekstury/*.tga"))
+
+        if "--atlas" in sys.argv:
+            # Wszystkie tekstury w jednym atlasie - [T] zmienia tylko macierz tekstury
+            self.tekstury = AtlasTekstur(*zbuduj_atlas(pliki_tekstur))
+        else:
+            # Tekstury wczytywane dopiero przy pierwszym użyciu (następna
+            # dekoduje się w tle); w GL najwyżej `limit` naraz
+            self.tekstury = MenedzerTekstur(pliki_tekstur, limit, powtarzanie)
+            if "--od-razu" in sys.argv:
+                # Cały zestaw od startu, dekodowany w tle (LadowarkaTekstur)
+                self.tekstury.wczytaj_wszystkie()
+        self.podepnij_teksture(0)
+
+    def podepnij_teksture(self, indeks):
+        if not len(self.tekstury):
+            print("Błąd: Nie udało się wczytać żadnej tekstury")
+            sys.exit()
+        try:
+            self.tekstury.podepnij(indeks)
+        except IOError:
+            print(f"Błąd: Nie można otworzyć pliku {self.tekstury.pliki[indeks]}")
+            sys.exit()
+
+    def nastepna_tekstura(self):
+        # Modulo (%) sprawia, że po ostatniej teksturze wracamy do pierwszej
+        self.current_texture_index = (self.current_texture_index + 1) % len(self.tekstury)
+        self.podepnij_teksture(self.current_texture_index)
+        print(f"Zmieniono teksturę na indeks: {self.current_texture_index}")
+
+    # Callbacki GLFW
+
+    def keyboard_key_callback(self, window, key, scancode, action, mods):
+        self.odswiezanie.oznacz()
+        if action == GLFW_PRESS:
+            if key == GLFW_KEY_ESCAPE:
+                glfwSetWindowShouldClose(window, GLFW_TRUE)
+            else:
+                self.klawisz(key)
+
+    def mouse_motion_callback(self, window, x_pos, y_pos):
+        self.wejscie.ruch(x_pos, y_pos)
+
+    def mouse_button_callback(self, window, button, action, mods):
+        self.odswiezanie.oznacz()
+        self.wejscie.przycisk(button, action)
+
+    def scroll_callback(self, window, x_offset, y_offset):
+        self.przewin(y_offset)
+        self.odswiezanie.oznacz()
+
+
+def uruchom(scena):
+    # Okno GLFW i pętla główna dla sceny
+    if not glfwInit():
+        sys.exit(-1)
+
+    window = glfwCreateWindow(*scena.rozmiar_okna, scena.tytul, None, None)
+    if not window:
+        glfwTerminate()
+        sys.exit(-1)
+
+    glfwMakeContextCurrent(window)
+    glfwSetFramebufferSizeCallback(window, scena.update_viewport)
+    glfwSetKeyCallback(window, scena.keyboard_key_callback)
+    glfwSetCursorPosCallback(window, scena.mouse_motion_callback)
+    glfwSetMouseButtonCallback(window, scena.mouse_button_callback)
+    glfwSetScrollCallback(window, scena.scroll_callback)
+    glfwSwapInterval(1)
+
+    profiler = scena.profiler = Profiler.z_argumentow(window)
+    odswiezanie = scena.odswiezanie = Odswiezanie.z_argumentow(window)
+
+    scena.startup()
+    while not glfwWindowShouldClose(window):
+        with profiler.faza("render"):
+            scena.render(glfwGetTime())
+        with profiler.faza("swap"):
+            glfwSwapBuffers(window)
+        with profiler.faza("zdarzenia"):
+            glfwPollEvents()
+        profiler.koniec_klatki()
+        # Z --na-zadanie śpi do zdarzenia zmieniającego scenę; obrót myszką
+        # (wciśnięty LPM) rysuje co klatkę jak dotąd
+        if odswiezanie.czekaj(window, animacja=scena.wejscie.left_mouse_button_pressed):
+            profiler.wznow()
+    profiler.zakoncz()
+    scena.shutdown()
+
+    glfwTerminate()
@@ -0,0 +1,704 @@
+#!/usr/bin/env python3
+import os
+import time
+import ctypes
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PIL import Image
+
+from OpenGL.GL import *
+from OpenGL.GL.EXT.texture_compression_s3tc import GL_COMPRESSED_RGB_S3TC_DXT1_EXT
+
+from formaty_tekstur import spakuj_rgb565, spakuj_rgba4444, wczytaj_dxt1
+from tga import wczytaj_tga
+
+
+# Pliki TGA czyta tga.py (nieskompresowane - bez kopii, wprost z pliku
+# zmapowanego w pamięci). Inne obrazy (np. JPEG z rozszerzeniem .tga)
+# dekoduje PIL, a wynik trafia do katalogu cache (surowe, odwrócone piksele
+# RGB w .npy) - przy kolejnym uruchomieniu plik jest mapowany do pamięci
+# i trafia prosto do glTexImage2D, bez dekodowania.
+KATALOG_CACHE = os.environ.get(
+    "TEKSTURY_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache_tekstur"))
+
+# Ile zdekodowanych tekstur trzymamy w pamięci procesu
+ROZMIAR_LRU = 32
+
+# Domyślny sposób budowania mipmap (filtrowanie trójliniowe przy pomniejszeniu):
+#   "0"   - bez mipmap, GL_LINEAR jak dotąd
+#   "gl"  - glGenerateMipmap (gdy sterownik go nie ma - jak "cpu")
+#   "cpu" - piramida liczona w NumPy (średnia z bloków 2x2), zapisywana w cache
+MIPMAPY = os.environ.get("TEKSTURY_MIPMAPY", "0")
+
+# Domyślny format tekstur w GL:
+#   "rgb"  - 24 bity na piksel, jak dotąd
+#   "565"  - 16 bitów na piksel (GL_UNSIGNED_SHORT_5_6_5)
+#   "4444" - 16 bitów na piksel z kanałem alfa (GL_UNSIGNED_SHORT_4_4_4_4)
+#   "dxt1" - gotowe bloki S3TC z pliku .dxt1 obok tekstury (robi je
+#            kompresuj_tekstury.py), 4 bity na piksel; bez pliku .dxt1
+#            albo bez obsługi S3TC w sterowniku - jak "rgb"
+FORMAT = os.environ.get("TEKSTURY_FORMAT", "rgb")
+
+# Wysyłanie tekstur wczytanych w tle (MenedzerTekstur, LadowarkaTekstur)
+# przez bufory PBO, porcjami w kolejnych klatkach (PrzesylaniePBO):
+#   "0"    - wyłączone, cała tekstura jednym glTexImage2D jak dotąd
+#   liczba - najwyżej tyle MB pikseli na klatkę, np. "4"
+PBO = os.environ.get("TEKSTURY_PBO", "0")
+
+# format -> (format wewnętrzny, format danych, typ danych, funkcja pakująca piksele)
+FORMATY_PIKSELI = {
+    "rgb": (3, GL_RGB, GL_UNSIGNED_BYTE, None),
+    "565": (GL_RGB5, GL_RGB, GL_UNSIGNED_SHORT_5_6_5, spakuj_rgb565),
+    "4444": (GL_RGBA4, GL_RGBA, GL_UNSIGNED_SHORT_4_4_4_4, spakuj_rgba4444),
+}
+
+
+def wczytaj_piksele(filename):
+    # Zwraca piksele tekstury jako tablicę (wysokość, szerokość, 3) uint8,
+    # już odwróconą w pionie (pierwszy wiersz = dół obrazka, jak chce GL).
+    # Rzuca IOError, gdy pliku nie da się otworzyć.
+    sciezka = os.path.abspath(filename)
+    stat = os.stat(sciezka)
+    # Klucz z czasem modyfikacji i rozmiarem - zmieniony plik to nowy wpis
+    return _wczytaj_piksele(sciezka, stat.st_mtime_ns, stat.st_size)
+
+
+class SkompresowanaTekstura:
+    # Gotowe bloki DXT1 z pliku .dxt1. plik to źródłowa tekstura - z niej
+    # bierzemy piksele, gdy sterownik nie obsługuje S3TC.
+
+    def __init__(self, plik, szerokosc, wysokosc, poziomy):
+        self.plik = plik
+        self.szerokosc = szerokosc
+        self.wysokosc = wysokosc
+        self.poziomy = poziomy
+
+
+def wczytaj_teksture(filename, format=None):
+    # Dane dla utworz_teksture: przy formacie "dxt1" bloki z pliku .dxt1
+    # (jeśli istnieje), w pozostałych przypadkach piksele z wczytaj_piksele
+    if (format or FORMAT) == "dxt1":
+        plik_dxt1 = os.path.splitext(filename)[0] + ".dxt1"
+        if os.path.exists(plik_dxt1):
+            return SkompresowanaTekstura(filename, *wczytaj_dxt1(plik_dxt1))
+    return wczytaj_piksele(filename)
+
+
+@functools.lru_cache(maxsize=ROZMIAR_LRU)
+def _wczytaj_piksele(sciezka, mtime, rozmiar):
+    try:
+        return wczytaj_tga(sciezka)
+    except ValueError:
+        pass
+
+    plik_cache = _plik_cache(sciezka, mtime, rozmiar)
+
+    try:
+        return np.load(plik_cache, mmap_mode="r")
+    except (OSError, ValueError):
+        pass
+
+    piksele = _dekoduj(sciezka)
+    _zapisz_cache(plik_cache, piksele)
+    piksele.flags.writeable = False  # tablica jest współdzielona przez LRU
+    return piksele
+
+
+def _plik_cache(sciezka, mtime, rozmiar):
+    klucz = f"{sciezka}|{mtime}|{rozmiar}".encode("utf-8")
+    return os.path.join(KATALOG_CACHE, hashlib.sha1(klucz).hexdigest() + ".npy")
+
+
+def _dekoduj(sciezka):
+    image = Image.open(sciezka)
+    img_data = image.convert("RGB").tobytes("raw", "RGB", 0, -1)
+    return np.frombuffer(img_data, dtype=np.uint8).reshape(image.height, image.width, 3).copy()
+
+
+def _zapisz_cache(plik_cache, piksele):
+    # Cache jest tylko przyspieszeniem - błąd zapisu nie może zatrzymać programu.
+    # Zapis do pliku tymczasowego i os.replace, żeby nikt nie wczytał połówki.
+    try:
+        os.makedirs(KATALOG_CACHE, exist_ok=True)
+        tymczasowy = f"{plik_cache}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tymczasowy, "wb") as f:
+            np.save(f, piksele)
+        os.replace(tymczasowy, plik_cache)
+    except OSError:
+        pass
+
+
+def piramida_mipmap(piksele):
+    # Kolejne poziomy mipmap (bez poziomu 0): każdy to średnia z bloków 2x2
+    # poprzedniego, aż do 1x1. Liczymy na float32, żeby nie kumulować
+    # zaokrągleń; wynik jest w cache na dysku (kluczem jest treść pikseli).
+    plik_cache = os.path.join(KATALOG_CACHE, "mip_" + hashlib.sha1(
+        np.ascontiguousarray(piksele).data).hexdigest() + ".npy")
+    wymiary = _wymiary_mipmap(*piksele.shape[:2])
+
+    try:
+        dane = np.load(plik_cache, mmap_mode="r")
+    except (OSError, ValueError):
+        dane = None
+
+    if dane is None:
+        poziomy = []
+        obraz = np.asarray(piksele, dtype=np.float32)
+        for _ in wymiary:
+            obraz = _zmniejsz(obraz)
+            poziomy.append(np.rint(obraz).astype(np.uint8).ravel())
+        dane = np.concatenate(poziomy) if poziomy else np.empty(0, np.uint8)
+        _zapisz_cache(plik_cache, dane)
+
+    # W cache leżą wszystkie poziomy jeden za drugim - rozcinamy je z powrotem
+    wynik = []
+    poczatek = 0
+    for wysokosc, szerokosc in wymiary:
+        koniec = poczatek + wysokosc * szerokosc * 3
+        wynik.append(dane[poczatek:koniec].reshape(wysokosc, szerokosc, 3))
+        poczatek = koniec
+    return wynik
+
+
+def _wymiary_mipmap(wysokosc, szerokosc):
+    wymiary = []
+    while wysokosc > 1 or szerokosc > 1:
+        wysokosc = max(1, wysokosc // 2)
+        szerokosc = max(1, szerokosc // 2)
+        wymiary.append((wysokosc, szerokosc))
+    return wymiary
+
+
+def _zmniejsz(obraz):
+    # Średnia z par wierszy, potem z par kolumn (nieparzysty ostatni wiersz
+    # czy kolumna są pomijane, tak jak przy zaokrągleniu rozmiaru w dół)
+    wysokosc, szerokosc = obraz.shape[:2]
+    if wysokosc > 1:
+        h = wysokosc // 2 * 2
+        obraz = (obraz[0:h:2] + obraz[1:h:2]) * 0.5
+    if szerokosc > 1:
+        w = szerokosc // 2 * 2
+        obraz = (obraz[:, 0:w:2] + obraz[:, 1:w:2]) * 0.5
+    return obraz
+
+
+@functools.lru_cache(maxsize=None)
+def obsluguje_s3tc():
+    # Czy sterownik przyjmie bloki DXT1 przez glCompressedTexImage2D
+    try:
+        rozszerzenia = glGetString(GL_EXTENSIONS) or b""
+    except GLError:
+        return False
+    return (b"GL_EXT_texture_compression_s3tc" in rozszerzenia
+            or b"GL_EXT_texture_compression_dxt1" in rozszerzenia)
+
+
+def utworz_teksture(dane, powtarzanie=False, mipmapy=None, format=None):
+    # Tworzy teksturę GL z danych zwróconych przez wczytaj_piksele
+    # albo wczytaj_teksture. mipmapy i format: None - domyślne MIPMAPY
+    # i FORMAT, poza tym jak w ich opisie.
+    if mipmapy is None:
+        mipmapy = MIPMAPY
+    if mipmapy == "gl" and not bool(glGenerateMipmap):
+        mipmapy = "cpu"
+    if format is None:
+        format = FORMAT
+
+    if isinstance(dane, SkompresowanaTekstura):
+        if obsluguje_s3tc():
+            return _utworz_skompresowana(dane, powtarzanie)
+        dane = wczytaj_piksele(dane.plik)
+    if format not in FORMATY_PIKSELI:
+        format = "rgb"
+
+    texture_id = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture_id)
+    _ustaw_parametry(powtarzanie, mipmapy in ("gl", "cpu"))
+
+    wyslij_poziom(0, dane, format)
+    if mipmapy == "gl":
+        glGenerateMipmap(GL_TEXTURE_2D)
+    elif mipmapy == "cpu":
+        for poziom, obraz in enumerate(piramida_mipmap(dane), start=1):
+            wyslij_poziom(poziom, obraz, format)
+
+    return texture_id
+
+
+def _ustaw_parametry(powtarzanie, z_mipmapami):
+    if powtarzanie:
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+    if z_mipmapami:
+        # Filtrowanie trójliniowe: liniowo w poziomie i między poziomami
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+    else:
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+
+    # Wiersze RGB nie muszą być wyrównane do 4 bajtów
+    glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+
+
+def wyslij_poziom(poziom, obraz, format="rgb"):
+    # glTexImage2D dla aktualnie podpiętej tekstury; obraz jak z wczytaj_piksele
+    wewnetrzny, format_danych, typ, obraz = _dane_poziomu(obraz, format)
+    glTexImage2D(GL_TEXTURE_2D, poziom, wewnetrzny, obraz.shape[1], obraz.shape[0], 0,
+                 format_danych, typ, obraz)
+
+
+def _dane_poziomu(obraz, format):
+    # (format wewnętrzny, format danych, typ, ciągła tablica) dla glTexImage2D
+    wewnetrzny, format_danych, typ, spakuj = FORMATY_PIKSELI[format]
+    if spakuj is not None:
+        obraz = spakuj(obraz)
+    elif _bajty_bgr(obraz) is not None:
+        # Widok z tga.py - bajty pliku idą do GL bez kopii, jako BGR
+        obraz, format_danych = _bajty_bgr(obraz), GL_BGR
+    return wewnetrzny, format_danych, typ, np.ascontiguousarray(obraz)
+
+
+def _utworz_skompresowana(dane, powtarzanie):
+    texture_id = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture_id)
+    _ustaw_parametry(powtarzanie, len(dane.poziomy) > 1)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, len(dane.poziomy) - 1)
+
+    szerokosc, wysokosc = dane.szerokosc, dane.wysokosc
+    for poziom, bloki in enumerate(dane.poziomy):
+        # PyOpenGL sam wylicza rozmiar danych (imageSize) z długości bloki
+        glCompressedTexImage2D(GL_TEXTURE_2D, poziom, GL_COMPRESSED_RGB_S3TC_DXT1_EXT,
+                               szerokosc, wysokosc, 0, bloki)
+        szerokosc, wysokosc = max(1, szerokosc // 2), max(1, wysokosc // 2)
+
+    return texture_id
+
+
+class PrzesylaniePBO:
+    # Wysyłanie tekstur przez pierścień buforów GL_PIXEL_UNPACK_BUFFER.
+    # dodaj() tworzy teksturę bez pikseli, a po_klatce() kopiuje kolejne
+    # pasy wierszy do zmapowanego bufora PBO i woła glTexSubImage2D, które
+    # czyta piksele już z bufora (przesunięcie 0 zamiast wskaźnika). Na klatkę
+    # idzie najwyżej na_klatke bajtów - duża tekstura rozkłada się na kilka
+    # klatek zamiast zatrzymać jedną. Kolejne pasy trafiają do kolejnych
+    # buforów pierścienia, więc zapis nie czeka na transfer poprzedniego.
+    #
+    # Tekstury z kolejki nie wolno podpinać, dopóki gotowa() nie zwróci True
+    # (albo po dokoncz()). Po_klatce() zmienia podpiętą teksturę.
+
+    def __init__(self, na_klatke, bufory=3):
+        self.na_klatke = max(1, int(na_klatke))
+        self.bufory = [int(b) for b in np.atleast_1d(glGenBuffers(bufory))]
+        self.rozmiary = [0] * bufory  # bajty zaalokowane w każdym buforze
+        self.nastepny = 0
+        # texture_id -> (lista poziomów [poziom, dane, format danych, typ, wiersz],
+        # czy na końcu glGenerateMipmap); kolejność = kolejność wysyłania
+        self.kolejka = OrderedDict()
+
+    @classmethod
+    def z_ustawien(cls, pbo=None):
+        # Obiekt dla opcji TEKSTURY_PBO (pbo: None - domyślne PBO); None, gdy wyłączone
+        megabajty = float(PBO if pbo is None else pbo)
+        if megabajty <= 0:
+            return None
+        return cls(megabajty * 1024 * 1024)
+
+    def __len__(self):
+        return len(self.kolejka)
+
+    def dodaj(self, dane, powtarzanie=False, mipmapy=None, format=None, zamiast=None):
+        # Jak utworz_teksture, ale piksele dochodzą w kolejnych po_klatce().
+        # Bloki DXT1 są małe - te wysyłamy od razu. zamiast - niepotrzebna
+        # już tekstura utworzona z tymi samymi opcjami: przy tych samych
+        # wymiarach nowe piksele trafiają do niej bez ponownej alokacji
+        # (na llvmpipe sama alokacja 4096x4096 to ok. 35 ms), inaczej jest usuwana.
+        if mipmapy is None:
+            mipmapy = MIPMAPY
+        if mipmapy == "gl" and not bool(glGenerateMipmap):
+            mipmapy = "cpu"
+        if format is None:
+            format = FORMAT
+        if isinstance(dane, SkompresowanaTekstura):
+            if zamiast is not None:
+                glDeleteTextures([zamiast])
+            return utworz_teksture(dane, powtarzanie, mipmapy, format)
+        if format not in FORMATY_PIKSELI:
+            format = "rgb"
+
+        texture_id = None
+        if zamiast is not None:
+            glBindTexture(GL_TEXTURE_2D, zamiast)
+            if (not glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_COMPRESSED)
+                    and glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_WIDTH) == dane.shape[1]
+                    and glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_HEIGHT) == dane.shape[0]):
+                texture_id = zamiast
+            else:
+                glDeleteTextures([zamiast])
+        if texture_id is None:
+            texture_id = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, texture_id)
+        _ustaw_parametry(powtarzanie, mipmapy in ("gl", "cpu"))
+
+        obrazy = [dane] + (piramida_mipmap(dane) if mipmapy == "cpu" else [])
+        poziomy = []
+        for poziom, obraz in enumerate(obrazy):
+            wewnetrzny, format_danych, typ, obraz = _dane_poziomu(obraz, format)
+            if texture_id != zamiast:
+                # Miejsce na poziom bez danych - piksele przyjdą z PBO
+                glTexImage2D(GL_TEXTURE_2D, poziom, wewnetrzny, obraz.shape[1], obraz.shape[0], 0,
+                             format_danych, typ, None)
+            poziomy.append([poziom, obraz, format_danych, typ, 0])
+
+        self.kolejka[texture_id] = (poziomy, mipmapy == "gl")
+        return texture_id
+
+    def gotowa(self, texture_id):
+        return texture_id not in self.kolejka
+
+    def po_klatce(self):
+        # Kolejne pasy z kolejki, łącznie najwyżej na_klatke bajtów (co
+        # najmniej jeden wiersz). Zwraca texture_id tekstur ukończonych w tej klatce.
+        gotowe = []
+        budzet = self.na_klatke
+        while self.kolejka and budzet > 0:
+            texture_id = next(iter(self.kolejka))
+            budzet -= self._wyslij_pas(texture_id, budzet)
+            if texture_id not in self.kolejka:
+                gotowe.append(texture_id)
+        return gotowe
+
+    def dokoncz(self, texture_id):
+        # Reszta tekstury od razu - gdy jest potrzebna jeszcze w tej klatce
+        while texture_id in self.kolejka:
+            self._wyslij_pas(texture_id, self.na_klatke)
+
+    def porzuc(self, texture_id):
+        # Tekstura usuwana przed końcem wysyłania (glDeleteTextures robi wołający)
+        self.kolejka.pop(texture_id, None)
+
+    def _wyslij_pas(self, texture_id, budzet):
+        poziomy, generuj_mipmapy = self.kolejka[texture_id]
+        poziom, obraz, format_danych, typ, wiersz = poziomy[0]
+        bajty_wiersza = obraz[0].nbytes
+        wiersze = min(len(obraz) - wiersz, max(1, int(budzet) // bajty_wiersza))
+        pas = obraz[wiersz:wiersz + wiersze]
+
+        # Następny bufor pierścienia; większy pas (szeroka tekstura) - większy bufor
+        numer = self.nastepny
+        self.nastepny = (numer + 1) % len(self.bufory)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, self.bufory[numer])
+        if self.rozmiary[numer] < pas.nbytes:
+            self.rozmiary[numer] = max(pas.nbytes, min(int(self.na_klatke), obraz.nbytes))
+            glBufferData(GL_PIXEL_UNPACK_BUFFER, self.rozmiary[numer], None, GL_STREAM_DRAW)
+
+        # INVALIDATE: stara zawartość bufora niepotrzebna - sterownik nie czeka
+        # na transfer, który jeszcze z niej czyta
+        wskaznik = glMapBufferRange(GL_PIXEL_UNPACK_BUFFER, 0, pas.nbytes,
+                                    GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT)
+        ctypes.memmove(wskaznik, pas.ctypes.data, pas.nbytes)
+        glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+
+        glBindTexture(GL_TEXTURE_2D, texture_id)
+        glTexSubImage2D(GL_TEXTURE_2D, poziom, 0, wiersz, obraz.shape[1], wiersze,
+                        format_danych, typ, None)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+
+        poziomy[0][4] += wiersze
+        if poziomy[0][4] == len(obraz):
+            poziomy.pop(0)
+            if not poziomy:
+                if generuj_mipmapy:
+                    glGenerateMipmap(GL_TEXTURE_2D)
+                del self.kolejka[texture_id]
+        return pas.nbytes
+
+    def usun(self):
+        glDeleteBuffers(len(self.bufory), self.bufory)
+        self.bufory = []
+        self.kolejka.clear()
+
+
+class LadowarkaTekstur:
+    # Dekoduje listę tekstur w tle (pula wątków - PIL i odczyt z dysku
+    # zwalniają GIL), a do GL wysyła je na wątku GL w kolejnych klatkach.
+    # Okno pokazuje się od razu, a tekstury dochodzą w miarę dekodowania.
+    # Z PBO (TEKSTURY_PBO) piksele idą porcjami przez PrzesylaniePBO.
+    #
+    # po_klatce() trzeba wołać co klatkę z wątku GL. Zwraca listę par
+    # (plik, texture_id) wysłanych w tej klatce; texture_id = None oznacza
+    # plik, którego nie udało się wczytać.
+
+    def __init__(self, pliki, powtarzanie=False, watki=None, na_klatke=None,
+                 mipmapy=None, format=None, pbo=None):
+        self.powtarzanie = powtarzanie
+        self.mipmapy = mipmapy
+        self.format = format
+        self.na_klatke = na_klatke  # limit wysyłek do GL na klatkę (None = bez limitu)
+        self.liczba_plikow = len(pliki)
+
+        self.przesylanie = PrzesylaniePBO.z_ustawien(pbo)
+        self.w_drodze = {}  # texture_id -> plik, gdy piksele jeszcze idą przez PBO
+
+        self.start = time.perf_counter()
+        self.czas_pierwszej_klatki = None
+        self.czas_wszystkich = None
+
+        self.pula = ThreadPoolExecutor(max_workers=watki)
+        self.zadania = [(plik, self.pula.submit(wczytaj_teksture, plik, format))
+                        for plik in pliki]
+
+    @property
+    def gotowa(self):
+        return not self.zadania and not self.w_drodze
+
+    def wczytuje(self, plik):
+        # Czy plik jest jeszcze dekodowany albo wysyłany przez PBO
+        return (any(p == plik for p, _ in self.zadania)
+                or any(p == plik for p in self.w_drodze.values()))
+
+    def po_klatce(self):
+        teraz = time.perf_counter()
+        if self.czas_pierwszej_klatki is None:
+            self.czas_pierwszej_klatki = teraz - self.start
+
+        wyslane = []
+        for plik, zadanie in list(self.zadania):
+            if self.na_klatke is not None and len(wyslane) >= self.na_klatke:
+                break
+            if self.przesylanie is not None and len(self.przesylanie):
+                # Następna dopiero po poprzedniej - inaczej wszystkie zdekodowane
+                # naraz alokowałyby miejsce w GL w jednej klatce
+                break
+            if not zadanie.done():
+                continue
+            self.zadania.remove((plik, zadanie))
+
+            try:
+                dane = zadanie.result()
+            except IOError:
+                wyslane.append((plik, None))
+                continue
+            if self.przesylanie is None:
+                wyslane.append((plik, utworz_teksture(dane, self.powtarzanie, self.mipmapy, self.format)))
+            else:
+                texture_id = self.przesylanie.dodaj(dane, self.powtarzanie, self.mipmapy, self.format)
+                self.w_drodze[texture_id] = plik
+
+        if self.przesylanie is not None:
+            for texture_id in self.przesylanie.po_klatce():
+                wyslane.append((self.w_drodze.pop(texture_id), texture_id))
+
+        if self.gotowa and self.czas_wszystkich is None:
+            self.czas_wszystkich = time.perf_counter() - self.start
+            self.pula.shutdown(wait=False)
+            if self.przesylanie is not None:
+                self.przesylanie.usun()
+
+        return wyslane
+
+    def raport(self):
+        return (f"Tekstury: {self.liczba_plikow}, "
+                f"pierwsza klatka po {self.czas_pierwszej_klatki * 1000:.1f} ms, "
+                f"wszystkie gotowe po {self.czas_wszystkich * 1000:.1f} ms")
+
+    def usun(self):
+        # Przerwanie wczytywania (np. zamknięcie okna przed końcem)
+        self.pula.shutdown(wait=False, cancel_futures=True)
+        self.zadania = []
+        if self.w_drodze:
+            glDeleteTextures(list(self.w_drodze))
+            self.w_drodze.clear()
+        if self.przesylanie is not None:
+            self.przesylanie.usun()
+            self.przesylanie = None
+
+
+class MenedzerTekstur:
+    # Tekstury wczytywane dopiero wtedy, gdy są potrzebne. W GL trzymamy
+    # najwyżej `limit` tekstur - najdawniej używane są usuwane przez
+    # glDeleteTextures. Następna tekstura w cyklu (klawisz T) jest dekodowana
+    # w tle i wysyłana do GL po klatce, więc przełączenie jest natychmiastowe.
+    # Z PBO (TEKSTURY_PBO) piksele następnej tekstury idą przez PrzesylaniePBO
+    # porcjami w kolejnych klatkach - rezydentna jest dopiero po ostatniej.
+    # wczytaj_wszystkie() wczytuje od startu cały zestaw przez LadowarkaTekstur.
+    #
+    # Wszystkie metody poza dekodowaniem w tle wołamy z wątku GL.
+    # podepnij() rzuca IOError, gdy pliku nie da się wczytać.
+
+    def __init__(self, pliki, limit=3, powtarzanie=False, mipmapy=None, format=None, pbo=None):
+        self.pliki = list(pliki)
+        self.limit = max(2, limit)  # aktywna + jedna wczytana z wyprzedzeniem
+        self.powtarzanie = powtarzanie
+        self.mipmapy = mipmapy
+        self.format = format
+        self.pbo = pbo
+        self.przesylanie = PrzesylaniePBO.z_ustawien(pbo)
+        self.ladowarka = None
+
+        self.rezydentne = OrderedDict()  # indeks -> texture_id, od najdawniej użytej
+        self.w_tle = {}  # indeks -> Future z pikselami
+        self.w_drodze = {}  # indeks -> texture_id, gdy piksele jeszcze idą przez PBO
+        self.aktywna = None
+        self.pula = ThreadPoolExecutor(max_workers=1)
+
+    def __len__(self):
+        return len(self.pliki)
+
+    def podepnij(self, indeks):
+        glBindTexture(GL_TEXTURE_2D, self.tekstura(indeks))
+        self.aktywna = indeks
+        self.wczytaj_w_tle((indeks + 1) % len(self.pliki))
+
+    def tekstura(self, indeks):
+        # Zwraca texture_id, w razie potrzeby wczytując teksturę od razu
+        if indeks in self.rezydentne:
+            self.rezydentne.move_to_end(indeks)
+            return self.rezydentne[indeks]
+
+        if self.ladowarka is not None and self.ladowarka.wczytuje(self.pliki[indeks]):
+            # Dojdzie z ładowarką - do tego czasu bez tekstury (po_klatce ją podepnie)
+            return 0
+
+        if indeks in self.w_drodze:
+            # Potrzebna od razu - reszta pikseli w tej klatce
+            texture_id = self.w_drodze.pop(indeks)
+            self.przesylanie.dokoncz(texture_id)
+            return self._zapamietaj(indeks, texture_id)
+
+        zadanie = self.w_tle.pop(indeks, None)
+        if zadanie is not None:
+            dane = zadanie.result()
+        else:
+            dane = wczytaj_teksture(self.pliki[indeks], self.format)
+        return self._wyslij(indeks, dane)
+
+    def usun_plik(self, indeks):
+        # Plik, którego nie da się wczytać, wypada z cyklu - dalsze indeksy
+        # przesuwają się o jeden w dół
+        del self.pliki[indeks]
+
+        def przesun(i):
+            return i - 1 if i > indeks else i
+
+        self.rezydentne = OrderedDict((przesun(i), t) for i, t in self.rezydentne.items() if i != indeks)
+        self.w_tle = {przesun(i): z for i, z in self.w_tle.items() if i != indeks}
+        self.w_drodze = {przesun(i): t for i, t in self.w_drodze.items() if i != indeks}
+        if self.aktywna == indeks:
+            self.aktywna = None
+        elif self.aktywna is not None:
+            self.aktywna = przesun(self.aktywna)
+
+    def wczytaj_wszystkie(self, watki=None):
+        # Jak przed wczytywaniem na żądanie: od startu wszystkie tekstury
+        # w GL (limit rośnie do liczby plików). Dekoduje je w tle
+        # LadowarkaTekstur, więc pierwsza klatka nie czeka; po ostatniej
+        # wypisujemy jej raport (czas do pierwszej klatki i do kompletu).
+        self.limit = max(self.limit, len(self.pliki))
+        self.ladowarka = LadowarkaTekstur(self.pliki, self.powtarzanie, watki,
+                                          mipmapy=self.mipmapy, format=self.format, pbo=self.pbo)
+
+    def wczytaj_w_tle(self, indeks):
+        if self.ladowarka is not None:
+            return  # wszystko i tak idzie przez ładowarkę
+        if indeks not in self.rezydentne and indeks not in self.w_tle and indeks not in self.w_drodze:
+            self.w_tle[indeks] = self.pula.submit(wczytaj_teksture, self.pliki[indeks], self.format)
+
+    def po_klatce(self):
+        # Wysyła do GL tekstury zdekodowane w tle. Nieudane zostawiamy -
+        # błąd wyjdzie dopiero przy podepnij(), gdy ktoś tej tekstury zechce.
+        zmiana = False
+        if self.ladowarka is not None:
+            zmiana = self._odbierz_z_ladowarki()
+
+        for indeks, zadanie in list(self.w_tle.items()):
+            if not zadanie.done() or zadanie.exception() is not None:
+                continue
+            del self.w_tle[indeks]
+            if self.przesylanie is None:
+                self._wyslij(indeks, zadanie.result())
+            else:
+                self.w_drodze[indeks] = self.przesylanie.dodaj(
+                    zadanie.result(), self.powtarzanie, self.mipmapy, self.format,
+                    zamiast=self._do_zwolnienia())
+            zmiana = True
+
+        if self.przesylanie is not None and self.w_drodze:
+            for texture_id in self.przesylanie.po_klatce():
+                indeks = next(i for i, t in self.w_drodze.items() if t == texture_id)
+                del self.w_drodze[indeks]
+                self._zapamietaj(indeks, texture_id)
+            zmiana = True
+
+        # utworz_teksture i PBO podpinają swoją teksturę - przywracamy aktywną
+        # (0, dopóki ładowarka jej nie wyśle)
+        if zmiana and self.aktywna is not None:
+            glBindTexture(GL_TEXTURE_2D, self.rezydentne.get(self.aktywna, 0))
+
+    def _odbierz_z_ladowarki(self):
+        wyslane = self.ladowarka.po_klatce()
+        for plik, texture_id in wyslane:
+            if texture_id is None:
+                # Zostaje w cyklu - podepnij() rzuci IOError jak bez ładowarki
+                print(f"Błąd: Nie można otworzyć pliku {plik}")
+            elif plik not in self.pliki or self.pliki.index(plik) in self.rezydentne:
+                glDeleteTextures([texture_id])  # usunięty z cyklu albo już wczytany
+            else:
+                self._zapamietaj(self.pliki.index(plik), texture_id)
+
+        if self.ladowarka.gotowa:
+            print(self.ladowarka.raport())
+            self.ladowarka = None
+        return bool(wyslane)
+
+    def _do_zwolnienia(self):
+        # Najdawniej używana tekstura, gdy nowa przekroczyłaby limit (nigdy
+        # aktywna) - PrzesylaniePBO wgra nową w jej miejsce w GL
+        if len(self.rezydentne) + len(self.w_drodze) < self.limit:
+            return None
+        indeks, texture_id = next(iter(self.rezydentne.items()))
+        if indeks == self.aktywna:
+            return None
+        del self.rezydentne[indeks]
+        return texture_id
+
+    def _wyslij(self, indeks, dane):
+        texture_id = utworz_teksture(dane, self.powtarzanie, self.mipmapy, self.format)
+        return self._zapamietaj(indeks, texture_id)
+
+    def _zapamietaj(self, indeks, texture_id):
+        self.rezydentne[indeks] = texture_id
+
+        while len(self.rezydentne) > self.limit:
+            _, stary_id = self.rezydentne.popitem(last=False)
+            glDeleteTextures([stary_id])
+
+        return texture_id
+
+    def usun(self):
+        self.pula.shutdown(wait=False, cancel_futures=True)
+        if self.ladowarka is not None:
+            self.ladowarka.usun()
+            self.ladowarka = None
+        if self.rezydentne or self.w_drodze:
+            glDeleteTextures(list(self.rezydentne.values()) + list(self.w_drodze.values()))
+        if self.przesylanie is not None:
+            self.przesylanie.usun()
+        self.rezydentne.clear()
+        self.w_tle.clear()
+        self.w_drodze.clear()
+        self.aktywna = None
+
+
+def _bajty_bgr(obraz):
+    # Ciągłe bajty BGR pod widokiem RGB z odwróconą kolejnością kanałów
+    # (tga.wczytaj_tga); None dla zwykłej tablicy
+    if obraz.ndim == 3 and obraz.shape[2] == 3 and obraz.strides[2] == -1:
+        bgr = obraz[:, :, ::-1]
+        if bgr.flags.c_contiguous:
+            return bgr
+    return None
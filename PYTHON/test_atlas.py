@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# Testy budowy atlasu z atlas.py: każdy kafelek trafia w swój prostokąt UV,
+# a plików, których nie da się wczytać, atlas pomija (jak zad5.0 bez atlasu).
+#
+# Użycie: python3 -m pytest test_atlas.py
+import numpy as np
+from PIL import Image
+
+from atlas import zbuduj_atlas, MARGINES
+
+
+def zapisz_kafelki(katalog, rozmiary):
+    generator = np.random.default_rng(0)
+    pliki = []
+    for numer, (szerokosc, wysokosc) in enumerate(rozmiary):
+        plik = katalog / f"kafel_{numer}.tga"
+        Image.fromarray(generator.integers(0, 256, (wysokosc, szerokosc, 3), dtype=np.uint8)).save(plik)
+        pliki.append(str(plik))
+    return pliki
+
+
+def kafel_z_atlasu(strony, kafel):
+    strona = strony[kafel["strona"]]
+    wysokosc, szerokosc = strona.shape[:2]
+    return strona[round(kafel["v0"] * wysokosc):round(kafel["v1"] * wysokosc),
+                  round(kafel["u0"] * szerokosc):round(kafel["u1"] * szerokosc)]
+
+
+def test_prostokaty_kafelkow(tmp_path):
+    pliki = zapisz_kafelki(tmp_path, [(64, 64), (32, 16), (100, 50), (8, 8)])
+    strony, opis = zbuduj_atlas(pliki, maks_rozmiar=128)
+
+    assert [kafel["plik"] for kafel in opis] == pliki
+    assert len(strony) > 1  # nie mieszczą się na jednej stronie 128 x 128
+    for plik, kafel in zip(pliki, opis):
+        oczekiwany = np.asarray(Image.open(plik).convert("RGB"))[::-1]
+        assert np.array_equal(kafel_z_atlasu(strony, kafel), oczekiwany)
+        # Margines to powtórzony brzeg kafelka
+        strona = strony[kafel["strona"]]
+        x = round(kafel["u0"] * strona.shape[1])
+        y = round(kafel["v0"] * strona.shape[0])
+        assert np.array_equal(strona[y - MARGINES, x - MARGINES], oczekiwany[0, 0])
+
+
+def test_pomija_zle_pliki(tmp_path, capsys):
+    pliki = zapisz_kafelki(tmp_path, [(16, 16), (16, 16), (16, 16)])
+    obciety = tmp_path / "obciety.tga"
+    obciety.write_bytes(open(pliki[1], "rb").read()[:100])
+    lista = [pliki[0], str(tmp_path / "brak.tga"), str(obciety), pliki[2]]
+
+    strony, opis = zbuduj_atlas(lista)
+    assert [kafel["plik"] for kafel in opis] == [pliki[0], pliki[2]]
+    assert np.array_equal(kafel_z_atlasu(strony, opis[1]),
+                          np.asarray(Image.open(pliki[2]).convert("RGB"))[::-1])
+    assert capsys.readouterr().out.count("Pomijam") == 2
+
+    assert zbuduj_atlas([str(tmp_path / "brak.tga")]) == ([], [])
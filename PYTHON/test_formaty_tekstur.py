@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# Testy formatów z formaty_tekstur.py. Bloki DXT1 dekoduje niezależnie PIL
+# (czytnik DDS) - kompresja ma dawać obrazek bliski oryginałowi.
+#
+# Użycie: python3 -m pytest test_formaty_tekstur.py
+import io
+import struct
+import numpy as np
+import pytest
+from PIL import Image
+
+from formaty_tekstur import (spakuj_rgb565, spakuj_rgba4444, kompresuj_dxt1, rozmiar_dxt1,
+                             zapisz_dxt1, wczytaj_dxt1, TYP_BLOKU_DXT1)
+
+
+def dekoduj_pil(bloki, szerokosc, wysokosc):
+    # Bloki w pliku DDS (nagłówek 124 bajty + format DXT1) -> piksele RGB z PIL
+    format_pikseli = struct.pack("<II4s5I", 32, 0x4, b"DXT1", 0, 0, 0, 0, 0)
+    naglowek = (struct.pack("<7I44x", 124, 0x81007, wysokosc, szerokosc, bloki.nbytes, 0, 1)
+                + format_pikseli + struct.pack("<5I", 0x1000, 0, 0, 0, 0))
+    obraz = Image.open(io.BytesIO(b"DDS " + naglowek + bloki.tobytes()))
+    return np.asarray(obraz.convert("RGB")).astype(np.int32)
+
+
+def rozwin_rgb565(kolory):
+    # RGB565 -> RGB 0-255 jak dekoder (powtórzenie najstarszych bitów)
+    r = (kolory >> 11) & 0x1F
+    g = (kolory >> 5) & 0x3F
+    b = kolory & 0x1F
+    return np.stack([(r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)], axis=-1)
+
+
+def test_rgb565_i_rgba4444():
+    piksele = np.array([[[255, 255, 255], [0, 0, 0], [255, 0, 0], [8, 4, 16]]], dtype=np.uint8)
+    assert spakuj_rgb565(piksele).tolist() == [[0xFFFF, 0x0000, 0xF800, 0x0822]]
+    assert spakuj_rgba4444(piksele).tolist() == [[0xFFFF, 0x000F, 0xF00F, 0x001F]]
+
+
+@pytest.mark.parametrize("wysokosc, szerokosc", [(4, 4), (16, 8), (13, 10), (1, 1), (2, 7)])
+def test_dxt1_jednolity_kolor(wysokosc, szerokosc):
+    # Jednolity blok: dokładnie kolor po zaokrągleniu do RGB565
+    kolor = np.array([200, 100, 37], dtype=np.uint8)
+    piksele = np.broadcast_to(kolor, (wysokosc, szerokosc, 3))
+    bloki = kompresuj_dxt1(piksele)
+
+    assert bloki.dtype == TYP_BLOKU_DXT1
+    assert bloki.nbytes == rozmiar_dxt1(szerokosc, wysokosc)
+    oczekiwany = rozwin_rgb565(spakuj_rgb565(kolor[None, None]).astype(np.int32))[0, 0]
+    assert np.array_equal(dekoduj_pil(bloki, szerokosc, wysokosc), np.broadcast_to(oczekiwany, piksele.shape))
+
+
+def test_dxt1_dwa_kolory_w_bloku():
+    # Dwa kolory dokładnie wyrażalne w RGB565 to końce palety - bez straty
+    generator = np.random.default_rng(1)
+    # Para kolorów na każdy z 4x4 bloków i losowy wybór jednego z nich dla każdego teksela
+    kolory = rozwin_rgb565(generator.integers(0, 1 << 16, (2, 4, 1, 4, 1), dtype=np.int32))
+    wybor = generator.integers(0, 2, (4, 4, 4, 4, 1)).astype(bool)
+    piksele = np.where(wybor, kolory[0], kolory[1]).astype(np.uint8).reshape(16, 16, 3)
+
+    bloki = kompresuj_dxt1(piksele)
+    assert np.array_equal(dekoduj_pil(bloki, 16, 16), piksele)
+
+
+def test_dxt1_cztery_kolory_palety():
+    # Teksele dokładnie w czterech kolorach palety (końce i dwa kolory
+    # pośrednie) - każdy musi dostać swój indeks
+    jasny = rozwin_rgb565(spakuj_rgb565(np.array([[[200, 180, 160]]], np.uint8)).astype(np.int32))[0, 0]
+    ciemny = rozwin_rgb565(spakuj_rgb565(np.array([[[40, 60, 20]]], np.uint8)).astype(np.int32))[0, 0]
+    paleta = np.array([jasny, ciemny, (2 * jasny + ciemny) / 3, (jasny + 2 * ciemny) / 3])
+    piksele = np.rint(paleta[np.arange(16) % 4]).astype(np.uint8).reshape(4, 4, 3)
+
+    bloki = kompresuj_dxt1(piksele)
+    assert np.abs(dekoduj_pil(bloki, 4, 4) - piksele).max() <= 1
+
+
+def test_dxt1_gradient():
+    # Gładki gradient: mały błąd i tryb czterech kolorów (kolor0 > kolor1)
+    y, x = np.mgrid[0:64, 0:64]
+    piksele = np.stack([x * 4, y * 4, (x + y) * 2], axis=-1).astype(np.uint8)
+    bloki = kompresuj_dxt1(piksele)
+
+    assert (bloki["kolor0"] > bloki["kolor1"]).all()
+    blad = np.abs(dekoduj_pil(bloki, 64, 64) - piksele)
+    assert blad.mean() < 3 and blad.max() <= 12
+
+
+def test_plik_dxt1(tmp_path):
+    piksele = np.random.default_rng(2).integers(0, 256, (8, 12, 3), dtype=np.uint8)
+    poziomy = [kompresuj_dxt1(piksele), kompresuj_dxt1(piksele[::2, ::2]), kompresuj_dxt1(piksele[:2, :3])]
+    plik = tmp_path / "tekstura.dxt1"
+    zapisz_dxt1(plik, 12, 8, poziomy)
+
+    szerokosc, wysokosc, wczytane = wczytaj_dxt1(plik)
+    assert (szerokosc, wysokosc) == (12, 8)
+    assert wczytane == [bloki.tobytes() for bloki in poziomy]
+
+
+def test_plik_dxt1_zly_naglowek(tmp_path):
+    plik = tmp_path / "zly.dxt1"
+    plik.write_bytes(b"to nie jest dxt1")
+    with pytest.raises(IOError):
+        wczytaj_dxt1(plik)
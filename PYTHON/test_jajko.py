@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# Testy siatki jajka z jajko.py: indeksy liczone wektorowo porównujemy
+# z pętlą z pierwotnego render() w zad5.0.py (te same trójkąty i ta sama
+# kolejność wierzchołków - od niej zależy, które ściany odrzuca glCullFace).
+#
+# Użycie: python3 -m pytest test_jajko.py
+import numpy as np
+import pytest
+
+from jajko import (indeksy_trojkatow, indeksy_podsiatki, oblicz_siatke_jajka, zbuduj_jajko,
+                   usun_zdegenerowane, oczysc_siatke)
+
+
+def trojkaty_z_petli(n):
+    # Kolejność glVertex3fv z pętli glBegin(GL_TRIANGLES) w pierwotnym zad5.0.py
+    trojkaty = []
+    for i in range(n - 1):
+        for j in range(n - 1):
+            p1, p2, p3, p4 = i * n + j, (i + 1) * n + j, i * n + j + 1, (i + 1) * n + j + 1
+            if i < n / 2:
+                trojkaty += [[p1, p2, p3], [p2, p4, p3]]
+            else:
+                trojkaty += [[p1, p3, p2], [p2, p3, p4]]
+    return trojkaty
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 7, 50])
+def test_indeksy_jak_petla(n):
+    assert indeksy_trojkatow(n).reshape(-1, 3).tolist() == trojkaty_z_petli(n)
+
+
+def test_obieg_w_polowach():
+    # W układzie (wiersz, kolumna) siatki trójkąty z pierwszej połowy
+    # (i < n/2) obiegamy w jedną stronę, z drugiej - w przeciwną
+    n = 9
+    wiersz, kolumna = np.divmod(indeksy_trojkatow(n).reshape(-1, 3).astype(np.int64), n)
+    a, b, c = (np.stack([wiersz[:, k], kolumna[:, k]], axis=1) for k in range(3))
+    u, v = b - a, c - a
+    obieg = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+    assert (obieg[wiersz.min(axis=1) < n / 2] == 1).all()
+    assert (obieg[wiersz.min(axis=1) >= n / 2] == -1).all()
+
+
+@pytest.mark.parametrize("n, typ", [(2, np.uint16), (256, np.uint16), (257, np.uint32), (400, np.uint32)])
+def test_typ_indeksow(n, typ):
+    # uint16 do n * n = 65536 wierzchołków, dalej uint32 - bez obcinania numerów
+    indeksy = indeksy_trojkatow(n)
+    assert indeksy.dtype == typ
+    assert indeksy.size == 6 * (n - 1) ** 2
+    assert int(indeksy.max()) == n * n - 1
+
+
+def test_wierzcholki_siatki():
+    # Indeks i * n + j wskazuje wierzchołek (i, j) siatki z oblicz_siatke_jajka
+    n = 12
+    siatka = zbuduj_jajko(n)
+    pozycje, uv = oblicz_siatke_jajka(n)
+    assert siatka.liczba_wierzcholkow == n * n
+    assert siatka.liczba_trojkatow == 2 * (n - 1) ** 2
+    assert np.array_equal(siatka.pozycje[5 * n + 7], pozycje[5, 7])
+    assert np.array_equal(siatka.uv[5 * n + 7], uv[5, 7])
+
+
+@pytest.mark.parametrize("n, krok", [(17, 1), (17, 2), (17, 16), (257, 4), (1025, 64), (1025, 2)])
+def test_podsiatka(n, krok):
+    indeksy = indeksy_podsiatki(n, krok)
+    m = (n - 1) // krok + 1
+    assert indeksy.dtype == (np.uint16 if n * n <= 65536 else np.uint32)
+    assert indeksy.size == 6 * (m - 1) ** 2
+    assert int(indeksy.max()) < n * n
+
+    # Tylko wierzchołki co `krok`-tego wiersza i kolumny, a trójkąty (z kolejnością
+    # wierzchołków) te same co w siatce m x m
+    wiersz, kolumna = np.divmod(indeksy.astype(np.int64), n)
+    assert (wiersz % krok == 0).all() and (kolumna % krok == 0).all()
+    assert np.array_equal(wiersz // krok * m + kolumna // krok, indeksy_trojkatow(m))
+
+
+def test_podsiatka_krok_1():
+    assert np.array_equal(indeksy_podsiatki(33, 1), indeksy_trojkatow(33))
+
+
+def test_zdegenerowane_na_biegunach():
+    # Pierwszy i ostatni rząd siatki to jeden punkt (bieguny) - w każdym
+    # kwadracie przy biegunie jeden z dwóch trójkątów ma zerowe pole
+    n = 50
+    siatka = zbuduj_jajko(n)
+    indeksy, usuniete = usun_zdegenerowane(siatka.pozycje, siatka.indeksy)
+    assert usuniete == 2 * (n - 1) == 98
+    assert indeksy.size // 3 == 4802 - 98
+
+    # Żaden pozostały trójkąt nie ma dwóch wierzchołków w rzędzie bieguna
+    wiersz = indeksy.reshape(-1, 3).astype(np.int64) // n
+    for biegun in (0, n - 1):
+        assert ((wiersz == biegun).sum(axis=1) <= 1).all()
+
+    # Pozostałe trójkąty są w tej samej kolejności co w pełnej siatce
+    wszystkie = siatka.indeksy.reshape(-1, 3).tolist()
+    pozostale = indeksy.reshape(-1, 3).tolist()
+    assert [t for t in wszystkie if t in pozostale] == pozostale
+
+
+def test_zdegenerowane_powtorzony_wierzcholek():
+    pozycje = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [2, 0, 0]], dtype=np.float32)
+    indeksy = np.array([0, 1, 2, 0, 0, 2, 0, 1, 3, 1, 2, 2], dtype=np.uint16)
+    wynik, usuniete = usun_zdegenerowane(pozycje, indeksy)
+    # (0, 0, 2) i (1, 2, 2) mają powtórzony wierzchołek, (0, 1, 3) leży na prostej
+    assert wynik.tolist() == [0, 1, 2]
+    assert usuniete == 3
+
+
+def test_oczysc_siatke():
+    siatka = zbuduj_jajko(50)
+    wynik, raport = oczysc_siatke(siatka)
+    assert raport == {"trojkaty": (4802, 4704), "zdegenerowane": 98}
+    assert wynik.indeksy.dtype == np.uint16
+    # Wierzchołki zostają bez zmian - szew tekstury i bieguny mają te same
+    # pozycje, ale inne współrzędne tekstury
+    assert wynik.liczba_wierzcholkow == siatka.liczba_wierzcholkow
+    assert np.array_equal(wynik.uv, siatka.uv)
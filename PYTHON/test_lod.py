@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# Testy wyboru poziomu szczegółowości z lod.py: SiatkaLOD.wybierz ma brać
+# najrzadszy poziom, przy którym krawędź trójkąta na ekranie nie przekracza
+# PIKSELE_NA_KRAWEDZ. Bufory GL nie są potrzebne - tylko lista poziomów.
+#
+# Użycie: python3 -m pytest test_lod.py
+import math
+import pytest
+
+from lod import SiatkaLOD, rozmiar_na_ekranie, PIKSELE_NA_KRAWEDZ, MAKS_N, MIN_N
+
+POZIOMY = [1025, 513, 257, 129, 65, 33, 17]
+
+
+def lod_bez_gl(promien=5.0):
+    lod = SiatkaLOD.__new__(SiatkaLOD)
+    lod.promien = promien
+    lod.poziomy = [(n, None, 6 * (n - 1) ** 2, None) for n in POZIOMY]
+    lod.ustaw_poziom(0)
+    return lod
+
+
+def test_rozmiar_na_ekranie():
+    # fov 90 stopni: tan(45) = 1, więc średnica = promien / odleglosc * wysokosc
+    assert rozmiar_na_ekranie(1.0, 10.0, 90.0, 600) == pytest.approx(60.0)
+    assert rozmiar_na_ekranie(1.0, 20.0, 90.0, 600) == pytest.approx(30.0)
+    assert rozmiar_na_ekranie(5.0, 4.0, 70.0, 600) == math.inf  # kamera w środku kuli
+
+
+def test_poziomy_siatki():
+    # Od MAKS_N co drugi wiersz i kolumna aż do MIN_N
+    assert POZIOMY[0] == MAKS_N and POZIOMY[-1] == MIN_N
+
+
+@pytest.mark.parametrize("odleglosc, wysokosc, oczekiwane_n", [
+    (1000.0, 600, 17),    # kilka pikseli na ekranie - najrzadszy poziom
+    (4.0, 600, 1025),     # kamera w jajku - najgęstszy
+    (5.5, 600, 513),
+    (40.0, 600, 65),
+    (40.0, 1200, 129),    # dwa razy wyższe okno - dwa razy gęstsza siatka
+])
+def test_wybierz(odleglosc, wysokosc, oczekiwane_n):
+    lod = lod_bez_gl()
+    assert lod.wybierz(odleglosc, wysokosc) == oczekiwane_n
+    assert lod.n == oczekiwane_n
+    assert lod.liczba_indeksow == 6 * (oczekiwane_n - 1) ** 2
+
+
+@pytest.mark.parametrize("wysokosc", [300, 600, 1080])
+def test_wybierz_krawedz_na_ekranie(wysokosc):
+    # Dla każdej odległości: wybrany poziom daje krawędzie najwyżej
+    # PIKSELE_NA_KRAWEDZ, a następny rzadszy już by je przekroczył
+    lod = lod_bez_gl()
+    for odleglosc in [6.0 * 1.1 ** k for k in range(60)]:
+        n = lod.wybierz(odleglosc, wysokosc)
+        obwod = rozmiar_na_ekranie(lod.promien, odleglosc, 70.0, wysokosc) * math.pi
+        if n != POZIOMY[0]:
+            assert obwod / n <= PIKSELE_NA_KRAWEDZ
+        if n != POZIOMY[-1]:
+            assert obwod / POZIOMY[POZIOMY.index(n) + 1] > PIKSELE_NA_KRAWEDZ
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# Testy macierzy z macierze.py i kamery z kamera.py. Wzorcowe macierze
+# wypisane są ręcznie ze wzorów z dokumentacji gluPerspective, gluLookAt
+# i glRotatef dla prostych argumentów (kąty 90 stopni, osie układu).
+#
+# Użycie: python3 -m pytest test_macierze.py
+import numpy as np
+import pytest
+
+from macierze import perspektywa, patrz_na, widok_kamery, obrot, przesuniecie, skala, macierz_normalnych
+from kamera import Kamera
+
+
+def punkt(macierz, x, y, z):
+    wynik = macierz @ np.array([x, y, z, 1.0])
+    return (wynik[:3] / wynik[3]).tolist()
+
+
+def test_perspektywa():
+    # fov 90: f = 1 / tan(45) = 1; (daleko + blisko) / (blisko - daleko) = -3,
+    # 2 * daleko * blisko / (blisko - daleko) = -4
+    oczekiwana = [[0.5, 0, 0, 0], [0, 1, 0, 0], [0, 0, -3, -4], [0, 0, -1, 0]]
+    assert np.allclose(perspektywa(90.0, 2.0, 1.0, 2.0), oczekiwana)
+    # Płaszczyzna bliska i daleka trafiają na z = -1 i z = 1
+    m = perspektywa(70.0, 1.0, 0.1, 300.0)
+    assert punkt(m, 0, 0, -0.1)[2] == pytest.approx(-1.0, abs=1e-5)
+    assert punkt(m, 0, 0, -300.0)[2] == pytest.approx(1.0, abs=1e-5)
+    # fov 60: górna krawędź bryły (y = z * tan(30)) na y = 1
+    assert punkt(perspektywa(60.0, 1.0, 1.0, 10.0), 0, np.tan(np.pi / 6) * 5, -5)[1] == pytest.approx(1.0)
+
+
+def test_patrz_na():
+    # Z osi Z na środek: tylko przesunięcie o -5
+    assert np.allclose(patrz_na([0, 0, 5], [0, 0, 0], [0, 1, 0]), przesuniecie(0, 0, -5))
+    # Z osi X: prawo = (0, 0, -1), góra = (0, 1, 0), do tyłu = (1, 0, 0)
+    oczekiwana = [[0, 0, -1, 0], [0, 1, 0, 0], [1, 0, 0, -3], [0, 0, 0, 1]]
+    assert np.allclose(patrz_na([3, 0, 0], [0, 0, 0], [0, 1, 0]), oczekiwana)
+
+
+@pytest.mark.parametrize("os_, oczekiwana", [
+    ((1, 0, 0), [[1, 0, 0], [0, 0, -1], [0, 1, 0]]),
+    ((0, 1, 0), [[0, 0, 1], [0, 1, 0], [-1, 0, 0]]),
+    ((0, 0, 1), [[0, -1, 0], [1, 0, 0], [0, 0, 1]]),
+    ((0, 0, 3), [[0, -1, 0], [1, 0, 0], [0, 0, 1]]),   # oś nie musi być jednostkowa
+])
+def test_obrot_90(os_, oczekiwana):
+    m = obrot(90.0, *os_)
+    assert np.allclose(m[:3, :3], oczekiwana, atol=1e-6)
+    assert np.allclose(m[3], [0, 0, 0, 1]) and np.allclose(m[:3, 3], 0)
+
+
+def test_obrot_dowolna_os():
+    # Obrót o 120 stopni wokół (1, 1, 1) przestawia osie x -> y -> z -> x
+    m = obrot(120.0, 1, 1, 1)
+    assert np.allclose(m[:3, :3], [[0, 0, 1], [1, 0, 0], [0, 1, 0]], atol=1e-6)
+
+
+def test_skala_i_normalne():
+    assert np.allclose(skala(2, 3, 4) @ [1, 1, 1, 1], [2, 3, 4, 1])
+    # Przy nierównomiernym skalowaniu normalne skalujemy odwrotnie
+    assert np.allclose(macierz_normalnych(skala(2, 1, 1)), np.diag([0.5, 1, 1]))
+
+
+@pytest.mark.parametrize("theta, phi, p, oczekiwany", [
+    (0.0, 0.0, (1, 0, 0), [1, 0, -10]),
+    (90.0, 0.0, (1, 0, 0), [0, 0, -11]),     # glRotatef(90, Y): x -> -z
+    (0.0, 90.0, (0, 1, 0), [0, 0, -9]),      # glRotatef(90, X): y -> z
+    (90.0, 90.0, (0, 1, 0), [1, 0, -10]),    # najpierw phi (X), potem theta (Y)
+])
+def test_kamera_jak_glu(theta, phi, p, oczekiwany):
+    # gluLookAt(0, 0, 10, 0, 0, 0, 0, 1, 0); glRotatef(theta, 0, 1, 0); glRotatef(phi, 1, 0, 0)
+    assert np.allclose(punkt(widok_kamery([0.0, 0.0, 10.0], theta, phi), *p), oczekiwany, atol=1e-5)
+    kamera = Kamera()
+    kamera.ustaw([0.0, 0.0, 10.0], theta, phi)
+    assert np.allclose(punkt(kamera.widok, *p), oczekiwany, atol=1e-5)
+
+
+def test_kamera_przelicza_po_zmianie():
+    kamera = Kamera()
+    viewer = [0.0, 0.0, 10.0]
+    kamera.ustaw(viewer, 30.0, 0.0)
+    kamera.widok, kamera.rzutowanie
+    wersja, przeliczenia = kamera.wersja, kamera.przeliczenia
+
+    # Ten sam stan - macierze z pamięci
+    kamera.ustaw(list(viewer), 30.0, 0.0)
+    kamera.ustaw_rzutowanie()
+    kamera.widok, kamera.rzutowanie
+    assert (kamera.wersja, kamera.przeliczenia) == (wersja, przeliczenia)
+
+    # viewer zmieniony w miejscu (kółko myszy) i nowe proporcje okna
+    viewer[2] = 20.0
+    kamera.ustaw(viewer, 30.0, 0.0)
+    kamera.ustaw_rzutowanie(aspekt=2.0)
+    assert np.allclose(kamera.rzutowanie, perspektywa(70.0, 2.0, 0.1, 300.0))
+    assert kamera.przeliczenia == przeliczenia + 1
+    assert np.allclose(kamera.widok, patrz_na(viewer, [0, 0, 0], [0, 1, 0]) @ obrot(30.0, 0, 1, 0))
+    assert kamera.wersja == wersja + 2
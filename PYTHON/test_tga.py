@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Testy czytnika TGA z tga.py: pliki zapisane przez PIL (RGB, RGBA, skala
+# szarości; bez kompresji i z RLE; z początkiem na dole i na górze) mają dać
+# te same piksele co PIL, w kolejności wierszy GL (pierwszy = dół obrazka).
+#
+# Użycie: python3 -m pytest test_tga.py
+import os
+import glob
+import numpy as np
+import pytest
+from PIL import Image
+
+from tga import wczytaj_tga, naglowek_tga, NAGLOWEK, OD_PRAWEJ
+
+
+def piksele_pil(plik):
+    # Oczekiwany wynik: jak tekstury_gl._dekoduj, odwrócone wiersze RGB
+    return np.asarray(Image.open(plik).convert("RGB"))[::-1]
+
+
+def losowy_obraz(tryb, wysokosc, szerokosc, ziarno=0):
+    # Szum z wstawionymi jednolitymi pasami - RLE dostaje i pakiety
+    # powtórzeń (także dłuższe niż 128 pikseli), i pakiety surowe
+    generator = np.random.default_rng(ziarno)
+    kanaly = {"RGB": 3, "RGBA": 4, "L": 1}[tryb]
+    dane = generator.integers(0, 256, (wysokosc, szerokosc, kanaly), dtype=np.uint8)
+    dane[wysokosc // 3:wysokosc // 2] = dane[0, 0]
+    dane[:, :szerokosc // 4] = dane[-1, -1]
+    return Image.fromarray(dane[:, :, 0] if tryb == "L" else dane, tryb)
+
+
+@pytest.mark.parametrize("tryb", ["RGB", "RGBA", "L"])
+@pytest.mark.parametrize("kompresja", [None, "tga_rle"])
+@pytest.mark.parametrize("orientacja", [-1, 1])  # -1: pierwszy wiersz na dole, 1: na górze
+@pytest.mark.parametrize("wysokosc, szerokosc", [(1, 1), (5, 7), (64, 33), (3, 300), (256, 256)])
+def test_jak_pil(tmp_path, tryb, kompresja, orientacja, wysokosc, szerokosc):
+    plik = tmp_path / "obraz.tga"
+    opcje = {"orientation": orientacja}
+    if kompresja:
+        opcje["compression"] = kompresja
+    losowy_obraz(tryb, wysokosc, szerokosc).save(plik, **opcje)
+
+    piksele = wczytaj_tga(plik)
+    assert piksele.shape == (wysokosc, szerokosc, 3)
+    assert piksele.dtype == np.uint8
+    assert np.array_equal(piksele, piksele_pil(plik))
+
+
+def test_od_prawej(tmp_path):
+    # PIL nie zapisuje pikseli od prawej - ustawiamy bit w deskryptorze sami
+    plik = tmp_path / "obraz.tga"
+    losowy_obraz("RGB", 6, 9).save(plik)
+    dane = bytearray(plik.read_bytes())
+    dane[NAGLOWEK.size - 1] |= OD_PRAWEJ
+    plik_od_prawej = tmp_path / "od_prawej.tga"
+    plik_od_prawej.write_bytes(bytes(dane))
+
+    assert np.array_equal(wczytaj_tga(plik_od_prawej), wczytaj_tga(plik)[:, ::-1])
+
+
+def test_bez_kopii(tmp_path):
+    # Nieskompresowany TGA: widok na plik zmapowany w pamięci, tylko do odczytu
+    plik = tmp_path / "obraz.tga"
+    losowy_obraz("RGB", 16, 16).save(plik)
+    piksele = wczytaj_tga(plik)
+    assert not piksele.flags.writeable
+    assert not piksele.flags.owndata
+
+
+def test_tekstury_laboratorium():
+    # Pliki z repozytorium, które są TGA, czytamy tak samo jak PIL
+    katalog = os.path.dirname(os.path.abspath(__file__))
+    sprawdzone = 0
+    for plik in sorted(glob.glob(os.path.join(katalog, "**", "*.tga"), recursive=True)):
+        try:
+            piksele = wczytaj_tga(plik)
+        except ValueError:
+            continue  # np. JPEG z rozszerzeniem .tga - ten dekoduje PIL
+        assert np.array_equal(piksele, piksele_pil(plik)), plik
+        sprawdzone += 1
+    assert sprawdzone > 0
+
+
+@pytest.mark.parametrize("dane", [
+    b"",
+    b"\xff\xd8\xff\xe0" + bytes(40),                     # JPEG
+    bytes([0, 1, 1]) + bytes(15) + bytes(64),             # obraz z paletą (typ 1)
+    bytes([0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 4, 0, 16, 0]) + bytes(64),  # 16 bitów
+])
+def test_nie_tga(tmp_path, dane):
+    plik = tmp_path / "zly.tga"
+    plik.write_bytes(dane)
+    with pytest.raises(ValueError):
+        wczytaj_tga(plik)
+
+
+def test_obciety_plik(tmp_path):
+    plik = tmp_path / "obraz.tga"
+    losowy_obraz("RGB", 8, 8).save(plik)
+    obciety = tmp_path / "obciety.tga"
+    obciety.write_bytes(plik.read_bytes()[:100])
+    with pytest.raises(ValueError):
+        wczytaj_tga(obciety)
+
+
+def test_uszkodzone_rle(tmp_path):
+    plik = tmp_path / "obraz.tga"
+    losowy_obraz("RGB", 32, 32).save(plik, compression="tga_rle")
+    obciety = tmp_path / "obciety.tga"
+    obciety.write_bytes(plik.read_bytes()[:NAGLOWEK.size + 200])
+    with pytest.raises(ValueError):
+        wczytaj_tga(obciety)
+
+
+def test_naglowek():
+    naglowek = NAGLOWEK.pack(0, 0, 10, 0, 0, 0, 0, 0, 640, 480, 32, 0x28)
+    info = naglowek_tga(naglowek)
+    assert (info["szerokosc"], info["wysokosc"], info["bajty"], info["rle"]) == (640, 480, 4, True)
+    assert info["poczatek"] == NAGLOWEK.size
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Testy odrzucania z widocznosc.py: zapytanie BVH ma zwracać dokładnie te
+# kopie, które przechodzą test sfera - bryła widzenia wprost (widoczne_sfery).
+#
+# Użycie: python3 -m pytest test_widocznosc.py
+import numpy as np
+import pytest
+
+from macierze import perspektywa, patrz_na, obrot
+from widocznosc import BVH, plaszczyzny_widzenia, widoczne_sfery, sfera_otaczajaca, sfery_kopii
+from instancje import macierze_instancji
+
+
+def plaszczyzny_kamery(viewer, theta, phi, fov=70.0, blisko=0.1, daleko=300.0):
+    # Jak Kamera: gluLookAt na środek sceny, potem obroty theta (Y) i phi (X)
+    widok = patrz_na(viewer, (0.0, 0.0, 0.0), (0.0, 1.0, 0.0)) @ obrot(theta, 0, 1, 0) @ obrot(phi, 1, 0, 0)
+    return plaszczyzny_widzenia(perspektywa(fov, 1.0, blisko, daleko) @ widok)
+
+
+def losowe_sfery(liczba, rozmiar=80.0, ziarno=0):
+    generator = np.random.default_rng(ziarno)
+    srodki = generator.uniform(-rozmiar / 2, rozmiar / 2, (liczba, 3)).astype(np.float32)
+    promienie = generator.uniform(0.1, 2.0, liczba).astype(np.float32)
+    return srodki, promienie
+
+
+@pytest.mark.parametrize("liczba, w_lisciu", [(1, 64), (100, 4), (5000, 64), (5000, 1)])
+@pytest.mark.parametrize("viewer, theta, phi", [
+    ([0.0, 0.0, 20.0], 0.0, 0.0),      # kamera w środku sceny - część kopii widoczna
+    ([0.0, 0.0, 150.0], 30.0, 10.0),   # cała scena w kadrze
+    ([0.0, 0.0, 20.0], 180.0, 0.0),
+    ([0.0, 0.0, 400.0], 0.0, 0.0),     # scena za płaszczyzną daleką
+])
+def test_bvh_jak_test_wprost(liczba, w_lisciu, viewer, theta, phi):
+    srodki, promienie = losowe_sfery(liczba)
+    plaszczyzny = plaszczyzny_kamery(viewer, theta, phi)
+    drzewo = BVH(srodki, promienie, w_lisciu)
+
+    oczekiwane = np.flatnonzero(widoczne_sfery(plaszczyzny, srodki, promienie))
+    wynik = drzewo.zapytanie(plaszczyzny)
+    assert np.array_equal(wynik, oczekiwane)
+    assert drzewo.odwiedzone >= 1
+
+
+def test_bvh_pomija_niewidoczne_galezie():
+    # Kamera widzi mały fragment sceny - zapytanie nie odwiedza całego drzewa
+    srodki, promienie = losowe_sfery(20000)
+    drzewo = BVH(srodki, promienie)
+    drzewo.zapytanie(plaszczyzny_kamery([0.0, 0.0, 20.0], 0.0, 0.0, fov=20.0))
+    wezly = 2 * -(-len(srodki) // 64)  # rząd wielkości liczby węzłów drzewa
+    assert drzewo.odwiedzone < wezly / 2
+
+
+def test_bvh_puste():
+    drzewo = BVH(np.zeros((0, 3), np.float32), np.zeros(0, np.float32))
+    assert len(drzewo) == 0
+    assert len(drzewo.zapytanie(plaszczyzny_kamery([0.0, 0.0, 10.0], 0.0, 0.0))) == 0
+
+
+def test_plaszczyzny_widzenia():
+    plaszczyzny = plaszczyzny_kamery([0.0, 0.0, 10.0], 0.0, 0.0, blisko=1.0, daleko=100.0)
+    # Środek, tuż za płaszczyzną bliską, przed nią, za daleką, z boku, za kamerą
+    punkty = np.array([[0, 0, 0], [0, 0, 8.5], [0, 0, 9.5], [0, 0, -95], [50, 0, 0], [0, 0, 20]],
+                      dtype=np.float32)
+    assert (widoczne_sfery(plaszczyzny, punkty, np.zeros(len(punkty))).tolist()
+            == [True, True, False, False, False, False])
+    # Sfera poza bryłą, ale sięgająca do niej, jest widoczna
+    assert widoczne_sfery(plaszczyzny, punkty[4:5], [45.0]).tolist() == [True]
+
+
+def test_sfery_kopii_otaczaja_wierzcholki():
+    generator = np.random.default_rng(3)
+    pozycje = generator.normal(size=(200, 3)).astype(np.float32)
+    srodek, promien = sfera_otaczajaca(pozycje)
+    macierze = macierze_instancji(generator.uniform(-10, 10, (50, 3)), generator.uniform(0, 360, 50),
+                                  generator.uniform(0.5, 3.0, 50))
+    srodki, promienie = sfery_kopii(macierze, srodek, promien)
+
+    # Wierzchołki każdej kopii po przekształceniu leżą w jej sferze
+    wierzcholki = pozycje @ macierze[:, :3, :3].transpose(0, 2, 1) + macierze[:, None, :3, 3]
+    odleglosci = np.linalg.norm(wierzcholki - srodki[:, None], axis=2)
+    assert (odleglosci <= promienie[:, None] * (1 + 1e-5)).all()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# Czytnik plików TGA w NumPy, bez PIL. Tekstury laboratorium to
+# nieskompresowane 24-bitowe TGA z początkiem w lewym dolnym rogu - piksele
+# leżą w pliku dokładnie w kolejności, której chce glTexImage2D (pierwszy
+# wiersz = dół obrazka), tylko jako BGR. Plik jest więc mapowany do pamięci,
+# a wczytaj_tga zwraca widok RGB na te same bajty (odwrócona kolejność kanałów,
+# bez kopii); tekstury_gl.wyslij_poziom wysyła go do GL jako GL_BGR.
+#
+# Skompresowane TGA (RLE) rozpakowujemy wektorowo. Inne pliki (np. JPEG
+# z rozszerzeniem .tga) dają ValueError - wtedy dekoduje je PIL.
+import struct
+import numpy as np
+
+# Nagłówek TGA: długość pola ID, typ mapy kolorów, typ obrazu, opis mapy
+# kolorów (pierwszy wpis, liczba wpisów, bity na wpis), początek x / y,
+# szerokość, wysokość, bity na piksel, deskryptor obrazu
+NAGLOWEK = struct.Struct("<BBBHHBHHHHBB")
+
+# Typy obrazu: 2 / 10 - kolor (BGR, BGRA), 3 / 11 - skala szarości; 10 i 11 z RLE
+TYPY_KOLOR = (2, 10)
+TYPY_SZAROSC = (3, 11)
+TYPY_RLE = (10, 11)
+
+# Deskryptor: bit 5 - pierwszy wiersz to góra obrazka, bit 4 - piksele od prawej
+GORA_NA_POCZATKU = 0x20
+OD_PRAWEJ = 0x10
+
+
+def naglowek_tga(dane):
+    # Słownik z polami nagłówka; ValueError, gdy to nie jest obsługiwany TGA
+    if len(dane) < NAGLOWEK.size:
+        raise ValueError("Za krótki plik TGA")
+    (dlugosc_id, typ_mapy, typ, _, wpisy_mapy, bity_mapy, _, _,
+     szerokosc, wysokosc, bity, deskryptor) = NAGLOWEK.unpack_from(dane)
+
+    if typ_mapy not in (0, 1) or typ not in TYPY_KOLOR + TYPY_SZAROSC:
+        raise ValueError(f"Nieobsługiwany typ TGA ({typ_mapy}, {typ})")
+    if typ in TYPY_KOLOR and bity not in (24, 32) or typ in TYPY_SZAROSC and bity != 8:
+        raise ValueError(f"Nieobsługiwana liczba bitów na piksel TGA: {bity}")
+    if szerokosc == 0 or wysokosc == 0:
+        raise ValueError("Pusty obraz TGA")
+
+    # Mapa kolorów (przy obrazach bez palety - ignorowana) leży przed pikselami
+    poczatek = NAGLOWEK.size + dlugosc_id + (wpisy_mapy * ((bity_mapy + 7) // 8) if typ_mapy else 0)
+    return {
+        "szerokosc": szerokosc,
+        "wysokosc": wysokosc,
+        "bajty": bity // 8,
+        "rle": typ in TYPY_RLE,
+        "deskryptor": deskryptor,
+        "poczatek": poczatek,
+    }
+
+
+def rozpakuj_rle(dane, poczatek, liczba_pikseli, bajty):
+    # Pakiety RLE: bajt nagłówka h, potem przy h & 0x80 jeden piksel powtórzony
+    # (h & 0x7f) + 1 razy, a bez tego bitu (h + 1) pikseli wprost. Pakiety
+    # mają różną długość, więc ich początków nie da się policzyć naraz -
+    # ale "następny pakiet, gdyby pakiet zaczynał się tutaj" da się policzyć
+    # dla każdego bajtu. Początki to wtedy kolejne skoki od pierwszego bajtu;
+    # zbieramy je podwajaniem skoków (log2(n) kroków na całych tablicach).
+    bajty_pakietow = np.asarray(dane, dtype=np.uint8)[poczatek:]
+    n = len(bajty_pakietow)
+    naglowki = bajty_pakietow.astype(np.int32)
+    powtorzenie = naglowki >= 0x80
+    dlugosci = (naglowki & 0x7F) + 1
+    nastepny = np.arange(1, n + 1, dtype=np.int32) + np.where(powtorzenie, bajty, dlugosci * bajty)
+    nastepny = np.minimum(nastepny, n)  # n - poza danymi
+
+    # Piksele z kolejnych pakietów - liczymy, ile pakietów trzeba, żeby pokryć obraz
+    osiagalne = np.zeros(n + 1, dtype=bool)
+    osiagalne[0] = True
+    skok = np.append(nastepny, np.int32(n))
+    while True:
+        osiagalne[skok[osiagalne]] = True
+        # Każdy skok przesuwa o co najmniej bajt - po log2(n) podwojeniach skok[0] = n
+        if skok[0] == n:
+            break
+        skok = skok[skok]
+    pakiety = np.flatnonzero(osiagalne[:n])
+
+    # Tylko pakiety potrzebne do liczba_pikseli (za nimi może być stopka pliku)
+    narastajaco = np.cumsum(dlugosci[pakiety])
+    pakiety = pakiety[:int(np.searchsorted(narastajaco, liczba_pikseli)) + 1]
+    ile = dlugosci[pakiety]
+    if ile.sum() < liczba_pikseli:
+        raise ValueError("Uszkodzone dane RLE w pliku TGA")
+
+    # Bajt początkowy każdego piksela: w pakiecie powtórzeń stały, w surowym co `bajty`
+    numer = np.arange(ile.sum()) - np.repeat(np.cumsum(ile) - ile, ile)
+    krok = np.where(powtorzenie[pakiety], 0, bajty)
+    zrodla = np.repeat(pakiety + 1, ile) + numer * np.repeat(krok, ile).astype(np.int64)
+    zrodla = zrodla[:liczba_pikseli]
+    if zrodla.max() + bajty > n:
+        raise ValueError("Uszkodzone dane RLE w pliku TGA")
+    return bajty_pakietow[zrodla[:, None] + np.arange(bajty)]
+
+
+def wczytaj_tga(sciezka):
+    # Piksele (wysokość, szerokość, 3) uint8 RGB, pierwszy wiersz = dół
+    # obrazka (jak tekstury_gl.wczytaj_piksele). Nieskompresowany TGA:
+    # widok tylko do odczytu na plik zmapowany w pamięci. ValueError, gdy
+    # plik nie jest obsługiwanym TGA.
+    plik = np.memmap(sciezka, dtype=np.uint8, mode="r")
+    info = naglowek_tga(plik[:NAGLOWEK.size].tobytes())
+    szerokosc, wysokosc, bajty = info["szerokosc"], info["wysokosc"], info["bajty"]
+    liczba = szerokosc * wysokosc
+
+    if info["rle"]:
+        piksele = rozpakuj_rle(plik, info["poczatek"], liczba, bajty)
+    else:
+        koniec = info["poczatek"] + liczba * bajty
+        if koniec > len(plik):
+            raise ValueError("Za krótki plik TGA")
+        piksele = plik[info["poczatek"]:koniec]
+    piksele = piksele.reshape(wysokosc, szerokosc, bajty)
+
+    # Orientacja: GL chce wierszy od dołu - odwrócenie to tylko widok
+    if info["deskryptor"] & GORA_NA_POCZATKU:
+        piksele = piksele[::-1]
+    if info["deskryptor"] & OD_PRAWEJ:
+        piksele = piksele[:, ::-1]
+
+    if bajty == 1:
+        return np.repeat(piksele, 3, axis=2)
+    # BGR(A) -> RGB: odwrócone kanały, też bez kopii
+    return piksele[:, :, 2::-1]
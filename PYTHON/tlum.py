@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# Tłum jajek (zad5.0) i ostrosłupów (zad3.5 - zad4.5): tysiące kopii, każda
+# z własnym położeniem, obrotem i teksturą z atlasu. Każdy rodzaj siatki
+# to jedno glDrawElementsInstanced (instancje.py); [I] przełącza na pętlę
+# w Pythonie rysującą obiekty po kolei (glMultMatrixf + glDrawElements).
+# Rysowane są tylko kopie w bryle widzenia - BVH nad sferami kopii
+# (widocznosc.py); [C] włącza i wyłącza odrzucanie, liczby wysłanych
+# i odrzuconych obiektów pokazuje HUD profilera (--profil).
+#
+# Użycie: python3 tlum.py [--liczba 2000] [--ruch] [--petla] [--bez-odrzucania]
+#   --ruch  - wszystkie kopie obracają się, macierze liczone co klatkę w NumPy
+import sys
+import math
+import numpy as np
+
+from glfw.GLFW import *
+from OpenGL.GL import *
+
+from jajko import zbuduj_jajko, oczysc_siatke
+from ostroslup import SIATKI
+from bufory import SiatkaVBO
+from atlas import AtlasTekstur, zbuduj_atlas
+from instancje import Instancje, program_instancji, ustaw_atlas, macierze_instancji
+from widocznosc import BVH
+from shadery import wyczysc_pamiec
+from silnik import Scena, uruchom
+
+# Gęstość siatki jajka - przy tysiącach kopii wystarczy kilkaset trójkątów
+N_JAJKA = 16
+
+# Kopie leżą na kwadracie ROZMIAR_SCENY x ROZMIAR_SCENY w płaszczyźnie XY
+ROZMIAR_SCENY = 80.0
+
+PLIKI_TEKSTUR = [
+    "tekstury/D1_t.tga",
+    "tekstury/D5_t.tga",
+    "tekstury/D9_t.tga",
+    "tekstury/M1_t.tga",
+    "tekstury/N1_t.tga",
+    "tekstury/P1_t.tga",
+    "tekstury/P2_t.tga",
+]
+
+
+class Tlum(Scena):
+    tytul = "Lab 6 - Tłum jajek i ostrosłupów (instancje)"
+    rozmiar_okna = (600, 600)
+
+    def __init__(self):
+        super().__init__()
+        self.viewer = [0.0, 0.0, 65.0]
+        self.liczba = 2000
+        if "--liczba" in sys.argv:
+            self.liczba = int(sys.argv[sys.argv.index("--liczba") + 1])
+        self.RUCH = "--ruch" in sys.argv
+
+        # Instancje (jedno wywołanie na rodzaj siatki); [I] przełącza na pętlę
+        self.UZYJ_INSTANCJI = "--petla" not in sys.argv
+        self.program = None
+        self.atlas = None
+
+        # Odrzucanie kopii poza bryłą widzenia [C]
+        self.UZYJ_ODRZUCANIA = "--bez-odrzucania" not in sys.argv
+
+        # Rodzaje siatek: jajko (widać jego tylne ściany - jak w zad5.0) i ostrosłup
+        self.siatki = []      # (SiatkaVBO, strona odrzucanych ścian)
+        self.instancje = []   # Instancje dla każdej siatki
+        self.drzewa = []      # BVH kopii każdej siatki
+        self.katy = []        # początkowe kąty obrotu kopii (do --ruch)
+        self.pozycje = []
+        self.skala = 1.0
+
+    def startup(self):
+        super().startup()
+
+        jajko, _ = oczysc_siatke(zbuduj_jajko(N_JAJKA))
+        self.siatki = [(SiatkaVBO(jajko), GL_FRONT), (SiatkaVBO(SIATKI[True]), GL_BACK)]
+
+        self.atlas = AtlasTekstur(*zbuduj_atlas(PLIKI_TEKSTUR))
+        self.atlas.podepnij(0)
+        self.program = program_instancji()
+        ustaw_atlas(self.program, self.atlas)
+
+        self.rozmiesc()
+
+    def rozmiesc(self):
+        # Kopie na siatce kwadratowej, na zmianę jajko i ostrosłup, z losowym
+        # obrotem i teksturą (stałe ziarno - ten sam obraz przy każdym uruchomieniu)
+        losowe = np.random.default_rng(0)
+        bok = max(1, math.ceil(math.sqrt(self.liczba)))
+        krok = ROZMIAR_SCENY / bok
+        numery = np.arange(self.liczba)
+        wszystkie = np.zeros((self.liczba, 3), dtype=np.float32)
+        wszystkie[:, 0] = (numery % bok + 0.5) * krok - ROZMIAR_SCENY / 2
+        wszystkie[:, 1] = (numery // bok + 0.5) * krok - ROZMIAR_SCENY / 2
+        katy = losowe.uniform(0.0, 360.0, self.liczba).astype(np.float32)
+        tekstury = losowe.integers(0, len(self.atlas), self.liczba)
+        # Jajko i ostrosłup mają ok. 10 jednostek - tyle, żeby mieściły się w kratce
+        self.skala = 0.8 * krok / 10.0
+
+        for instancje in self.instancje:
+            instancje.usun()
+        self.instancje, self.drzewa, self.katy, self.pozycje = [], [], [], []
+        for rodzaj, (siatka, _) in enumerate(self.siatki):
+            wybrane = numery % len(self.siatki) == rodzaj
+            self.pozycje.append(wszystkie[wybrane])
+            self.katy.append(katy[wybrane])
+            macierze = macierze_instancji(wszystkie[wybrane], katy[wybrane], self.skala)
+            self.instancje.append(Instancje(siatka, macierze, tekstury[wybrane]))
+            self.drzewa.append(self.zbuduj_drzewo(siatka, wszystkie[wybrane]))
+
+    def zbuduj_drzewo(self, siatka, pozycje):
+        # Sfery kopii niezależne od kąta obrotu wokół Y - drzewo budujemy raz,
+        # także przy --ruch: środek sfery siatki leży na osi obrotu, a promień
+        # obejmuje jej odsunięcie od osi
+        srodek, promien = siatka.sfera
+        srodki = pozycje + np.array([0.0, srodek[1], 0.0], dtype=np.float32) * self.skala
+        promienie = np.full(len(pozycje), (promien + math.hypot(srodek[0], srodek[2])) * self.skala)
+        return BVH(srodki, promienie)
+
+    def widoczne(self):
+        # Numery widocznych kopii każdej siatki (None - wszystkie)
+        if not self.UZYJ_ODRZUCANIA:
+            self.profiler.obiekty(self.liczba, 0)
+            return [None] * len(self.drzewa)
+        plaszczyzny = self.kamera.plaszczyzny
+        wybrane = [drzewo.zapytanie(plaszczyzny) for drzewo in self.drzewa]
+        wyslane = sum(len(numery) for numery in wybrane)
+        self.profiler.obiekty(wyslane, self.liczba - wyslane)
+        return wybrane
+
+    def obroc(self, czas):
+        # --ruch: nowe macierze wszystkich kopii (bez zmiany tekstur)
+        for instancje, pozycje, katy in zip(self.instancje, self.pozycje, self.katy):
+            instancje.ustaw(macierze_instancji(pozycje, katy + czas * 90.0, self.skala))
+
+    def shutdown(self):
+        super().shutdown()
+        for instancje in self.instancje:
+            instancje.usun()
+        for siatka, _ in self.siatki:
+            siatka.usun()
+        self.atlas.usun()
+        wyczysc_pamiec()
+        self.program = None
+
+    def render(self, time):
+        if self.RUCH:
+            self.obroc(time)
+        super().render(time)
+
+    def ustaw_kamere(self):
+        self.kamera.ustaw(self.viewer, self.theta, self.phi)
+        if self.UZYJ_INSTANCJI:
+            self.program.uzyj()
+            self.program.ustaw("u_vp", self.kamera.rzutowanie @ self.kamera.widok)
+        else:
+            glUseProgram(0)
+            self.kamera.zaladuj()
+
+    def rysuj(self):
+        widoczne = self.widoczne()
+        if self.UZYJ_INSTANCJI:
+            for (_, odrzucane), instancje, wybrane in zip(self.siatki, self.instancje, widoczne):
+                glCullFace(odrzucane)
+                instancje.rysuj(self.program, wybrane)
+        else:
+            self.rysuj_petla(widoczne)
+        glCullFace(GL_BACK)
+
+    def rysuj_petla(self, widoczne):
+        # Dla porównania: każdy obiekt osobno, z macierzą w potoku stałym
+        # i teksturą przez macierz tekstury atlasu
+        for (siatka, odrzucane), instancje, wybrane in zip(self.siatki, self.instancje, widoczne):
+            glCullFace(odrzucane)
+            for dane in (instancje.dane if wybrane is None else instancje.dane[wybrane]):
+                glPushMatrix()
+                glMultMatrixf(dane[:16])
+                self.atlas.podepnij(int(dane[16]))
+                siatka.rysuj()
+                glPopMatrix()
+
+    def klawisz(self, key):
+        # Instancje / pętla po obiektach [I]
+        if key == GLFW_KEY_I:
+            self.UZYJ_INSTANCJI = not self.UZYJ_INSTANCJI
+            print(f"Rysowanie instancjami: {self.UZYJ_INSTANCJI}")
+        # Odrzucanie poza bryłą widzenia [C]
+        elif key == GLFW_KEY_C:
+            self.UZYJ_ODRZUCANIA = not self.UZYJ_ODRZUCANIA
+            print(f"Odrzucanie poza bryłą widzenia: {self.UZYJ_ODRZUCANIA}")
+
+    def przewin(self, y_offset):
+        self.viewer[2] = min(max(self.viewer[2] * 0.9 ** y_offset, 10.0), 250.0)
+
+
+scena = Tlum()
+
+
+if __name__ == '__main__':
+    uruchom(scena)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# Odrzucanie obiektów poza bryłą widzenia (frustum culling): sfery i
+# prostopadłościany otaczające siatek, płaszczyzny bryły widzenia z macierzy
+# rzutowanie @ widok i hierarchia brył otaczających (BVH) nad kopiami
+# obiektów sceny. Testy liczone w NumPy dla wielu obiektów naraz - do GL
+# trafiają tylko obiekty, które mogą być widoczne.
+import numpy as np
+
+# Najwięcej kopii w liściu BVH - liście testujemy już kopia po kopii
+W_LISCIU = 64
+
+
+def prostopadloscian(pozycje):
+    # Prostopadłościan otaczający (min, max) wierzchołków siatki
+    pozycje = np.asarray(pozycje, dtype=np.float32).reshape(-1, 3)
+    return pozycje.min(axis=0), pozycje.max(axis=0)
+
+
+def sfera_otaczajaca(pozycje):
+    # Sfera otaczająca (środek, promień): środek prostopadłościanu otaczającego,
+    # promień do najdalszego wierzchołka
+    pozycje = np.asarray(pozycje, dtype=np.float32).reshape(-1, 3)
+    najmniejsze, najwieksze = prostopadloscian(pozycje)
+    srodek = (najmniejsze + najwieksze) / 2
+    return srodek, float(np.linalg.norm(pozycje - srodek, axis=1).max())
+
+
+def plaszczyzny_widzenia(rzutowanie_widok):
+    # Sześć płaszczyzn bryły widzenia (a, b, c, d), normalne do środka bryły
+    # i znormalizowane: punkt p jest po wewnętrznej stronie, gdy a*x + b*y +
+    # c*z + d >= 0. Macierz w kolejności wierszy (jak macierze.py).
+    m = np.asarray(rzutowanie_widok, dtype=np.float64)
+    plaszczyzny = np.array([
+        m[3] + m[0], m[3] - m[0],   # lewa, prawa
+        m[3] + m[1], m[3] - m[1],   # dolna, górna
+        m[3] + m[2], m[3] - m[2],   # bliska, daleka
+    ])
+    return plaszczyzny / np.linalg.norm(plaszczyzny[:, :3], axis=1, keepdims=True)
+
+
+def widoczne_sfery(plaszczyzny, srodki, promienie):
+    # Maska sfer (n,) przecinających bryłę widzenia lub leżących w niej
+    odleglosci = np.asarray(srodki) @ plaszczyzny[:, :3].T + plaszczyzny[:, 3]
+    return (odleglosci >= -np.asarray(promienie)[:, None]).all(axis=1)
+
+
+def sfery_kopii(macierze, srodek, promien):
+    # Sfery otaczające kopii siatki o sferze (srodek, promien), przesuniętych
+    # macierzami modelu (n, 4, 4). Promień rośnie o największą skalę macierzy.
+    macierze = np.asarray(macierze, dtype=np.float32)
+    srodki = macierze[:, :3, :3] @ np.asarray(srodek, dtype=np.float32) + macierze[:, :3, 3]
+    skale = np.linalg.norm(macierze[:, :3, :3], axis=1).max(axis=1)
+    return srodki, promien * skale
+
+
+def _zakresy(poczatki, konce):
+    # Połączone zakresy [poczatki[i], konce[i]) jako jedna tablica - bez pętli
+    dlugosci = konce - poczatki
+    if dlugosci.sum() == 0:
+        return np.zeros(0, dtype=np.int64)
+    przesuniecia = np.repeat(poczatki - np.cumsum(dlugosci) + dlugosci, dlugosci)
+    return przesuniecia + np.arange(dlugosci.sum())
+
+
+class BVH:
+    # Drzewo prostopadłościanów otaczających nad sferami kopii obiektów.
+    # Kopie są przestawione tak, żeby każdy węzeł obejmował ciągły zakres
+    # [poczatek, koniec); węzły trzymamy w tablicach NumPy. zapytanie()
+    # przechodzi drzewo poziomami: węzły całe w bryle widzenia dają od razu
+    # cały zakres, całe poza nią - nic, a tylko przecięte schodzą niżej.
+
+    def __init__(self, srodki, promienie, w_lisciu=W_LISCIU):
+        srodki = np.asarray(srodki, dtype=np.float32)
+        promienie = np.asarray(promienie, dtype=np.float32)
+        self.kolejnosc = np.arange(len(srodki))
+
+        najmniejsze, najwieksze, poczatki, konce, dzieci = [], [], [], [], []
+
+        def buduj(poczatek, koniec):
+            numer = len(poczatki)
+            wybrane = self.kolejnosc[poczatek:koniec]
+            najmniejsze.append((srodki[wybrane] - promienie[wybrane, None]).min(axis=0))
+            najwieksze.append((srodki[wybrane] + promienie[wybrane, None]).max(axis=0))
+            poczatki.append(poczatek)
+            konce.append(koniec)
+            dzieci.append(-1)
+            if koniec - poczatek > w_lisciu:
+                # Podział w medianie wzdłuż najdłuższej osi środków
+                os_ = int(np.argmax(np.ptp(srodki[wybrane], axis=0)))
+                polowa = (koniec - poczatek) // 2
+                podzial = np.argpartition(srodki[wybrane, os_], polowa)
+                self.kolejnosc[poczatek:koniec] = wybrane[podzial]
+                # Dzieci: lewe zaraz po rodzicu, prawe - numer zapisany w rodzicu
+                buduj(poczatek, poczatek + polowa)
+                dzieci[numer] = buduj(poczatek + polowa, koniec)
+            return numer
+
+        if len(srodki):
+            buduj(0, len(srodki))
+        self.najmniejsze = np.array(najmniejsze, dtype=np.float32).reshape(-1, 3)
+        self.najwieksze = np.array(najwieksze, dtype=np.float32).reshape(-1, 3)
+        self.poczatki = np.array(poczatki, dtype=np.int64)
+        self.konce = np.array(konce, dtype=np.int64)
+        self.prawe = np.array(dzieci, dtype=np.int64)
+        self.srodki = srodki[self.kolejnosc]
+        self.promienie = promienie[self.kolejnosc]
+        self.odwiedzone = 0  # węzły sprawdzone w ostatnim zapytaniu
+
+    def __len__(self):
+        return len(self.kolejnosc)
+
+    def zapytanie(self, plaszczyzny):
+        # Numery (w pierwotnej kolejności, rosnąco) kopii, których sfery
+        # przecinają bryłę widzenia
+        if len(self.kolejnosc) == 0:
+            return np.zeros(0, dtype=np.int64)
+        normalne = plaszczyzny[:, :3]
+        wynik = []
+        wezly = np.zeros(1, dtype=np.int64)
+        self.odwiedzone = 0
+        while len(wezly):
+            self.odwiedzone += len(wezly)
+            srodki = (self.najmniejsze[wezly] + self.najwieksze[wezly]) / 2
+            polowy = (self.najwieksze[wezly] - self.najmniejsze[wezly]) / 2
+            odleglosci = srodki @ normalne.T + plaszczyzny[:, 3]
+            zasiegi = polowy @ np.abs(normalne).T
+            poza = (odleglosci < -zasiegi).any(axis=1)
+            w_srodku = (odleglosci >= zasiegi).all(axis=1)
+
+            cale = wezly[w_srodku]
+            wynik.append(_zakresy(self.poczatki[cale], self.konce[cale]))
+
+            przeciete = wezly[~poza & ~w_srodku]
+            liscie = przeciete[self.prawe[przeciete] < 0]
+            kopie = _zakresy(self.poczatki[liscie], self.konce[liscie])
+            if len(kopie):
+                wynik.append(kopie[widoczne_sfery(plaszczyzny, self.srodki[kopie], self.promienie[kopie])])
+
+            wewnetrzne = przeciete[self.prawe[przeciete] >= 0]
+            wezly = np.concatenate([wewnetrzne + 1, self.prawe[wewnetrzne]])
+
+        return np.sort(self.kolejnosc[np.concatenate(wynik)])
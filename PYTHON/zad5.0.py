@@ -1,266 +1,233 @@
 #!/usr/bin/env python3
 import sys
-import math
 import numpy as np
-from PIL import Image
 
 from glfw.GLFW import *
 from OpenGL.GL import *
-from OpenGL.GLU import *
 
-N = 50
-viewer = [0.0, 0.0, 15.0]  # Kamera oddalona na osi Z
+from jajko import zbuduj_jajko, oczysc_siatke
+from bufory import SiatkaVBO
+from lod import zbuduj_jajko_lod
+from oswietlenie import ustaw_oswietlenie, ustaw_uniformy_oswietlenia
+from shadery import program_phong, wyczysc_pamiec
+from silnik import Scena, uruchom
+
+# Tekstury wczytywane dopiero przy pierwszym użyciu; w GL trzymamy
+# najwyżej LIMIT_TEKSTUR naraz (najdawniej używane są usuwane)
+LIMIT_TEKSTUR = 3
+
+
+class Zadanie50(Scena):
+    tytul = "Lab 5.0 - Jajko Tekstura"
+    rozmiar_okna = (600, 600)
+
+    def __init__(self):
+        super().__init__()
+        self.N = 50
+        self.viewer = [0.0, 0.0, 15.0]  # Kamera oddalona na osi Z
+
+        # Dane jajka - wylicza je oblicz_punkty_jajka
+        self.VERTICES = None
+        self.UV_COORDS = None  # Współrzędne tekstury
+        self.SIATKA = None  # Siatka indeksowana (wspólne wierzchołki + indeksy trójkątów)
+
+        # Bufory na karcie z siatką jajka; [B] przełącza na stary tryb natychmiastowy
+        self.siatka_vbo = None
+        self.UZYJ_VBO = True
+
+        # Poziomy szczegółowości (lod.py): gęstość siatki dobierana co klatkę do
+        # wielkości jajka na ekranie. --lod albo [L] włącza, kółko myszy przybliża.
+        self.jajko_lod = None
+        self.UZYJ_LOD = "--lod" in sys.argv
+        self.wysokosc_okna = 400
+
+        # Oświetlenie z lab6 (normalne jajka liczone raz, przy budowie siatki);
+        # --swiatlo albo [O] włącza
+        self.UZYJ_SWIATLA = "--swiatlo" in sys.argv
+
+        # Shader GLSL (shadery.py) zamiast potoku stałego: oświetlenie na fragment,
+        # MVP z kamery (kamera.py). --shader albo [H] włącza.
+        self.UZYJ_SHADERA = "--shader" in sys.argv
+        self.program = None
+
+    def oblicz_punkty_jajka(self):
+        # Wylicza wierzchołki jajka, współrzędne tekstury i indeksy trójkątów
+        # (wektorowo, patrz jajko.py). Parametry u i v (zakres 0-1) są mapowane
+        # bezpośrednio na współrzędne tekstury, więc jedna cała tekstura pokrywa
+        # cały obiekt. VERTICES i UV_COORDS to widoki N x N na dane siatki.
+        N = self.N
+        siatka = zbuduj_jajko(N)
+        self.VERTICES = siatka.pozycje.reshape(N, N, 3)
+        self.UV_COORDS = siatka.uv.reshape(N, N, 2)
+
+        # Rzędy na biegunach jajka zbiegają się w jeden punkt - trójkąty o zerowym
+        # polu wyrzucamy
+        self.SIATKA, raport = oczysc_siatke(siatka)
+        print(f"Siatka N={N}: usunięto {raport['zdegenerowane']} zdegenerowanych "
+              f"trójkątów z {raport['trojkaty'][0]}")
+
+    def zbuduj_bufory(self):
+        # Wysyła siatkę jajka do buforów na karcie (raz, a nie co klatkę)
+        if self.siatka_vbo is not None:
+            self.siatka_vbo.usun()
+        self.siatka_vbo = SiatkaVBO(self.SIATKA)
+        # Jajko poza bryłą widzenia nie trafia do GL (Scena.widoczna)
+        self.sfera = self.siatka_vbo.sfera
+
+    def zbuduj_lod(self):
+        # Gęsta siatka i bufory indeksów wszystkich poziomów - budowane raz
+        if self.jajko_lod is None:
+            self.jajko_lod = zbuduj_jajko_lod()
+
+    def startup(self):
+        super().startup()
+
+        glCullFace(GL_FRONT)
+
+        # Przy glCullFace(GL_FRONT) widać tylne ściany jajka, a normalne
+        # wskazują na zewnątrz - stąd oświetlenie dwustronne
+        ustaw_oswietlenie(dwustronne=True)
+        if not self.UZYJ_SWIATLA:
+            glDisable(GL_LIGHTING)
+
+        pliki_tekstur = [
+            "tekstury/P1_t.tga",
+            "tekstury/P2_t.tga",
+            "tekstury/M1_t.tga",
+            "tekstury/D9_t.tga",
+            "tekstury/N1_t.tga"
+        ]
+        self.wczytaj_tekstury(pliki_tekstur, LIMIT_TEKSTUR, powtarzanie=True)
+        print("Sterowanie: Myszka (LPM) - obrót, kółko - przybliżenie. Klawisz [T] - zmiana tekstury, [L] - LOD, [O] - światło, [H] - shader.")
+
+        self.oblicz_punkty_jajka()
+        self.zbuduj_bufory()
+        if self.UZYJ_LOD:
+            self.zbuduj_lod()
+
+    def podepnij_teksture(self, indeks):
+        # Pliku, którego nie da się wczytać, nie ma już w cyklu [T] - zamiast
+        # niego podpinamy następny; bez żadnej tekstury jajko jest czarne
+        while len(self.tekstury):
+            indeks %= len(self.tekstury)
+            try:
+                self.tekstury.podepnij(indeks)
+                self.current_texture_index = indeks
+                return
+            except IOError:
+                print(f"Błąd: Nie można otworzyć pliku {self.tekstury.pliki[indeks]}. Pomijam.")
+                self.tekstury.usun_plik(indeks)
 
-# Zmienne do obracania myszką
-theta = 0.0
-phi = 0.0
-pix2angle = 1.0
-left_mouse_button_pressed = 0
-mouse_x_pos_old = 0
-mouse_y_pos_old = 0
-delta_x = 0
-delta_y = 0
-
-# Tablice na dane jajka
-VERTICES = np.zeros((N, N, 3))
-UV_COORDS = np.zeros((N, N, 2))  # Tablica na współrzędne tekstury
-
-# Tekstury
-texture_ids = []
-current_texture_index = 0
-
-
-def load_texture(filename):
-    try:
-        image = Image.open(filename)
-    except IOError:
-        print(f"Błąd: Nie można otworzyć pliku {filename}. Pomijam.")
-        return None
-
-    img_data = image.convert("RGB").tobytes("raw", "RGB", 0, -1)
-
-    texture_id = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, texture_id)
-
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-
-    glTexImage2D(GL_TEXTURE_2D, 0, 3, image.width, image.height, 0,
-                 GL_RGB, GL_UNSIGNED_BYTE, img_data)
-
-    return texture_id
-
-
-def oblicz_punkty_jajka():
-    # Wylicza wierzchołki jajka i współrzędne tekstury
-    u_vals = np.linspace(0.0, 1.0, N)
-    v_vals = np.linspace(0.0, 1.0, N)
-    pi = math.pi
-
-    for i in range(N):
-        for j in range(N):
-            u = u_vals[i]
-            v = v_vals[j]
-
-            u2 = u * u
-            u3 = u2 * u
-            u4 = u3 * u
-            u5 = u4 * u
-
-            poly_u = (-90 * u5 + 225 * u4 - 270 * u3 + 180 * u2 - 45 * u)
-
-            x = poly_u * math.cos(pi * v)
-            z = poly_u * math.sin(pi * v)
-            y = 160 * u4 - 320 * u3 + 160 * u2 - 5.0  # -5 wyśrodkowuje jajko w pionie
-
-            VERTICES[i][j] = [x, y, z]
-
-            # Mapujemy wartości parametrów u i v (zakres 0-1) bezpośrednio na
-            # współrzędne tekstury. Dzięki temu jedna cała tekstura pokrywa
-            # cały obiekt, bez powielania jej na każdym kwadracie siatki.
-            UV_COORDS[i][j] = [u, v]
-
-
-def startup():
-    update_viewport(None, 400, 400)
-    glClearColor(0.0, 0.0, 0.0, 1.0)
-    glEnable(GL_DEPTH_TEST)
-    glEnable(GL_TEXTURE_2D)
-
-    glEnable(GL_CULL_FACE) # włączony
-    glCullFace(GL_FRONT)
-
-    global texture_ids
-
-    pliki_tekstur = [
-        "tekstury/P1_t.tga",
-        "tekstury/P2_t.tga",
-        "tekstury/M1_t.tga",
-        "tekstury/D9_t.tga",
-        "tekstury/N1_t.tga"
-    ]
-
-    print("Ładowanie tekstur...")
-    for plik in pliki_tekstur:
-        tid = load_texture(plik)
-        if tid is not None:
-            texture_ids.append(tid)
-
-    if texture_ids:
-        glBindTexture(GL_TEXTURE_2D, texture_ids[0])
-        print(f"Załadowano {len(texture_ids)} tekstur.")
-        print("Sterowanie: Myszka (LPM) - obrót. Klawisz [T] - zmiana tekstury.")
-    else:
         print("UWAGA: Nie znaleziono tekstur! Jajko będzie czarne.")
-        texture_ids.append(0)
-
-    oblicz_punkty_jajka()
-
-
-def shutdown():
-    pass
-
-
-def render(time):
-    global theta, phi
-
-    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-    glLoadIdentity()
-
-    # Ustawienie kamery
-    gluLookAt(viewer[0], viewer[1], viewer[2],
-              0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
-
-    # Obsługa obrotu myszką
-    if left_mouse_button_pressed:
-        theta += delta_x * pix2angle
-        phi += delta_y * pix2angle
-
-    glRotatef(theta, 0.0, 1.0, 0.0)  # Obrót wokół osi Y
-    glRotatef(phi, 1.0, 0.0, 0.0)  # Obrót wokół osi X
-
-    # Rysowanie jajka
-    glBegin(GL_TRIANGLES)
-    for i in range(N - 1):
-        for j in range(N - 1):
-            # Pobieramy współrzędne wierzchołków i tekstur
-            # Wierzchołki
-            p1 = VERTICES[i][j]
-            p2 = VERTICES[i + 1][j]
-            p3 = VERTICES[i][j + 1]
-            p4 = VERTICES[i + 1][j + 1]
-
-            # Tekstury
-            t1 = UV_COORDS[i][j]
-            t2 = UV_COORDS[i + 1][j]
-            t3 = UV_COORDS[i][j + 1]
-            t4 = UV_COORDS[i + 1][j + 1]
-
-            if i < N / 2:
-                # POŁOWA 1: Normalna kolejność (CCW/CW zależnie od ustawień)
-                # Trójkąt 1
-                glTexCoord2fv(t1);
-                glVertex3fv(p1)
-                glTexCoord2fv(t2);
-                glVertex3fv(p2)
-                glTexCoord2fv(t3);
-                glVertex3fv(p3)
-                # Trójkąt 2
-                glTexCoord2fv(t2);
-                glVertex3fv(p2)
-                glTexCoord2fv(t4);
-                glVertex3fv(p4)
-                glTexCoord2fv(t3);
-                glVertex3fv(p3)
-            else:
-                # POŁOWA 2: Odwrócona kolejność
-                # Zamieniamy wierzchołki 2 i 3 miejscami, aby "odwrócić" trójkąt
-                # Trójkąt 1
-                glTexCoord2fv(t1);
-                glVertex3fv(p1)
-                glTexCoord2fv(t3);
-                glVertex3fv(p3)  # Zamiana z p2
-                glTexCoord2fv(t2);
-                glVertex3fv(p2)  # Zamiana z p3
-                # Trójkąt 2
-                glTexCoord2fv(t2);
-                glVertex3fv(p2)
-                glTexCoord2fv(t3);
-                glVertex3fv(p3)  # Zamiana z p4
-                glTexCoord2fv(t4);
-                glVertex3fv(p4)  # Zamiana z p3
-
-    glEnd()
-    glFlush()
-
-
-def update_viewport(window, width, height):
-    global pix2angle
-    if width == 0: width = 1
-    if height == 0: height = 1
-    pix2angle = 360.0 / width
-
-    glMatrixMode(GL_PROJECTION)
-    glLoadIdentity()
-    gluPerspective(70, width / height, 0.1, 300.0)
-    glViewport(0, 0, width, height)
-    glMatrixMode(GL_MODELVIEW)
-    glLoadIdentity()
-
-
-def keyboard_key_callback(window, key, scancode, action, mods):
-    global current_texture_index
-    if action == GLFW_PRESS:
-        if key == GLFW_KEY_ESCAPE:
-            glfwSetWindowShouldClose(window, GLFW_TRUE)
-
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+    def shutdown(self):
+        super().shutdown()
+        wyczysc_pamiec()
+        self.program = None
+        if self.siatka_vbo is not None:
+            self.siatka_vbo.usun()
+            self.siatka_vbo = None
+        if self.jajko_lod is not None:
+            self.jajko_lod.usun()
+            self.jajko_lod = None
+
+    def ustaw_kamere(self):
+        # Ustawienie kamery i obrotów - macierze przeliczane tylko po zmianie
+        # viewer / theta / phi (kamera.py)
+        self.kamera.ustaw(self.viewer, self.theta, self.phi)
+        if self.UZYJ_SHADERA:
+            self.uzyj_shadera()
+            self.kamera.zaladuj_do(self.program)
+        else:
+            glUseProgram(0)
+            self.kamera.zaladuj()
+
+    def rysuj(self):
+        # Rysowanie jajka
+        if self.UZYJ_VBO and self.UZYJ_LOD:
+            odleglosc = float(np.linalg.norm(self.viewer))
+            self.jajko_lod.wybierz(odleglosc, self.wysokosc_okna)
+            self.jajko_lod.rysuj()
+        elif self.UZYJ_VBO:
+            self.siatka_vbo.rysuj()
+        else:
+            self.rysuj_jajko_natychmiastowo()
+
+    def uzyj_shadera(self):
+        # Program kompilowany przy pierwszym użyciu; oświetlenie jak w potoku
+        # stałym (dwustronne, bo widać tylne ściany jajka)
+        if self.program is None:
+            self.program = program_phong()
+            ustaw_uniformy_oswietlenia(self.program, dwustronne=True)
+        self.program.uzyj()
+        self.program.ustaw("u_oswietlenie", self.UZYJ_SWIATLA)
+
+    def rysuj_jajko_natychmiastowo(self):
+        # Stara ścieżka: każdy wierzchołek osobnym wywołaniem glVertex3fv.
+        # Kolejność wierzchołków (także odwrócona w drugiej połowie jajka) jest
+        # już zapisana w indeksach siatki, więc w pętli nie ma żadnych warunków.
+        pozycje = self.SIATKA.pozycje
+        uv = self.SIATKA.uv
+        normalne = self.SIATKA.normalne
+
+        glBegin(GL_TRIANGLES)
+        if self.UZYJ_SWIATLA:
+            for k in self.SIATKA.indeksy:
+                glNormal3fv(normalne[k])
+                glTexCoord2fv(uv[k])
+                glVertex3fv(pozycje[k])
+        else:
+            for k in self.SIATKA.indeksy:
+                glTexCoord2fv(uv[k])
+                glVertex3fv(pozycje[k])
+        glEnd()
+
+    def ustaw_obszar(self, width, height):
+        # Viewport na całe okno i rzutowanie z jego proporcjami; wysokość
+        # okna potrzebna do wyboru poziomu szczegółowości
+        self.wysokosc_okna = height
+        self.kamera.ustaw_rzutowanie(aspekt=width / height)
+        glViewport(0, 0, width, height)
+
+    def klawisz(self, key):
         # Przełączanie tekstur [T] (Zadanie 4.5)
-        if key == GLFW_KEY_T and texture_ids:
-            current_texture_index = (current_texture_index + 1) % len(texture_ids)
-            glBindTexture(GL_TEXTURE_2D, texture_ids[current_texture_index])
-            print(f"Zmieniono teksturę na indeks: {current_texture_index}")
-
-
-def mouse_motion_callback(window, x_pos, y_pos):
-    global delta_x, mouse_x_pos_old, delta_y, mouse_y_pos_old
-    delta_x = x_pos - mouse_x_pos_old
-    mouse_x_pos_old = x_pos
-    delta_y = y_pos - mouse_y_pos_old
-    mouse_y_pos_old = y_pos
-
-
-def mouse_button_callback(window, button, action, mods):
-    global left_mouse_button_pressed
-    if button == GLFW_MOUSE_BUTTON_LEFT and action == GLFW_PRESS:
-        left_mouse_button_pressed = 1
-    else:
-        left_mouse_button_pressed = 0
-
-
-def main():
-    if not glfwInit(): sys.exit(-1)
-    window = glfwCreateWindow(600, 600, "Lab 5.0 - Jajko Tekstura", None, None)
-    if not window: glfwTerminate(); sys.exit(-1)
+        if key == GLFW_KEY_T and len(self.tekstury):
+            self.nastepna_tekstura()
+
+        # Przełączanie ścieżki rysowania [B]: bufory (VBO) / tryb natychmiastowy
+        if key == GLFW_KEY_B:
+            self.UZYJ_VBO = not self.UZYJ_VBO
+            print(f"Rysowanie z buforów (VBO): {self.UZYJ_VBO}")
+
+        # Poziomy szczegółowości [L]
+        if key == GLFW_KEY_L:
+            self.UZYJ_LOD = not self.UZYJ_LOD
+            if self.UZYJ_LOD:
+                self.zbuduj_lod()
+            print(f"Poziomy szczegółowości (LOD): {self.UZYJ_LOD}")
+
+        # Oświetlenie [O]
+        if key == GLFW_KEY_O:
+            self.UZYJ_SWIATLA = not self.UZYJ_SWIATLA
+            if self.UZYJ_SWIATLA:
+                glEnable(GL_LIGHTING)
+            else:
+                glDisable(GL_LIGHTING)
+            print(f"Oświetlenie: {self.UZYJ_SWIATLA}")
 
-    glfwMakeContextCurrent(window)
-    glfwSetFramebufferSizeCallback(window, update_viewport)
-    glfwSetKeyCallback(window, keyboard_key_callback)
-    glfwSetCursorPosCallback(window, mouse_motion_callback)
-    glfwSetMouseButtonCallback(window, mouse_button_callback)
-    glfwSwapInterval(1)
+        # Shader GLSL / potok stały [H]
+        if key == GLFW_KEY_H:
+            self.UZYJ_SHADERA = not self.UZYJ_SHADERA
+            print(f"Shader GLSL: {self.UZYJ_SHADERA}")
 
-    startup()
+    def przewin(self, y_offset):
+        # Kółko myszy przybliża / oddala kamerę (w zakresie rzutowania 0.1-300)
+        self.viewer[2] = min(max(self.viewer[2] * 0.9 ** y_offset, 6.0), 250.0)
 
-    while not glfwWindowShouldClose(window):
-        render(glfwGetTime())
-        glfwSwapBuffers(window)
-        glfwPollEvents()
 
-    shutdown()
-    glfwTerminate()
+scena = Zadanie50()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    uruchom(scena)